@@ -0,0 +1,43 @@
+"""
+Inference Mining Package
+
+소스 트리(src/)는 하이픈 파일명(예: anomaly-detection/statistical-detector.py)을 사용하므로
+그대로는 `inference_mining.*`로 임포트할 수 없습니다. 이 패키지는 src/를 패키지 경로로 사용하고,
+밑줄 모듈 이름을 같은 디렉터리 또는 하이픈 형제 디렉터리의 하이픈 파일로 찾는 임포트 파인더를
+설치합니다. nexus/inference-mining 디렉터리(또는 PYTHONPATH에 추가한 경우 어디서나)에서:
+
+    python -m inference_mining.cli signals.ndjson.gz -o issues.ndjson
+"""
+
+import importlib.util
+import os
+import sys
+
+_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+__path__ = [_SRC]
+
+
+class _HyphenatedSourceFinder:
+    """inference_mining.x.y_z → <x 또는 x의 하이픈 디렉터리>/y-z.py"""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not fullname.startswith(__name__ + ".") or not path:
+            return None
+        name = fullname.rpartition(".")[2]
+        for directory in path:
+            sibling = os.path.join(os.path.dirname(directory), os.path.basename(directory).replace("_", "-"))
+            for base in (directory, sibling):
+                for filename in (name + ".py", name.replace("_", "-") + ".py"):
+                    candidate = os.path.join(base, filename)
+                    if os.path.isfile(candidate):
+                        return importlib.util.spec_from_file_location(fullname, candidate)
+        return None
+
+
+if not any(isinstance(finder, _HyphenatedSourceFinder) for finder in sys.meta_path):
+    sys.meta_path.append(_HyphenatedSourceFinder())
+
+from .inference_mining import InferenceMining, inference_mining
+
+__all__ = ['InferenceMining', 'inference_mining']
@@ -0,0 +1,346 @@
+"""
+Cross-Metric Correlation Engine
+
+슬라이딩 윈도우 위에서 메트릭 간 상관관계를 증분 유지합니다.
+메트릭별 합과 관측 수는 배치 단위로 갱신되고, 상관계수는 요청 시 표준화된 윈도우
+행렬과의 행렬-벡터 곱(O(window x metrics))으로 계산하므로 수천 개 메트릭에서도
+전체 상관 행렬을 저장하지 않습니다. 전체 top-k가 필요하면 열 블록 단위로 계산합니다.
+
+엔진은 입력 순서를 틱 순서로 사용하므로, 시간 순으로 정렬된 수집 경로에서 공급해야 합니다.
+한 번의 이슈 추출처럼 독립된 신호 묶음에는 윈도우 상태 없이 타임스탬프로 정렬해 맞춘 행으로
+계산하는 batch_top_correlated()를 사용합니다.
+윈도우 행렬은 정밀도 모드의 dtype으로 저장하고, 합계와 표준화는 float64로 계산합니다.
+"""
+
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
+
+from ..precision.precision_mode import storage_dtype
+
+
+class CorrelationEngine:
+    """슬라이딩 윈도우 다중 메트릭 상관 엔진"""
+
+    def __init__(self, window_size: int = 256, top_k: int = 5, min_periods: int = 10,
+                 block_size: int = 1024, initial_capacity: int = 64, precision: str = "float64"):
+        """
+        Args:
+            window_size: 상관관계를 계산할 최근 틱 수
+            top_k: 기본으로 반환할 상관 메트릭 수
+            min_periods: 상관관계 계산에 필요한 메트릭별 최소 관측 수
+            block_size: 전체 top-k 계산 시 한 번에 처리할 열 블록 크기
+            initial_capacity: 초기 메트릭 슬롯 수 (부족하면 두 배씩 확장)
+            precision: 윈도우 행렬 저장 정밀도 ("float64" 또는 "float32", 합계는 float64로 누적)
+        """
+        self.window_size = window_size
+        self.top_k = top_k
+        self.min_periods = min_periods
+        self.block_size = block_size
+        self.precision = precision
+        self.dtype = storage_dtype(precision)
+
+        self._index: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._data = np.full((window_size, initial_capacity), np.nan, dtype=self.dtype)
+        self._last = np.full(initial_capacity, np.nan)
+        self._sum = np.zeros(initial_capacity)
+        self._count = np.zeros(initial_capacity, dtype=np.int64)
+        self._ticks = 0
+
+    @property
+    def nbytes(self) -> int:
+        """윈도우 행렬과 메트릭별 상태 배열의 바이트 수"""
+        return self._data.nbytes + self._last.nbytes + self._sum.nbytes + self._count.nbytes
+
+    @property
+    def metric_keys(self) -> List[str]:
+        return list(self._names)
+
+    def _ensure_metric(self, metric_key: str) -> int:
+        column = self._index.get(metric_key)
+        if column is not None:
+            return column
+
+        column = len(self._names)
+        capacity = self._data.shape[1]
+        if column >= capacity:
+            grow = capacity
+            self._data = np.hstack([self._data, np.full((self.window_size, grow), np.nan, dtype=self.dtype)])
+            self._last = np.concatenate([self._last, np.full(grow, np.nan)])
+            self._sum = np.concatenate([self._sum, np.zeros(grow)])
+            self._count = np.concatenate([self._count, np.zeros(grow, dtype=np.int64)])
+
+        self._index[metric_key] = column
+        self._names.append(metric_key)
+        return column
+
+    def update(self, values: Dict[str, float]):
+        """
+        한 틱의 메트릭 값을 추가합니다.
+
+        Args:
+            values: 메트릭 키 → 값
+        """
+        self.update_batch([values])
+
+    def update_batch(self, rows: List[Dict[str, float]]):
+        """
+        여러 틱을 한 번에 추가합니다.
+
+        행 하나가 틱 하나이며, 행의 순서를 시간 순서로 간주합니다 (타임스탬프로 정렬하거나
+        정렬하지 않으므로 호출자가 시간 순으로 정렬된 배치를 전달해야 합니다).
+        틱에 없는 메트릭은 직전 값을 이어 씁니다 (아직 관측되지 않은 메트릭은 결측).
+        윈도우보다 앞선 행은 메트릭별 마지막 값만 추적하고, 마지막 window_size개 행만
+        행렬로 만듭니다.
+
+        Args:
+            rows: 틱별 메트릭 값 딕셔너리 리스트 (시간 순)
+        """
+        if not rows:
+            return
+
+        head, tail = rows[:-self.window_size], rows[-self.window_size:]
+        carried: Dict[str, float] = {}
+        for row in head:
+            carried.update(row)
+        for key, value in carried.items():
+            column = self._ensure_metric(key)  # 확장이 일어날 수 있으므로 _last 참조 전에 호출
+            self._last[column] = value
+
+        row_index, columns, values = [], [], []
+        for i, row in enumerate(tail):
+            for key, value in row.items():
+                row_index.append(i)
+                columns.append(self._ensure_metric(key))
+                values.append(value)
+
+        full = np.full((len(tail), len(self._names)), np.nan)
+        full[row_index, columns] = values
+        self._push(self._forward_fill(full))
+
+    def update_matrix(self, matrix: np.ndarray, metric_keys: List[str]):
+        """
+        (틱 x 메트릭) 배열을 그대로 추가합니다. NaN은 직전 값으로 채웁니다.
+
+        Args:
+            matrix: 틱별 값 배열 (shape: [ticks, len(metric_keys)], 시간 순)
+            metric_keys: 열에 대응하는 메트릭 키
+        """
+        columns = np.array([self._ensure_metric(key) for key in metric_keys], dtype=np.int64)
+        full = np.full((len(matrix), len(self._names)), np.nan)
+        full[:, columns] = matrix
+        self._push(self._forward_fill(full))
+
+    def _forward_fill(self, full: np.ndarray) -> np.ndarray:
+        """열별 forward-fill (첫 행은 직전 틱 값으로 시작)"""
+        n = full.shape[1]
+        full[0] = np.where(np.isnan(full[0]), self._last[:n], full[0])
+        filled_index = np.where(np.isnan(full), 0, np.arange(len(full))[:, None])
+        np.maximum.accumulate(filled_index, axis=0, out=filled_index)
+        return full[filled_index, np.arange(n)]
+
+    def _push(self, matrix: np.ndarray):
+        """완성된 틱 행렬을 링 윈도우에 기록하고 합계를 증분 갱신합니다."""
+        n = matrix.shape[1]
+        if len(matrix) > self.window_size:
+            matrix = matrix[-self.window_size:]
+
+        # 합계는 저장된(반올림된) 값으로 갱신해야 제거할 때 같은 값이 빠짐
+        matrix = matrix.astype(self.dtype, copy=False)
+        slots = (self._ticks + np.arange(len(matrix))) % self.window_size
+        evicted = self._data[slots, :n]
+        evicted_valid = ~np.isnan(evicted)
+        added_valid = ~np.isnan(matrix)
+
+        self._sum[:n] += (np.where(added_valid, matrix, 0.0).sum(axis=0, dtype=np.float64)
+                          - np.where(evicted_valid, evicted, 0.0).sum(axis=0, dtype=np.float64))
+        self._count[:n] += added_valid.sum(axis=0) - evicted_valid.sum(axis=0)
+
+        self._data[slots, :n] = matrix
+        self._last[:n] = matrix[-1]
+        self._ticks += len(matrix)
+
+    def _standardized(self) -> Tuple[np.ndarray, np.ndarray]:
+        """표준화된 윈도우 행렬(결측은 0)과 계산 가능한 열 마스크를 반환합니다."""
+        n = len(self._names)
+        rows = min(self._ticks, self.window_size)
+        data = self._data[:rows, :n]
+        count = np.maximum(self._count[:n], 1)
+
+        # 분산은 제곱합 차이 대신 중심화된 값으로 계산 (큰 값의 메트릭에서 상쇄 오차 방지,
+        # float64 평균을 빼므로 중심화 이후는 float64)
+        mean = self._sum[:n] / count
+        centered = np.where(np.isnan(data), 0.0, data - mean)
+        std = np.sqrt((centered ** 2).sum(axis=0) / count)
+        usable = (self._count[:n] >= self.min_periods) & (std > 1e-12 * np.maximum(np.abs(mean), 1.0))
+
+        z = np.where(usable, centered / np.where(usable, std, 1.0), 0.0)
+        return z, usable
+
+    def top_correlated(self, metric_key: str, k: Optional[int] = None,
+                       min_abs_correlation: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        지정한 메트릭과 상관관계가 가장 큰 메트릭들을 반환합니다.
+
+        Args:
+            metric_key: 기준 메트릭 키
+            k: 반환할 최대 메트릭 수 (None이면 top_k)
+            min_abs_correlation: 포함할 최소 |상관계수|
+
+        Returns:
+            [{"metricKey", "correlation"}] (|상관계수| 내림차순)
+        """
+        return self.top_correlated_many([metric_key], k, min_abs_correlation).get(metric_key, [])
+
+    def top_correlated_many(self, metric_keys: List[str], k: Optional[int] = None,
+                            min_abs_correlation: float = 0.0) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 기준 메트릭의 top-k 상관 메트릭을 한 번의 행렬 곱으로 계산합니다.
+
+        Args:
+            metric_keys: 기준 메트릭 키 리스트
+            k: 메트릭별 반환 수 (None이면 top_k)
+            min_abs_correlation: 포함할 최소 |상관계수|
+
+        Returns:
+            메트릭 키 → [{"metricKey", "correlation"}] (계산 불가능한 메트릭은 제외)
+        """
+        if self._ticks == 0:
+            return {}
+
+        z, usable = self._standardized()
+        keys = [key for key in metric_keys if key in self._index and usable[self._index[key]]]
+        if not keys:
+            return {}
+
+        columns = np.array([self._index[key] for key in keys])
+        correlations = (z[:, columns].T @ z) / z.shape[0]
+        correlations[np.arange(len(columns)), columns] = 0.0
+        correlations[:, ~usable] = 0.0
+        return {
+            key: self._select(row, k or self.top_k, min_abs_correlation)
+            for key, row in zip(keys, correlations)
+        }
+
+    def top_k_all(self, k: Optional[int] = None, min_abs_correlation: float = 0.0) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        모든 메트릭에 대해 top-k 상관 메트릭을 계산합니다 (희소 결과).
+
+        열 블록 단위로 Z_blockᵀ Z를 계산하므로 메모리 사용량은 block_size x metrics로 제한됩니다.
+
+        Args:
+            k: 메트릭별 반환 수 (None이면 top_k)
+            min_abs_correlation: 포함할 최소 |상관계수|
+
+        Returns:
+            메트릭 키 → [{"metricKey", "correlation"}]
+        """
+        if self._ticks == 0:
+            return {}
+
+        k = k or self.top_k
+        z, usable = self._standardized()
+        rows, n = z.shape
+
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        for start in range(0, n, self.block_size):
+            stop = min(start + self.block_size, n)
+            block = z[:, start:stop].T @ z / rows
+            block[np.arange(stop - start), np.arange(start, stop)] = 0.0
+            block[:, ~usable] = 0.0
+            for offset, correlations in enumerate(block):
+                if usable[start + offset]:
+                    result[self._names[start + offset]] = self._select(correlations, k, min_abs_correlation)
+        return result
+
+    def _select(self, correlations: np.ndarray, k: int, min_abs_correlation: float) -> List[Dict[str, Any]]:
+        magnitude = np.abs(correlations)
+        k = min(k, len(magnitude))
+        if k == 0:
+            return []
+        candidates = np.argpartition(-magnitude, k - 1)[:k]
+        candidates = candidates[np.argsort(-magnitude[candidates])]
+        return [
+            {"metricKey": self._names[i], "correlation": float(np.clip(correlations[i], -1.0, 1.0))}
+            for i in candidates
+            if magnitude[i] > 0.0 and magnitude[i] >= min_abs_correlation
+        ]
+
+    def clear(self):
+        """윈도우와 메트릭 사전을 초기화합니다."""
+        capacity = self._data.shape[1]
+        self._index = {}
+        self._names = []
+        self._data = np.full((self.window_size, capacity), np.nan, dtype=self.dtype)
+        self._last = np.full(capacity, np.nan)
+        self._sum = np.zeros(capacity)
+        self._count = np.zeros(capacity, dtype=np.int64)
+        self._ticks = 0
+
+
+def batch_top_correlated(rows: List[Dict[str, float]], metric_keys: List[str], k: int = 5,
+                         min_periods: int = 10, min_abs_correlation: float = 0.0) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    한 신호 묶음 안에서 기준 메트릭들의 top-k 상관 메트릭을 계산합니다 (엔진 상태 없음).
+
+    행 하나는 타임스탬프 하나이며(같은 타임스탬프의 신호는 호출자가 합침), 비어 있는 칸은
+    채우지 않고 두 메트릭이 모두 관측된 행만으로 상관계수를 계산합니다. 상관계수는 행 순서와
+    무관하므로 정렬은 필요 없습니다.
+
+    Args:
+        rows: 타임스탬프별 {메트릭 키: 값} 리스트
+        metric_keys: 기준 메트릭 키 리스트
+        k: 메트릭별 반환 수
+        min_periods: 상관계수 계산에 필요한 최소 공통 관측 수
+        min_abs_correlation: 포함할 최소 |상관계수|
+
+    Returns:
+        메트릭 키 → [{"metricKey", "correlation"}] (|상관계수| 내림차순, 결과가 없는 메트릭은 제외)
+    """
+    names: List[str] = []
+    index: Dict[str, int] = {}
+    row_index, columns, values = [], [], []
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            column = index.get(key)
+            if column is None:
+                column = index[key] = len(names)
+                names.append(key)
+            row_index.append(i)
+            columns.append(column)
+            values.append(value)
+
+    if len(rows) < min_periods or len(names) < 2:
+        return {}
+    matrix = np.full((len(rows), len(names)), np.nan)
+    matrix[row_index, columns] = values
+    observed = ~np.isnan(matrix)
+
+    result: Dict[str, List[Dict[str, Any]]] = {}
+    for key in metric_keys:
+        column = index.get(key)
+        if column is None:
+            continue
+        base = matrix[:, column][:, None]
+        valid = observed & observed[:, column][:, None]
+        count = valid.sum(axis=0)
+        safe_count = np.maximum(count, 1)
+        # 쌍별 공통 관측으로 중심화 (큰 값의 메트릭에서 상쇄 오차 방지)
+        dx = np.where(valid, base - np.where(valid, base, 0.0).sum(axis=0) / safe_count, 0.0)
+        dy = np.where(valid, matrix - np.where(valid, matrix, 0.0).sum(axis=0) / safe_count, 0.0)
+        sxx = (dx * dx).sum(axis=0)
+        syy = (dy * dy).sum(axis=0)
+        usable = (count >= min_periods) & (sxx > 0) & (syy > 0)
+        usable[column] = False
+        correlations = np.where(usable, (dx * dy).sum(axis=0) / np.sqrt(np.where(usable, sxx * syy, 1.0)), 0.0)
+
+        magnitude = np.abs(correlations)
+        candidates = np.argsort(-magnitude, kind="stable")[:k]
+        selected = [
+            {"metricKey": names[i], "correlation": float(np.clip(correlations[i], -1.0, 1.0))}
+            for i in candidates
+            if usable[i] and magnitude[i] > 0.0 and magnitude[i] >= min_abs_correlation
+        ]
+        if selected:
+            result[key] = selected
+    return result
@@ -4,9 +4,14 @@ Statistical Anomaly Detector
 통계적 방법을 사용하여 이상치를 탐지합니다.
 """
 
+import time
 import numpy as np
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from statistics import NormalDist
+
+from ..caching.result_cache import ResultCache, make_key
+from ..precision.precision_mode import storage_dtype
 
 
 @dataclass
@@ -21,20 +26,47 @@ class AnomalyResult:
 class StatisticalDetector:
     """통계적 이상 탐지기"""
     
-    def __init__(self, threshold: float = 3.0):
+    def __init__(self, threshold: float = 3.0, cache: Optional[ResultCache] = None,
+                 precision: str = "float64"):
         """
         Args:
             threshold: Z-score 임계값 (기본값: 3.0, 약 99.7% 신뢰구간)
+            cache: 결과 캐시 (None이면 캐시 사용 안 함)
+            precision: 값 배열 저장 정밀도 ("float64" 또는 "float32", 평균/분산은 항상 float64로 누적)
         """
         self.threshold = threshold
+        self.cache = cache
+        self.precision = precision
+        self.dtype = storage_dtype(precision)
     
-    def detect_zscore(self, values: List[float], window_size: Optional[int] = None) -> AnomalyResult:
+    def effective_threshold(self, points: int) -> float:
+        """
+        마지막 points개 값 중 최대 |z|를 평가할 때의 임계값을 반환합니다.
+        
+        여러 점의 최대값은 정상 데이터에서도 커지므로, 단일 점 임계값의 양측 유의확률을
+        점 수로 나누어(Bonferroni) 윈도우당 오탐률을 단일 점 평가와 같게 유지합니다.
+        
+        Args:
+            points: 평가할 점 수
+        
+        Returns:
+            Z-score 임계값
+        """
+        if points <= 1:
+            return self.threshold
+        normal = NormalDist()
+        tail = 2 * (1 - normal.cdf(self.threshold))
+        return normal.inv_cdf(1 - tail / (2 * points))
+    
+    def detect_zscore(self, values: List[float], window_size: Optional[int] = None,
+                      score_last: int = 1) -> AnomalyResult:
         """
         Z-score 방법을 사용하여 이상치를 탐지합니다.
         
         Args:
             values: 탐지할 값들의 리스트
             window_size: 이동 평균 윈도우 크기 (None이면 전체 데이터 사용)
+            score_last: 평가할 마지막 값 개수 (|z|가 가장 큰 값을 보고, 임계값은 점 수에 맞게 보정)
         
         Returns:
             AnomalyResult: 이상 탐지 결과
@@ -47,16 +79,16 @@ class StatisticalDetector:
                 details={"reason": "Insufficient data"}
             )
         
-        values_array = np.array(values)
+        values_array = np.asarray(values, dtype=self.dtype)
         
         if window_size and len(values) > window_size:
             # 이동 평균 및 표준편차 계산
             recent_values = values_array[-window_size:]
-            mean = np.mean(recent_values)
-            std = np.std(recent_values)
+            mean = np.mean(recent_values, dtype=np.float64)
+            std = np.std(recent_values, dtype=np.float64)
         else:
-            mean = np.mean(values_array)
-            std = np.std(values_array)
+            mean = np.mean(values_array, dtype=np.float64)
+            std = np.std(values_array, dtype=np.float64)
         
         if std == 0:
             return AnomalyResult(
@@ -66,12 +98,15 @@ class StatisticalDetector:
                 details={"reason": "Zero standard deviation"}
             )
         
-        # 마지막 값의 Z-score 계산
-        last_value = values_array[-1]
-        z_score = abs((last_value - mean) / std)
+        # 마지막 score_last개 값의 Z-score 계산 (가장 크게 벗어난 값이 대표)
+        score_last = min(max(score_last, 1), len(values_array))
+        scored = np.abs(values_array[-score_last:].astype(np.float64) - mean) / std
+        position = int(np.argmax(scored))
+        z_score = scored[position]
+        threshold = self.effective_threshold(score_last)
         
-        is_anomaly = z_score > self.threshold
-        anomaly_score = min(z_score / self.threshold, 1.0)  # 0-1 범위로 정규화
+        is_anomaly = z_score > threshold
+        anomaly_score = min(z_score / threshold, 1.0)  # 0-1 범위로 정규화
         
         return AnomalyResult(
             is_anomaly=is_anomaly,
@@ -81,8 +116,10 @@ class StatisticalDetector:
                 "z_score": float(z_score),
                 "mean": float(mean),
                 "std": float(std),
-                "value": float(last_value),
-                "threshold": self.threshold
+                "value": float(values_array[len(values_array) - score_last + position]),
+                "index": len(values_array) - score_last + position,
+                "points_scored": score_last,
+                "threshold": threshold
             }
         )
     
@@ -104,9 +141,9 @@ class StatisticalDetector:
                 details={"reason": "Insufficient data for IQR"}
             )
         
-        values_array = np.array(values)
-        q1 = np.percentile(values_array, 25)
-        q3 = np.percentile(values_array, 75)
+        values_array = np.asarray(values, dtype=self.dtype)
+        q1 = np.float64(np.percentile(values_array, 25))
+        q3 = np.float64(np.percentile(values_array, 75))
         iqr = q3 - q1
         
         if iqr == 0:
@@ -120,7 +157,7 @@ class StatisticalDetector:
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
         
-        last_value = values_array[-1]
+        last_value = np.float64(values_array[-1])
         is_anomaly = last_value < lower_bound or last_value > upper_bound
         
         # 이상치 점수 계산
@@ -147,23 +184,34 @@ class StatisticalDetector:
             }
         )
     
-    def detect(self, values: List[float], method: str = "zscore") -> AnomalyResult:
+    def detect(self, values: List[float], method: str = "zscore", score_last: int = 1) -> AnomalyResult:
         """
         이상치를 탐지합니다.
         
         Args:
             values: 탐지할 값들의 리스트
             method: 탐지 방법 ("zscore" 또는 "iqr")
+            score_last: 평가할 마지막 값 개수 (zscore만 지원)
         
         Returns:
             AnomalyResult: 이상 탐지 결과
         """
         if method == "zscore":
-            return self.detect_zscore(values)
+            compute = lambda v: self.detect_zscore(v, score_last=score_last)
         elif method == "iqr":
-            return self.detect_iqr(values)
+            if score_last != 1:
+                raise ValueError("score_last is only supported by the zscore method")
+            compute = self.detect_iqr
         else:
             raise ValueError(f"Unknown method: {method}")
+        
+        if self.cache is None:
+            return compute(values)
+        
+        started = time.perf_counter()
+        key = make_key("anomaly", values, method=method, threshold=self.threshold, precision=self.precision,
+                       score_last=score_last)
+        return self.cache.get_or_compute(key, lambda: compute(values), key_seconds=time.perf_counter() - started)
 
 
 
@@ -3,8 +3,9 @@ Anomaly Detection Package
 """
 
 from .statistical_detector import StatisticalDetector, AnomalyResult
+from .correlation import CorrelationEngine, batch_top_correlated
 
-__all__ = ['StatisticalDetector', 'AnomalyResult']
+__all__ = ['StatisticalDetector', 'AnomalyResult', 'CorrelationEngine', 'batch_top_correlated']
 
 
 
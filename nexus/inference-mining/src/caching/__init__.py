@@ -0,0 +1,7 @@
+"""
+Caching Package
+"""
+
+from .result_cache import ResultCache, make_key, result_cache
+
+__all__ = ['ResultCache', 'make_key', 'result_cache']
@@ -0,0 +1,314 @@
+"""
+Result Cache
+
+값/타임스탬프 배열과 탐지 파라미터의 해시를 키로 하는 내용 주소 기반 결과 캐시입니다.
+LRU/TTL 퇴출, 메모리 예산, 선택적 디스크 스필을 지원하며
+StatisticalDetector, TimeSeriesAnalyzer, ProposalDraftGenerator가 공유합니다.
+
+결과는 pickle 바이트로 저장되므로 조회 시마다 독립된 사본이 반환되어,
+호출자가 결과를 수정해도 캐시에 영향을 주지 않습니다.
+
+saved_cpu_seconds는 적중으로 건너뛴 계산 시간에서 키 생성, 직렬화, 조회 시간을 뺀 순 절약량이므로
+계산이 가벼운 단계에서는 음수가 될 수 있습니다.
+
+디스크 스필 파일은 pickle이므로 다른 사용자가 심은 파일을 읽으면 임의 코드가 실행될 수 있습니다.
+spill_dir은 현재 사용자 소유의 0o700 디렉터리여야 하며(없으면 그렇게 생성), 각 파일은 인스턴스별
+비밀 키의 HMAC-SHA256으로 서명되어 서명이 맞는 파일만 역직렬화합니다.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import secrets
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+def make_key(namespace: str, *arrays: Any, **params: Any) -> str:
+    """
+    배열 내용과 파라미터로 캐시 키를 생성합니다.
+
+    Args:
+        namespace: 결과 종류 (예: "anomaly", "trend", "draft")
+        *arrays: 값/타임스탬프 배열 (리스트는 float64 배열로 변환, None 허용)
+        **params: 결과에 영향을 주는 파라미터 (JSON 직렬화 가능해야 함)
+
+    Returns:
+        16진수 키
+    """
+    digest = hashlib.blake2b(namespace.encode("utf-8"), digest_size=16)
+    for array in arrays:
+        if array is None:
+            digest.update(b"\x00none")
+            continue
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(str(array.shape).encode("ascii"))
+        digest.update(array.tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class _Entry:
+    payload: bytes
+    created_at: float
+    compute_seconds: float
+
+
+def _prepare_private_dir(path: str):
+    """
+    현재 사용자만 접근할 수 있는 디렉터리를 준비합니다.
+
+    없으면 0o700으로 만들고, 이미 있으면 심볼릭 링크가 아니고 현재 사용자 소유이며
+    그룹/다른 사용자 권한이 없는지 확인합니다 (POSIX에서만 검사).
+
+    Raises:
+        PermissionError: 다른 사용자 소유이거나 권한이 열려 있는 경우
+        NotADirectoryError: 디렉터리가 아닌 경우 (심볼릭 링크 포함)
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise NotADirectoryError(f"spill_dir is not a directory: {path}")
+    if not hasattr(os, "getuid"):
+        return
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"spill_dir is owned by another user (uid {info.st_uid}): {path}")
+    if info.st_mode & 0o077:
+        raise PermissionError(
+            f"spill_dir must not be accessible by group or others (mode {oct(stat.S_IMODE(info.st_mode))}): {path}"
+        )
+
+
+class ResultCache:
+    """LRU/TTL 결과 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+        spill_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            max_entries: 메모리에 보관할 최대 항목 수
+            max_bytes: 메모리 예산 (직렬화된 결과 크기 기준)
+            ttl_seconds: 항목 유효 시간 (None이면 만료 없음)
+            spill_dir: 퇴출된 항목을 기록할 디렉터리 (None이면 디스크 스필 안 함, 현재 사용자 소유의
+                0o700 디렉터리여야 하며 없으면 생성)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.spill_dir = spill_dir
+        # 스필 파일 서명 키 (프로세스 밖으로 나가지 않으므로 다른 인스턴스의 파일은 적중하지 않음)
+        self._spill_key = secrets.token_bytes(32)
+        if spill_dir:
+            _prepare_private_dir(spill_dir)
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._spills = 0
+        self._saved_seconds = 0.0
+        self._overhead_seconds = 0.0
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry.created_at > self.ttl_seconds
+
+    def _spill_path(self, key: str) -> str:
+        return os.path.join(self.spill_dir, f"{key}.pkl")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        캐시된 결과를 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (적중 여부, 결과)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                self._saved_seconds += entry.compute_seconds
+                return True, pickle.loads(entry.payload)
+
+        entry = self._load_spilled(key, now)
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._disk_hits += 1
+            self._saved_seconds += entry.compute_seconds
+            spilled = self._store(key, entry)
+        self._spill_all(spilled)
+        return True, pickle.loads(entry.payload)
+
+    def put(self, key: str, value: Any, compute_seconds: float = 0.0):
+        """
+        결과를 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 결과 (pickle 가능해야 함)
+            compute_seconds: 결과 계산에 걸린 시간 (절약된 CPU 시간 집계용)
+        """
+        entry = _Entry(
+            payload=pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+            created_at=time.time(),
+            compute_seconds=compute_seconds
+        )
+        if len(entry.payload) > self.max_bytes:
+            return
+        with self._lock:
+            spilled = self._store(key, entry)
+        self._spill_all(spilled)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], key_seconds: float = 0.0) -> Any:
+        """
+        캐시된 결과를 반환하거나, 없으면 계산하여 저장합니다.
+
+        조회, 직렬화 시간과 호출자가 전달한 키 생성 시간은 캐시 오버헤드로 집계됩니다.
+
+        Args:
+            key: 캐시 키
+            compute: 결과 계산 함수
+            key_seconds: 호출자가 키를 만드는 데 걸린 시간
+
+        Returns:
+            결과
+        """
+        started = time.perf_counter()
+        hit, value = self.get(key)
+        if hit:
+            self._add_overhead(key_seconds + time.perf_counter() - started)
+            return value
+        compute_started = time.perf_counter()
+        value = compute()
+        compute_seconds = time.perf_counter() - compute_started
+        self.put(key, value, compute_seconds)
+        self._add_overhead(key_seconds + time.perf_counter() - started - compute_seconds)
+        return value
+
+    def _add_overhead(self, seconds: float):
+        with self._lock:
+            self._overhead_seconds += seconds
+
+    def _store(self, key: str, entry: _Entry) -> list:
+        """항목을 저장하고 퇴출된 항목 중 디스크에 기록할 목록을 반환합니다 (락을 잡은 상태로 호출)."""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += len(entry.payload)
+
+        spilled = []
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._bytes -= len(old_entry.payload)
+            self._evictions += 1
+            if self.spill_dir:
+                spilled.append((old_key, old_entry))
+        return spilled
+
+    def _spill_all(self, spilled: list):
+        """퇴출된 항목을 디스크에 기록합니다 (파일 I/O 동안 캐시 락을 잡지 않음)."""
+        for old_key, old_entry in spilled:
+            self._spill(old_key, old_entry)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload)
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._spill_key, payload, hashlib.sha256).digest()
+
+    def _spill(self, key: str, entry: _Entry):
+        path = self._spill_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(tmp_path, "wb") as f:
+            f.write(self._sign(payload))
+            f.write(payload)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._spills += 1
+
+    def _load_spilled(self, key: str, now: float) -> Optional[_Entry]:
+        if not self.spill_dir:
+            return None
+        path = self._spill_path(key)
+        try:
+            with open(path, "rb") as f:
+                signature = f.read(hashlib.sha256().digest_size)
+                payload = f.read()
+            os.remove(path)
+        except OSError:
+            return None
+        # 서명이 맞지 않는 파일(다른 인스턴스나 다른 사용자가 쓴 파일)은 역직렬화하지 않음
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+        try:
+            entry = pickle.loads(payload)
+        except (pickle.UnpicklingError, EOFError):
+            return None
+        if self._expired(entry, now):
+            with self._lock:
+                self._expirations += 1
+            return None
+        return entry
+
+    def clear(self):
+        """메모리와 디스크의 모든 항목을 삭제합니다 (지표는 유지)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.spill_dir and os.path.isdir(self.spill_dir):
+            for name in os.listdir(self.spill_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.spill_dir, name))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """적중률, 절약된 CPU 시간 등 캐시 지표를 반환합니다."""
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "spills": self._spills,
+                "saved_cpu_seconds": self._saved_seconds - self._overhead_seconds,
+                "overhead_seconds": self._overhead_seconds,
+            }
+
+
+# 공유 인스턴스 (InferenceMining(cache=result_cache)로 여러 인스턴스가 함께 사용)
+result_cache = ResultCache()
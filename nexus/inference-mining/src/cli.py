@@ -0,0 +1,77 @@
+"""
+Inference Mining CLI
+
+NDJSON 신호 덤프를 스트리밍으로 처리하여 이슈와 제안 초안을 NDJSON으로 출력합니다.
+
+    cd nexus/inference-mining && python -m inference_mining.cli signals.ndjson.gz -o issues.ndjson
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .inference_mining import InferenceMining
+from .streaming_ingestion.ndjson_stream import (
+    StreamingInferencePipeline,
+    open_signal_source,
+    write_ndjson,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서를 생성합니다."""
+    parser = argparse.ArgumentParser(
+        prog="inference-mining",
+        description="NDJSON 신호 덤프에서 이슈와 제안 초안을 추출합니다."
+    )
+    parser.add_argument("input", help="입력 NDJSON 파일 (gzip 가능, '-'는 표준 입력)")
+    parser.add_argument("-o", "--output", default="-", help="출력 NDJSON 파일 (기본값: 표준 출력)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="메트릭별 청크 크기")
+    parser.add_argument("--max-buffered", type=int, default=200000, help="라우팅 버퍼 최대 값 수")
+    parser.add_argument("--context-size", type=int, default=100, help="청크 간 유지할 메트릭별 이전 값 수")
+    parser.add_argument("--trend-strength", type=float, default=0.8, help="이슈로 추출할 최소 트렌드 강도")
+    parser.add_argument("--max-issues", type=int, default=10000, help="중복 병합을 위해 보관할 최근 이슈 수")
+    parser.add_argument("--no-drafts", action="store_true", help="제안 초안을 생성하지 않습니다")
+    parser.add_argument("--quiet", action="store_true", help="처리량 통계를 출력하지 않습니다")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    CLI 진입점
+
+    Args:
+        argv: 명령행 인자 (None이면 sys.argv 사용)
+
+    Returns:
+        종료 코드
+    """
+    args = build_parser().parse_args(argv)
+
+    pipeline = StreamingInferencePipeline(
+        InferenceMining(),
+        chunk_size=args.chunk_size,
+        max_buffered=args.max_buffered,
+        context_size=args.context_size,
+        trend_strength_threshold=args.trend_strength,
+        generate_drafts=not args.no_drafts,
+        max_issues=args.max_issues
+    )
+
+    source = open_signal_source(args.input)
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        write_ndjson(pipeline.run(source), output, pipeline.stats)
+    finally:
+        source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        print(json.dumps(pipeline.stats.to_dict()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
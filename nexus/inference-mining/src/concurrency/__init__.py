@@ -0,0 +1,8 @@
+"""
+Concurrency Package
+"""
+
+from .striped_lock import StripedLock
+from .stress_benchmark import gil_enabled, run_stress_benchmark
+
+__all__ = ['StripedLock', 'gil_enabled', 'run_stress_benchmark']
@@ -0,0 +1,153 @@
+"""
+Concurrency Stress Benchmark
+
+여러 스레드가 하나의 InferenceMining 인스턴스에 이슈 추출, 중복 병합, 초안 생성,
+스냅샷 조회를 동시에 수행하게 하고, 갱신 손실이 없는지 검증하며 스레드 수별 처리량을 측정합니다.
+free-threaded CPython(3.13t 이상)에서 실행하면 GIL 없이 확장성을 확인할 수 있습니다.
+"""
+
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+
+def gil_enabled() -> bool:
+    """현재 인터프리터에서 GIL이 활성화되어 있는지 반환합니다 (3.13 미만은 항상 True)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def _make_workload(unique_issues: int, signals_per_issue: int, metrics: int, seed: int):
+    rng = np.random.default_rng(seed)
+    metric_keys = [f"metric_{m}" for m in range(metrics)]
+    workload = []
+    for i in range(unique_issues):
+        values = rng.normal(100.0, 10.0, size=(signals_per_issue, metrics))
+        values[-1] += 80.0  # 마지막 신호를 이상치로 만들어 이상 탐지/상관 경로까지 실행
+        signals = [
+            {
+                "id": f"issue-{i}-signal-{j}",
+                "data": dict(zip(metric_keys, row.tolist())),
+                "metadata": {"timestamp": j}
+            }
+            for j, row in enumerate(values)
+        ]
+        workload.append((signals, f"Stress issue {i}", f"Synthetic workload number {i} for concurrency checks"))
+    return workload
+
+
+def _run_once(workload, repeats: int, threads: int, stage_workers: int, seed: int) -> Dict[str, Any]:
+    from ..inference_mining import InferenceMining
+
+    mining = InferenceMining(cache=None, stage_workers=stage_workers)
+    tasks = [index for index in range(len(workload)) for _ in range(repeats)]
+    random.Random(seed).shuffle(tasks)
+    chunks = [tasks[t::threads] for t in range(threads)]
+
+    barrier = threading.Barrier(threads + 1)
+    errors: List[BaseException] = []
+    snapshot_reads = [0] * threads
+
+    def worker(slot: int):
+        barrier.wait()
+        try:
+            for n, index in enumerate(chunks[slot]):
+                signals, title, description = workload[index]
+                issue = mining.extract_issue(signals, title, description)
+                mining.generate_proposal_draft(issue)
+                if n % 8 == 0:
+                    snapshot = mining.get_detected_issues()
+                    # 스냅샷의 각 이슈는 병합 중에도 일관된 증거를 가져야 함
+                    for item in snapshot:
+                        summary = item["evidence"]["signalSummary"]
+                        if summary["includedSignals"] + summary["omittedSignals"] != summary["totalSignals"]:
+                            raise AssertionError(f"Torn evidence in issue {item['id']}")
+                    snapshot_reads[slot] += 1
+        except BaseException as exc:
+            errors.append(exc)
+
+    pool = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    mining.shutdown()
+
+    issues = mining.get_detected_issues()
+    occurrences = sum(issue.get("occurrenceCount", 1) for issue in issues)
+    dedup = mining.get_dedup_metrics()
+    expected = len(tasks)
+    consistent = (
+        not errors
+        and len(issues) == len(workload)
+        and occurrences == expected
+        and dedup["checked"] == expected
+        and all("auto_generated_proposal_draft" in issue for issue in issues)
+    )
+    return {
+        "threads": threads,
+        "operations": expected,
+        "elapsed_seconds": elapsed,
+        "operations_per_second": expected / elapsed if elapsed > 0 else 0.0,
+        "issues": len(issues),
+        "expected_issues": len(workload),
+        "occurrences": occurrences,
+        "lost_updates": expected - occurrences,
+        "snapshot_reads": sum(snapshot_reads),
+        "errors": [repr(exc) for exc in errors],
+        "consistent": consistent
+    }
+
+
+def run_stress_benchmark(thread_counts: Sequence[int] = (1, 2, 4, 8), unique_issues: int = 64,
+                         repeats: int = 8, signals_per_issue: int = 200, metrics: int = 8,
+                         stage_workers: int = 1, seed: int = 0) -> Dict[str, Any]:
+    """
+    스레드 수를 늘려 가며 동시성 스트레스 테스트를 실행합니다.
+
+    각 고유 이슈를 repeats번 제출하므로 모든 중복이 병합되면 이슈 수는 unique_issues,
+    occurrenceCount 합계는 unique_issues x repeats여야 합니다.
+
+    Args:
+        thread_counts: 측정할 스레드 수 목록
+        unique_issues: 고유 이슈 수
+        repeats: 이슈당 제출 횟수
+        signals_per_issue: 이슈당 신호 수
+        metrics: 신호당 메트릭 수
+        stage_workers: InferenceMining의 탐지 단계 스레드 수
+        seed: 난수 시드
+
+    Returns:
+        인터프리터 정보와 스레드 수별 결과 ({"runs": [...], "consistent": bool, ...})
+    """
+    workload = _make_workload(unique_issues, signals_per_issue, metrics, seed)
+    runs = []
+    for threads in thread_counts:
+        run = _run_once(workload, repeats, threads, stage_workers, seed)
+        run["speedup"] = runs[0]["elapsed_seconds"] / run["elapsed_seconds"] if runs and run["elapsed_seconds"] > 0 else 1.0
+        runs.append(run)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "gil_enabled": gil_enabled(),
+        "cpu_count": os.cpu_count(),
+        "runs": runs,
+        "consistent": all(run["consistent"] for run in runs)
+    }
+
+
+if __name__ == "__main__":
+    import json
+    report = run_stress_benchmark()
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report["consistent"] else 1)
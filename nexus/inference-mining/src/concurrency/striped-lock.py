@@ -0,0 +1,36 @@
+"""
+Striped Lock
+
+키(메트릭 키, 이슈 ID)를 고정된 수의 락 중 하나에 해시하여 매핑합니다.
+서로 다른 키에 대한 작업은 대부분 다른 락을 잡으므로 병렬로 진행되고,
+키마다 락을 만들지 않으므로 메모리 사용량이 키 수와 무관합니다.
+"""
+
+import threading
+from typing import List
+
+
+class StripedLock:
+    """키 해시 기반 분할 락"""
+
+    def __init__(self, stripes: int = 64):
+        """
+        Args:
+            stripes: 락 개수 (키 충돌로 인한 불필요한 대기와 메모리 사이의 절충)
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self.stripes = stripes
+        self._locks: List[threading.RLock] = [threading.RLock() for _ in range(stripes)]
+
+    def lock(self, key: str) -> threading.RLock:
+        """
+        키에 대응하는 락을 반환합니다 (with 문으로 사용).
+
+        Args:
+            key: 메트릭 키 또는 이슈 ID
+
+        Returns:
+            재진입 가능한 락
+        """
+        return self._locks[hash(key) % self.stripes]
@@ -4,55 +4,178 @@ Inference Mining
 신호로부터 이슈를 추출하고 제안 초안을 생성하는 메인 서비스입니다.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import heapq
+import threading
 import uuid
 
+import numpy as np
+
 from .anomaly_detection.statistical_detector import StatisticalDetector, AnomalyResult
+from .anomaly_detection.correlation import batch_top_correlated
 from .trend_analysis.time_series import TimeSeriesAnalyzer, TrendResult
-from .issue_grouping.clustering import IssueClusterer, ClusteringResult
+from .issue_grouping.clustering import IssueClusterer, ClusteringResult, PRIORITY_LEVELS
+from .issue_grouping.deduplication import IssueDeduplicator
 from .proposal_drafting.draft_generator import ProposalDraftGenerator, proposal_draft_generator
+from .caching.result_cache import ResultCache
+from .concurrency.striped_lock import StripedLock
+from .sampling.metric_sampler import (
+    MetricSampler,
+    SamplingConfig,
+    mean_standard_error,
+    slope_standard_error,
+)
+
+
+def _merge_metric_stats(
+    stats: Dict[str, Dict[str, Any]],
+    other: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    메트릭별 요약 통계(count, mean, std, min, max)를 합칩니다.
+    
+    표준편차는 두 집단의 제곱 평균을 합친 뒤 다시 계산합니다 (모표준편차).
+    """
+    merged = dict(stats)
+    for metric_key, right in other.items():
+        left = merged.get(metric_key)
+        if left is None or not left["count"]:
+            merged[metric_key] = dict(right)
+            continue
+        if not right["count"]:
+            continue
+        count = left["count"] + right["count"]
+        mean = (left["mean"] * left["count"] + right["mean"] * right["count"]) / count
+        second_moment = (
+            (left["std"] ** 2 + left["mean"] ** 2) * left["count"]
+            + (right["std"] ** 2 + right["mean"] ** 2) * right["count"]
+        ) / count
+        merged[metric_key] = {
+            "count": count,
+            "mean": mean,
+            "std": float(np.sqrt(max(second_moment - mean ** 2, 0.0))),
+            "min": min(left["min"], right["min"]),
+            "max": max(left["max"], right["max"])
+        }
+    return merged
 
 
 class InferenceMining:
-    """Inference Mining 서비스"""
+    """
+    Inference Mining 서비스
+    
+    여러 스레드가 하나의 인스턴스를 공유할 수 있습니다. 메트릭별 샘플러 상태와 이슈별 병합/초안
+    갱신은 분할 락(StripedLock)으로 보호됩니다. 이슈 목록은 색인 락 안에서 제자리에서 추가/교체되고
+    (ID → 위치 맵으로 O(1)), get_detected_issues()가 락을 잡고 복사본을 반환합니다.
+    병합/초안 갱신은 이슈 딕셔너리를 새로 만들어 교체하므로 이미 반환된 스냅샷은 바뀌지 않습니다.
+    """
     
-    def __init__(self):
-        self.anomaly_detector = StatisticalDetector(threshold=3.0)
-        self.trend_analyzer = TimeSeriesAnalyzer(min_data_points=3)
-        self.issue_clusterer = IssueClusterer(similarity_threshold=0.7)
-        self.draft_generator = proposal_draft_generator
+    def __init__(
+        self,
+        max_evidence_signals: int = 50,
+        cache: Optional[ResultCache] = None,
+        stage_workers: int = 1,
+        lock_stripes: int = 64,
+        precision: str = "float64"
+    ):
+        """
+        Args:
+            max_evidence_signals: 이슈에 포함할 최대 증거 신호 수 (나머지는 요약 통계로 대체)
+            cache: 탐지/트렌드/초안 결과 캐시 (기본값 None은 캐시 사용 안 함, 공유 캐시는 result_cache)
+            stage_workers: 메트릭별 NumPy 탐지 단계를 실행할 스레드 수 (1이면 호출 스레드에서 실행)
+            lock_stripes: 메트릭/이슈 분할 락 개수
+            precision: 탐지/트렌드/클러스터링 배열 저장 정밀도 ("float64" 또는 "float32")
+        """
+        self.max_evidence_signals = max_evidence_signals
+        self.cache = cache
+        self.precision = precision
+        self.anomaly_detector = StatisticalDetector(threshold=3.0, cache=cache, precision=precision)
+        self.trend_analyzer = TimeSeriesAnalyzer(min_data_points=3, cache=cache, precision=precision)
+        self.metric_sampler = MetricSampler()
+        self.issue_clusterer = IssueClusterer(similarity_threshold=0.7, precision=precision)
+        self.draft_generator = (
+            proposal_draft_generator if cache is None else ProposalDraftGenerator(cache=cache)
+        )
+        self.issue_deduplicator = IssueDeduplicator(similarity_threshold=0.8, mode="merge")
+        # 이슈 목록은 _index_lock 안에서만 수정하고, 읽을 때 복사함
         self.detected_issues: List[Dict[str, Any]] = []
+        # 이슈 ID → 절대 위치 (목록 인덱스 = 절대 위치 - _issue_base, 앞쪽 제거 시 base만 증가)
+        self._issue_positions: Dict[str, int] = {}
+        self._issue_base = 0
+        
+        self._metric_locks = StripedLock(lock_stripes)
+        self._issue_locks = StripedLock(lock_stripes)
+        self._index_lock = threading.Lock()        # 중복 제거 색인 + 이슈 목록
+        self._stage_executor = (
+            ThreadPoolExecutor(max_workers=stage_workers, thread_name_prefix="inference-stage")
+            if stage_workers > 1 else None
+        )
     
-    def detect_anomaly(self, signal_data: List[Dict[str, Any]], metric_key: str) -> Optional[AnomalyResult]:
+    def detect_anomaly(self, signal_data: List[Dict[str, Any]], metric_key: str,
+                       score_last: int = 1) -> Optional[AnomalyResult]:
         """
         신호 데이터에서 이상을 탐지합니다.
         
+        메트릭에 샘플링이 설정되어 있으면 표본으로 탐지하고 details["sampling"]에 오차 추정을 첨부합니다.
+        데시메이션은 극값을 골라 남기므로 평균/표준편차가 편향되어, "decimate" 설정은 이상 탐지에서
+        같은 max_points의 저수지 샘플링으로 대체됩니다.
+        
         Args:
             signal_data: 신호 데이터 리스트
             metric_key: 분석할 메트릭 키
+            score_last: 평가할 마지막 값 개수 (새로 들어온 값 전체를 평가할 때 사용)
         
         Returns:
             AnomalyResult 또는 None
         """
-        values = []
-        for signal in signal_data:
-            if metric_key in signal.get("data", {}):
-                try:
-                    value = float(signal["data"][metric_key])
-                    values.append(value)
-                except (ValueError, TypeError):
-                    continue
+        # 평가 대상인 마지막 score_last개 포인트는 항상 표본에 포함
+        values, _, sampling = self._metric_series(
+            signal_data, metric_key, keep_tail=score_last, allow_decimate=False
+        )
+        return self._detect_sampled(values, score_last, sampling)
+    
+    def detect_anomaly_values(self, values: Any, metric_key: str, score_last: int = 1,
+                              timestamps: Optional[Any] = None) -> Optional[AnomalyResult]:
+        """
+        메트릭 하나의 값 배열에서 이상을 탐지합니다 (신호 딕셔너리를 만들지 않는 열 단위 경로).
+        
+        detect_anomaly와 같은 샘플링 규칙을 적용합니다.
+        
+        Args:
+            values: 시간 순 값 배열
+            metric_key: 메트릭 키 (샘플링 설정 조회용)
+            score_last: 평가할 마지막 값 개수
+            timestamps: 값에 대응하는 타임스탬프 배열 (stratified 샘플링에 사용, 없으면 인덱스)
         
+        Returns:
+            AnomalyResult 또는 None
+        """
+        values, _, sampling = self._sample_columns(
+            metric_key, values, timestamps, keep_tail=score_last, allow_decimate=False
+        )
+        return self._detect_sampled(values, score_last, sampling)
+    
+    def _detect_sampled(self, values: Any, score_last: int,
+                        sampling: Optional[Dict[str, Any]]) -> Optional[AnomalyResult]:
+        """(샘플링된) 값으로 Z-score 탐지를 수행하고 샘플링 오차 추정을 첨부합니다."""
         if len(values) < 2:
             return None
         
-        return self.anomaly_detector.detect(values, method="zscore")
+        result = self.anomaly_detector.detect(values, method="zscore", score_last=min(score_last, len(values)))
+        if sampling is not None:
+            sampling["mean_std_error"] = mean_standard_error(values, sampling["population"])
+            sampling["std_relative_error"] = float(1.0 / np.sqrt(2 * (len(values) - 1)))
+            result.details["sampling"] = sampling
+        return result
     
     def analyze_trend(self, signal_data: List[Dict[str, Any]], metric_key: str) -> Optional[TrendResult]:
         """
         신호 데이터의 트렌드를 분석합니다.
         
+        메트릭에 샘플링이 설정되어 있으면 표본으로 적합하고 details["sampling"]에 기울기 표준 오차를 첨부합니다.
+        
         Args:
             signal_data: 신호 데이터 리스트
             metric_key: 분석할 메트릭 키
@@ -60,22 +183,162 @@ class InferenceMining:
         Returns:
             TrendResult 또는 None
         """
-        values = []
-        timestamps = []
+        values, timestamps, sampling = self._metric_series(signal_data, metric_key)
+        return self._trend_sampled(values, timestamps if timestamps else None, sampling)
+    
+    def analyze_trend_values(self, values: Any, timestamps: Optional[Any],
+                             metric_key: str) -> Optional[TrendResult]:
+        """
+        메트릭 하나의 값/타임스탬프 배열로 트렌드를 분석합니다 (열 단위 경로).
         
-        for signal in signal_data:
-            if metric_key in signal.get("data", {}):
-                try:
-                    value = float(signal["data"][metric_key])
-                    values.append(value)
-                    timestamps.append(signal.get("metadata", {}).get("timestamp", 0))
-                except (ValueError, TypeError):
-                    continue
+        analyze_trend와 같은 샘플링 규칙을 적용합니다.
         
+        Args:
+            values: 시간 순 값 배열
+            timestamps: 타임스탬프 배열 (None이면 인덱스 사용)
+            metric_key: 메트릭 키 (샘플링 설정 조회용)
+        
+        Returns:
+            TrendResult 또는 None
+        """
+        values, timestamps, sampling = self._sample_columns(metric_key, values, timestamps)
+        return self._trend_sampled(values, timestamps, sampling)
+    
+    def _trend_sampled(self, values: Any, timestamps: Optional[Any],
+                       sampling: Optional[Dict[str, Any]]) -> Optional[TrendResult]:
+        """(샘플링된) 값으로 트렌드를 적합하고 기울기 표준 오차를 첨부합니다."""
         if len(values) < 3:
             return None
         
-        return self.trend_analyzer.detect_trend(values, timestamps if timestamps else None)
+        result = self.trend_analyzer.detect_trend(values, timestamps)
+        if sampling is not None and "intercept" in result.details:
+            x = timestamps if timestamps is not None else np.arange(len(values))
+            sampling["slope_std_error"] = slope_standard_error(
+                x, values, result.slope, result.details["intercept"]
+            )
+            result.details["sampling"] = sampling
+        return result
+    
+    def set_sampling(self, metric_key: str, config: Optional[SamplingConfig]):
+        """
+        메트릭의 샘플링 설정을 지정합니다.
+        
+        Args:
+            metric_key: 메트릭 키
+            config: 샘플링 설정 (None이면 샘플링 해제)
+        """
+        with self._metric_locks.lock(metric_key):
+            self.metric_sampler.configure(metric_key, config)
+    
+    def _metric_series(self, signal_data: List[Dict[str, Any]], metric_key: str, keep_tail: int = 0,
+                       allow_decimate: bool = True):
+        """
+        메트릭 값과 타임스탬프를 추출하고, 설정된 경우 샘플링을 적용합니다.
+        
+        reservoir/stratified는 값 파싱 전에 신호를 추출하여 파싱 비용도 예산 안으로 제한하고,
+        decimate는 값이 필요하므로 파싱 후에 적용합니다. 마지막 keep_tail개 포인트는
+        샘플링하지 않고 모두 유지하므로 분석 포인트 수는 최대 max_points + keep_tail입니다.
+        
+        Args:
+            signal_data: 신호 데이터 리스트
+            metric_key: 메트릭 키
+            keep_tail: 샘플링 없이 유지할 마지막 포인트 수
+            allow_decimate: False이면 "decimate" 설정 대신 저수지 샘플링 사용
+        
+        Returns:
+            (값 리스트, 타임스탬프 리스트, 샘플링 정보 또는 None)
+        """
+        candidates = [signal for signal in signal_data if metric_key in signal.get("data", {})]
+        population = len(candidates)
+        config = self.metric_sampler.get_config(metric_key)
+        method = config.method if config is not None else None
+        if method == "decimate" and not allow_decimate:
+            method = "reservoir"
+        sampled = False
+        head_size = max(population - keep_tail, 0)
+        
+        if method in ("reservoir", "stratified"):
+            head = candidates[:head_size]
+            candidate_timestamps = None
+            if method == "stratified":
+                candidate_timestamps = [s.get("metadata", {}).get("timestamp", 0) for s in head]
+            # 메트릭별 난수 생성기는 스레드 간에 공유할 수 없음
+            with self._metric_locks.lock(metric_key):
+                indices = self.metric_sampler.select_indices(
+                    metric_key, len(head), timestamps=candidate_timestamps, method=method
+                )
+            if indices is not None:
+                candidates = [head[i] for i in indices] + candidates[head_size:]
+                head_size = len(indices)
+                sampled = True
+        
+        values = []
+        timestamps = []
+        parsed_head = 0
+        for position, signal in enumerate(candidates):
+            try:
+                value = float(signal["data"][metric_key])
+            except (ValueError, TypeError):
+                continue
+            values.append(value)
+            timestamps.append(signal.get("metadata", {}).get("timestamp", 0))
+            if position < head_size:
+                parsed_head += 1
+        
+        if method == "decimate":
+            indices = self.metric_sampler.select_indices(metric_key, parsed_head, values=values[:parsed_head])
+            if indices is not None:
+                indices = np.concatenate([indices, np.arange(parsed_head, len(values))])
+                values = [values[i] for i in indices]
+                timestamps = [timestamps[i] for i in indices]
+                sampled = True
+        
+        sampling = self.metric_sampler.describe(metric_key, population, len(values), method) if sampled else None
+        return values, timestamps, sampling
+    
+    def _sample_columns(self, metric_key: str, values: Any, timestamps: Optional[Any] = None,
+                        keep_tail: int = 0, allow_decimate: bool = True):
+        """
+        _metric_series의 열 단위 버전: 값/타임스탬프 배열에 설정된 샘플링을 적용합니다.
+        
+        Args:
+            metric_key: 메트릭 키
+            values: 시간 순 값 배열
+            timestamps: 타임스탬프 배열 (None 허용)
+            keep_tail: 샘플링 없이 유지할 마지막 포인트 수
+            allow_decimate: False이면 "decimate" 설정 대신 저수지 샘플링 사용
+        
+        Returns:
+            (값 배열, 타임스탬프 배열 또는 None, 샘플링 정보 또는 None)
+        """
+        values = np.asarray(values)
+        config = self.metric_sampler.get_config(metric_key)
+        if config is None:
+            return values, timestamps, None
+        method = config.method
+        if method == "decimate" and not allow_decimate:
+            method = "reservoir"
+        population = len(values)
+        head_size = max(population - keep_tail, 0)
+        
+        if method == "decimate":
+            indices = self.metric_sampler.select_indices(metric_key, head_size, values=values[:head_size])
+        else:
+            head_timestamps = None
+            if method == "stratified":
+                head_timestamps = timestamps[:head_size] if timestamps is not None else np.arange(head_size)
+            with self._metric_locks.lock(metric_key):
+                indices = self.metric_sampler.select_indices(
+                    metric_key, head_size, timestamps=head_timestamps, method=method
+                )
+        if indices is None:
+            return values, timestamps, None
+        
+        indices = np.concatenate([indices, np.arange(head_size, population)])
+        values = values[indices]
+        if timestamps is not None:
+            timestamps = np.asarray(timestamps)[indices]
+        return values, timestamps, self.metric_sampler.describe(metric_key, population, len(values), method)
     
     def extract_issue(self, signal_data: List[Dict[str, Any]], issue_title: str, 
                       issue_description: str, priority: str = "medium") -> Dict[str, Any]:
@@ -93,33 +356,44 @@ class InferenceMining:
         """
         now = int(datetime.now().timestamp() * 1000)
         
-        # 관련 신호 정보 수집
-        related_signals = []
-        for signal in signal_data:
-            related_signals.append({
-                "signalId": signal.get("id", ""),
-                "relevanceScore": 1.0,
-                "relevanceReason": "Directly related to issue"
-            })
-        
         # 통계적 증거 수집
         statistical_evidence = {}
-        if len(signal_data) > 0:
-            # 첫 번째 메트릭으로 이상 탐지 시도
-            first_signal = signal_data[0]
-            if isinstance(first_signal.get("data"), dict):
-                metric_keys = list(first_signal["data"].keys())
-                if metric_keys:
-                    anomaly_result = self.detect_anomaly(signal_data, metric_keys[0])
-                    if anomaly_result and anomaly_result.is_anomaly:
-                        statistical_evidence["anomalyScore"] = anomaly_result.anomaly_score
-            
-            # 트렌드 분석
-            if metric_keys:
-                trend_result = self.analyze_trend(signal_data, metric_keys[0])
-                if trend_result:
-                    statistical_evidence["trendDirection"] = trend_result.direction
-                    statistical_evidence["trendStrength"] = trend_result.strength
+        metric_rows, metric_values, metric_indices = self._collect_metric_values(signal_data)
+        
+        # 관련 신호 정보 수집 (관련도 상위 신호만 포함하고 나머지는 요약)
+        related_signals, signal_summary = self._select_evidence_signals(
+            signal_data, metric_values, metric_indices
+        )
+        
+        # 모든 메트릭에 대해 이상 탐지 (가장 이상 점수가 높은 메트릭이 대표)
+        detectable = [(key, values) for key, values in metric_values.items() if len(values) >= 2]
+        anomaly_results = self._map_stage(
+            lambda item: self._detect_metric(signal_data, *item), detectable
+        )
+        anomalous = [
+            (metric_key, anomaly_result)
+            for (metric_key, _), anomaly_result in zip(detectable, anomaly_results)
+            if anomaly_result is not None and anomaly_result.is_anomaly
+        ]
+        anomalous.sort(key=lambda item: item[1].anomaly_score, reverse=True)
+        
+        if anomalous:
+            anomalous_keys = [metric_key for metric_key, _ in anomalous]
+            statistical_evidence["anomalyScore"] = anomalous[0][1].anomaly_score
+            statistical_evidence["anomalousMetrics"] = anomalous_keys
+            # 이 신호 묶음 안에서 함께 움직이는 메트릭을 추가 증거로 첨부 (타임스탬프로 맞춘 행 기준,
+            # 다른 호출의 신호와 섞지 않음)
+            correlated = batch_top_correlated(metric_rows, anomalous_keys)
+            if correlated:
+                statistical_evidence["correlatedMetrics"] = correlated
+        
+        # 트렌드 분석 (대표 이상 메트릭, 없으면 첫 번째 메트릭)
+        primary_metric = anomalous[0][0] if anomalous else next(iter(metric_values), None)
+        if primary_metric is not None:
+            trend_result = self.analyze_trend(signal_data, primary_metric)
+            if trend_result:
+                statistical_evidence["trendDirection"] = trend_result.direction
+                statistical_evidence["trendStrength"] = trend_result.strength
         
         issue = {
             "id": str(uuid.uuid4()),
@@ -129,6 +403,7 @@ class InferenceMining:
             "status": "detected",
             "evidence": {
                 "signals": related_signals,
+                "signalSummary": signal_summary,
                 "statisticalEvidence": statistical_evidence
             },
             "categories": [],
@@ -136,20 +411,261 @@ class InferenceMining:
             "updatedAt": now
         }
         
+        # 거의 동일한 이슈가 이미 있으면 병합 또는 폐기
+        # (MinHash 서명은 락 밖에서 계산하고, 조회와 등록만 원자적으로 수행)
+        signature = self.issue_deduplicator.signature(self.issue_deduplicator.shingles(issue))
+        with self._index_lock:
+            dedup_result = self.issue_deduplicator.find_duplicate(issue, signature)
+            if not dedup_result.is_duplicate:
+                self.issue_deduplicator.add(issue["id"], signature)
+                self._append_issue(issue)
+                return issue
+            existing = self._registered_issue(dedup_result.duplicate_of)
+        
+        if self.issue_deduplicator.mode != "merge":
+            return existing
+        with self._issue_locks.lock(existing["id"]):
+            # 락을 기다리는 동안 다른 스레드가 교체했을 수 있으므로 최신 이슈를 기준으로 병합
+            with self._index_lock:
+                current = self._registered_issue(existing["id"]) or existing
+            merged = self._merge_issue(current, issue)
+            self._replace_issue(merged)
+        return merged
+    
+    def _detect_metric(self, signal_data: List[Dict[str, Any]], metric_key: str,
+                       values: List[float]) -> Optional[AnomalyResult]:
+        """
+        extract_issue의 메트릭별 탐지 단계
+        
+        샘플링이 설정된 메트릭은 detect_anomaly(_metric_series)를 거쳐 표본으로 탐지하고,
+        나머지는 이미 수집한 값을 그대로 사용합니다 (_metric_series와 같은 값).
+        """
+        if self.metric_sampler.get_config(metric_key) is not None:
+            return self.detect_anomaly(signal_data, metric_key)
+        return self.anomaly_detector.detect(values, method="zscore")
+    
+    def _map_stage(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        메트릭별 NumPy 단계를 스레드 풀에서 실행합니다 (결과는 입력 순서).
+        
+        NumPy 연산은 GIL을 해제하므로 큰 배열에서는 GIL 빌드에서도 병렬로 실행됩니다.
+        """
+        items = list(items)
+        if self._stage_executor is None or len(items) < 2:
+            return [fn(item) for item in items]
+        return list(self._stage_executor.map(fn, items))
+    
+    def _merge_issue(self, existing: Dict[str, Any], duplicate: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        중복 이슈의 증거를 기존 이슈에 병합한 새 이슈를 만듭니다.
+        
+        기존 이슈 딕셔너리는 수정하지 않으므로(copy-on-write) 스냅샷을 읽는 스레드는
+        병합 전 또는 후의 이슈만 보게 됩니다. 교체는 호출자가 _replace_issue로 수행합니다.
+        
+        Args:
+            existing: 유지할 기존 이슈
+            duplicate: 병합할 중복 이슈
+        
+        Returns:
+            병합된 이슈 (기존 이슈 ID 유지)
+        """
+        # 두 이슈의 증거 신호를 합쳐 관련도 상위 신호만 유지
+        merged_signals = {}
+        for signal in existing["evidence"]["signals"] + duplicate["evidence"]["signals"]:
+            known = merged_signals.get(signal["signalId"])
+            if known is None or signal["relevanceScore"] > known["relevanceScore"]:
+                merged_signals[signal["signalId"]] = signal
+        evidence = dict(existing["evidence"])
+        evidence["signals"] = heapq.nlargest(
+            self.max_evidence_signals, merged_signals.values(), key=lambda s: s["relevanceScore"]
+        )
+        
+        summary = evidence.get("signalSummary")
+        duplicate_summary = duplicate["evidence"].get("signalSummary")
+        if summary and duplicate_summary:
+            total = summary["totalSignals"] + duplicate_summary["totalSignals"]
+            included = len(evidence["signals"])
+            evidence["signalSummary"] = {
+                "totalSignals": total,
+                "includedSignals": included,
+                "omittedSignals": total - included,
+                "meanRelevance": (
+                    summary["meanRelevance"] * summary["totalSignals"]
+                    + duplicate_summary["meanRelevance"] * duplicate_summary["totalSignals"]
+                ) / total if total else 0.0,
+                "maxRelevance": max(summary["maxRelevance"], duplicate_summary["maxRelevance"]),
+                "metrics": _merge_metric_stats(summary["metrics"], duplicate_summary["metrics"])
+            }
+        
+        # 통계적 증거는 최신 값으로 갱신
+        evidence["statisticalEvidence"] = {
+            **existing["evidence"]["statisticalEvidence"],
+            **duplicate["evidence"]["statisticalEvidence"]
+        }
+        # 우선순위는 둘 중 높은 쪽을 유지 (재추출로 격상된 이슈가 강등되지 않도록)
+        priority = max(
+            (existing.get("priority"), duplicate.get("priority")),
+            key=lambda p: PRIORITY_LEVELS.index(p) if p in PRIORITY_LEVELS else -1
+        )
+        return {
+            **existing,
+            "priority": priority,
+            "evidence": evidence,
+            "occurrenceCount": existing.get("occurrenceCount", 1) + 1,
+            "updatedAt": duplicate["updatedAt"]
+        }
+    
+    def _append_issue(self, issue: Dict[str, Any]):
+        """이슈를 목록 끝에 추가합니다 (_index_lock을 잡은 상태로 호출)."""
+        self._issue_positions[issue["id"]] = self._issue_base + len(self.detected_issues)
         self.detected_issues.append(issue)
-        return issue
     
-    def group_issues(self, issues: List[Dict[str, Any]]) -> ClusteringResult:
+    def _registered_issue(self, issue_id: str) -> Optional[Dict[str, Any]]:
+        """등록된 이슈를 반환합니다 (_index_lock을 잡은 상태로 호출, 없으면 None)."""
+        position = self._issue_positions.get(issue_id)
+        return None if position is None else self.detected_issues[position - self._issue_base]
+    
+    def _replace_issue(self, issue: Dict[str, Any]) -> bool:
+        """
+        같은 ID의 등록된 이슈를 새 딕셔너리로 제자리에서 교체합니다 (O(1)).
+        
+        호출자가 이슈 락을 잡고 있어야 합니다.
+        
+        Args:
+            issue: 새 이슈
+        
+        Returns:
+            교체 여부 (이미 제거된 이슈면 False)
+        """
+        with self._index_lock:
+            position = self._issue_positions.get(issue["id"])
+            if position is None:
+                return False
+            self.detected_issues[position - self._issue_base] = issue
+        return True
+    
+    def _collect_metric_values(self, signal_data: List[Dict[str, Any]]):
+        """
+        신호 데이터를 한 번 순회하여 타임스탬프별 메트릭 행과 메트릭별 값 리스트를 만듭니다.
+        
+        같은 타임스탬프의 신호(재시도, 메트릭별로 나뉜 신호)는 한 행으로 합치고 같은 메트릭은
+        나중 값을 사용합니다. 타임스탬프가 없는 신호는 각자 한 행입니다.
+        
+        Args:
+            signal_data: 신호 데이터 리스트
+        
+        Returns:
+            (타임스탬프별 {메트릭: 값} 리스트, {메트릭: 값 리스트}, {메트릭: 신호 인덱스 리스트})
+        """
+        rows: Dict[Any, Dict[str, float]] = {}
+        metric_values: Dict[str, List[float]] = {}
+        metric_indices: Dict[str, List[int]] = {}
+        for index, signal in enumerate(signal_data):
+            data = signal.get("data")
+            if not isinstance(data, dict):
+                continue
+            timestamp = (signal.get("metadata") or {}).get("timestamp")
+            row_key = timestamp if timestamp is not None else ("signal", index)
+            for metric_key, raw_value in data.items():
+                try:
+                    value = float(raw_value)
+                except (ValueError, TypeError):
+                    continue
+                rows.setdefault(row_key, {})[metric_key] = value
+                metric_values.setdefault(metric_key, []).append(value)
+                metric_indices.setdefault(metric_key, []).append(index)
+        return list(rows.values()), metric_values, metric_indices
+    
+    def _select_evidence_signals(
+        self,
+        signal_data: List[Dict[str, Any]],
+        metric_values: Dict[str, List[float]],
+        metric_indices: Dict[str, List[int]]
+    ):
+        """
+        신호별 관련도를 계산하고 상위 max_evidence_signals개만 증거로 선택합니다.
+        
+        관련도는 신호가 가진 메트릭 중 기준선(배치 평균)에서 가장 많이 벗어난 정도(|z|)이며,
+        메트릭 단위로 벡터화하여 계산합니다.
+        
+        Args:
+            signal_data: 신호 데이터 리스트
+            metric_values: 메트릭별 값 리스트
+            metric_indices: 메트릭별 신호 인덱스 리스트
+        
+        Returns:
+            (증거 신호 리스트, 신호 요약 딕셔너리)
+        """
+        signal_count = len(signal_data)
+        deviations = np.zeros(signal_count)
+        deviation_metric = np.full(signal_count, -1, dtype=np.int64)
+        metric_keys = list(metric_values)
+        metric_stats = {}
+        
+        for metric_position, metric_key in enumerate(metric_keys):
+            values = np.asarray(metric_values[metric_key], dtype=np.float64)
+            indices = np.asarray(metric_indices[metric_key], dtype=np.int64)
+            mean = float(values.mean())
+            std = float(values.std())
+            metric_stats[metric_key] = {
+                "count": len(values),
+                "mean": mean,
+                "std": std,
+                "min": float(values.min()),
+                "max": float(values.max())
+            }
+            if std == 0:
+                continue
+            z = np.abs(values - mean) / std
+            better = z > deviations[indices]
+            deviations[indices[better]] = z[better]
+            deviation_metric[indices[better]] = metric_position
+        
+        relevance = np.minimum(deviations / self.anomaly_detector.threshold, 1.0)
+        
+        k = min(self.max_evidence_signals, signal_count)
+        if k < signal_count:
+            selected = np.argpartition(-deviations, k - 1)[:k]
+        else:
+            selected = np.arange(signal_count)
+        selected = selected[np.argsort(-deviations[selected], kind="stable")]
+        
+        related_signals = []
+        for index in selected:
+            metric_position = deviation_metric[index]
+            if metric_position >= 0:
+                reason = f"{metric_keys[metric_position]} deviates {deviations[index]:.2f} std from baseline"
+            else:
+                reason = "Directly related to issue"
+            related_signals.append({
+                "signalId": signal_data[index].get("id", ""),
+                "relevanceScore": float(relevance[index]),
+                "relevanceReason": reason
+            })
+        
+        signal_summary = {
+            "totalSignals": signal_count,
+            "includedSignals": len(related_signals),
+            "omittedSignals": signal_count - len(related_signals),
+            "meanRelevance": float(relevance.mean()) if signal_count else 0.0,
+            "maxRelevance": float(relevance.max()) if signal_count else 0.0,
+            "metrics": metric_stats
+        }
+        return related_signals, signal_summary
+    
+    def group_issues(self, issues: List[Dict[str, Any]], method: str = "simple", **kwargs) -> ClusteringResult:
         """
         이슈들을 그룹화합니다.
         
         Args:
             issues: 이슈 리스트
+            method: 클러스터링 방법 ("simple", "minibatch_kmeans", "hierarchical")
+            **kwargs: 방법별 파라미터 (n_clusters, max_iterations, time_budget 등)
         
         Returns:
             ClusteringResult: 클러스터링 결과
         """
-        return self.issue_clusterer.cluster(issues, method="simple")
+        return self.issue_clusterer.cluster(issues, method=method, **kwargs)
     
     def generate_proposal_draft(
         self,
@@ -169,18 +685,108 @@ class InferenceMining:
         evidence_signals = issue.get('evidence', {}).get('signals', [])
         draft = self.draft_generator.generate_draft(issue, evidence_signals, context)
         
-        # 이슈에 초안 추가
-        issue['auto_generated_proposal_draft'] = draft
+        # 등록된 이슈는 초안을 포함한 새 딕셔너리로 교체하고, 호환성을 위해 전달된 딕셔너리에도 추가
+        issue_id = issue.get('id', '')
+        with self._issue_locks.lock(issue_id):
+            with self._index_lock:
+                current = self._registered_issue(issue_id)
+            if current is not None:
+                self._replace_issue({**current, 'auto_generated_proposal_draft': draft})
+            issue['auto_generated_proposal_draft'] = draft
         
         return draft
     
     def get_detected_issues(self) -> List[Dict[str, Any]]:
-        """감지된 이슈들을 반환합니다."""
-        return self.detected_issues.copy()
+        """감지된 이슈들의 스냅샷을 반환합니다 (락을 잡고 복사, 읽기는 드문 경로)."""
+        with self._index_lock:
+            return list(self.detected_issues)
     
     def clear_issues(self):
         """감지된 이슈들을 초기화합니다."""
-        self.detected_issues = []
+        with self._index_lock:
+            self.detected_issues = []
+            self._issue_positions = {}
+            self._issue_base = 0
+            self.issue_deduplicator.clear()
+    
+    def evict_issues(self, max_issues: int) -> List[str]:
+        """
+        가장 오래된 이슈부터 제거하여 보관 이슈 수를 max_issues 이하로 유지합니다.
+        
+        제거된 이슈는 중복 제거 색인에서도 빠지므로, 남은 이슈에 대한 중복 병합은 계속 동작합니다.
+        
+        Args:
+            max_issues: 보관할 최대 이슈 수
+        
+        Returns:
+            제거된 이슈 ID 리스트
+        """
+        with self._index_lock:
+            excess = len(self.detected_issues) - max_issues
+            if excess <= 0:
+                return []
+            evicted = [issue["id"] for issue in self.detected_issues[:excess]]
+            for issue_id in evicted:
+                del self._issue_positions[issue_id]
+                self.issue_deduplicator.remove(issue_id)
+            del self.detected_issues[:excess]
+            self._issue_base += excess
+            return evicted
+    
+    def export_issues(self, issue_ids: Iterable[str]) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        이슈를 중복 제거 서명과 함께 꺼내고 이 인스턴스에서 제거합니다 (샤드 이전용).
+        
+        Args:
+            issue_ids: 꺼낼 이슈 ID (등록되지 않은 ID는 무시)
+        
+        Returns:
+            (이슈, MinHash 서명) 리스트
+        """
+        with self._index_lock:
+            exported = []
+            for issue_id in issue_ids:
+                issue = self._registered_issue(issue_id)
+                if issue is not None:
+                    exported.append((issue, self.issue_deduplicator.get_signature(issue_id)))
+                    self.issue_deduplicator.remove(issue_id)
+            if exported:
+                removed = {issue["id"] for issue, _ in exported}
+                self.detected_issues = [issue for issue in self.detected_issues if issue["id"] not in removed]
+                self._issue_base = 0
+                self._issue_positions = {issue["id"]: i for i, issue in enumerate(self.detected_issues)}
+            return exported
+    
+    def import_issues(self, entries: Iterable[Tuple[Dict[str, Any], Any]]):
+        """
+        export_issues로 꺼낸 이슈와 서명을 등록합니다 (이미 있는 ID는 무시).
+        
+        Args:
+            entries: (이슈, MinHash 서명) 리스트
+        """
+        with self._index_lock:
+            for issue, signature in entries:
+                if issue["id"] in self._issue_positions:
+                    continue
+                if signature is None:
+                    signature = self.issue_deduplicator.signature(self.issue_deduplicator.shingles(issue))
+                self.issue_deduplicator.add(issue["id"], signature)
+                self._append_issue(issue)
+    
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """결과 캐시 지표(적중률, 절약된 CPU 시간)를 반환합니다."""
+        return self.cache.get_metrics() if self.cache is not None else {}
+    
+    def get_dedup_metrics(self) -> Dict[str, Any]:
+        """이슈 중복 제거 지표(중복률, 조회 지연)를 반환합니다."""
+        with self._index_lock:
+            return self.issue_deduplicator.get_metrics()
+    
+    def shutdown(self):
+        """탐지 단계 스레드 풀을 종료합니다."""
+        if self._stage_executor is not None:
+            self._stage_executor.shutdown(wait=True)
+            self._stage_executor = None
 
 
 # 싱글톤 인스턴스
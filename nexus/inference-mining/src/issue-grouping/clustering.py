@@ -4,10 +4,21 @@ Issue Clustering
 유사한 이슈들을 클러스터링합니다.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+import inspect
+import time
 import numpy as np
 
+from ..precision.precision_mode import storage_dtype
+
+
+# 우선순위 레벨 (낮음 → 높음) 및 특징 점수
+PRIORITY_LEVELS = ("low", "medium", "high", "critical")
+PRIORITY_SCORES = {"low": 0.25, "medium": 0.5, "high": 0.75, "critical": 1.0}
+PRIORITY_CODES = {priority: code for code, priority in enumerate(PRIORITY_LEVELS)}
+_PRIORITY_CODE_SCORES = np.array([PRIORITY_SCORES[p] for p in PRIORITY_LEVELS])
+
 
 @dataclass
 class Cluster:
@@ -18,6 +29,39 @@ class Cluster:
     similarity_score: float
 
 
+@dataclass
+class IssueFeatures:
+    """
+    이슈 특징 행렬 (열 단위 압축 저장)
+    
+    우선순위는 PRIORITY_LEVELS 인덱스(int8), 카테고리/신호 수는 정수 개수로 저장하고
+    정규화된 실수 행렬은 필요할 때 to_matrix()로 만듭니다.
+    """
+    issue_ids: List[str]
+    priority_codes: np.ndarray   # int8
+    category_counts: np.ndarray  # uint16
+    signal_counts: np.ndarray    # uint32
+    anomaly_scores: np.ndarray   # 저장 정밀도
+    
+    def __len__(self) -> int:
+        return len(self.issue_ids)
+    
+    @property
+    def nbytes(self) -> int:
+        return (self.priority_codes.nbytes + self.category_counts.nbytes
+                + self.signal_counts.nbytes + self.anomaly_scores.nbytes)
+    
+    def to_matrix(self) -> np.ndarray:
+        """extract_features와 같은 정규화 규칙의 (이슈 x 4) 행렬을 anomaly_scores의 dtype으로 반환합니다."""
+        dtype = self.anomaly_scores.dtype
+        matrix = np.empty((len(self.issue_ids), 4), dtype=dtype)
+        matrix[:, 0] = _PRIORITY_CODE_SCORES[self.priority_codes]
+        matrix[:, 1] = np.minimum(self.category_counts / 5.0, 1.0)
+        matrix[:, 2] = np.minimum(self.signal_counts / 10.0, 1.0)
+        matrix[:, 3] = self.anomaly_scores
+        return matrix
+
+
 @dataclass
 class ClusteringResult:
     """클러스터링 결과"""
@@ -29,12 +73,15 @@ class ClusteringResult:
 class IssueClusterer:
     """이슈 클러스터링기"""
     
-    def __init__(self, similarity_threshold: float = 0.7):
+    def __init__(self, similarity_threshold: float = 0.7, precision: str = "float64"):
         """
         Args:
             similarity_threshold: 유사도 임계값 (0-1)
+            precision: 특징 행렬 저장 정밀도 ("float64" 또는 "float32")
         """
         self.similarity_threshold = similarity_threshold
+        self.precision = precision
+        self.dtype = storage_dtype(precision)
     
     def extract_features(self, issue: Dict[str, Any]) -> np.ndarray:
         """
@@ -49,24 +96,70 @@ class IssueClusterer:
         features = []
         
         # 우선순위 점수 (0-1)
-        priority_map = {"low": 0.25, "medium": 0.5, "high": 0.75, "critical": 1.0}
-        features.append(priority_map.get(issue.get("priority", "medium"), 0.5))
+        features.append(PRIORITY_SCORES.get(issue.get("priority", "medium"), 0.5))
         
         # 카테고리 인코딩 (간단한 예시)
         categories = issue.get("categories", [])
         category_count = len(categories)
         features.append(min(category_count / 5.0, 1.0))
         
-        # 증거 신호 수
-        evidence_signals = issue.get("evidence", {}).get("signals", [])
-        signal_count = len(evidence_signals)
+        # 증거 신호 수 (상위 신호만 포함된 경우 요약의 전체 신호 수 사용)
+        evidence = issue.get("evidence", {})
+        signal_count = evidence.get("signalSummary", {}).get("totalSignals", len(evidence.get("signals", [])))
         features.append(min(signal_count / 10.0, 1.0))
         
         # 이상 점수
         anomaly_score = issue.get("evidence", {}).get("statisticalEvidence", {}).get("anomalyScore", 0.0)
         features.append(anomaly_score)
         
-        return np.array(features)
+        return np.array(features, dtype=self.dtype)
+    
+    def extract_feature_matrix(self, issues: List[Dict[str, Any]]) -> IssueFeatures:
+        """
+        ID가 있는 이슈들의 특징을 정수 코드/개수 열로 한 번에 추출합니다.
+        
+        Args:
+            issues: 이슈 리스트
+        
+        Returns:
+            IssueFeatures: 압축 특징 행렬 (ID가 없는 이슈는 제외)
+        """
+        issue_ids = []
+        priority_codes = []
+        category_counts = []
+        signal_counts = []
+        anomaly_scores = []
+        for issue in issues:
+            issue_id = issue.get("id")
+            if not issue_id:
+                continue
+            evidence = issue.get("evidence", {})
+            issue_ids.append(issue_id)
+            priority_codes.append(PRIORITY_CODES.get(issue.get("priority", "medium"), PRIORITY_CODES["medium"]))
+            category_counts.append(len(issue.get("categories", [])))
+            signal_counts.append(
+                evidence.get("signalSummary", {}).get("totalSignals", len(evidence.get("signals", [])))
+            )
+            anomaly_scores.append(evidence.get("statisticalEvidence", {}).get("anomalyScore", 0.0))
+        
+        return IssueFeatures(
+            issue_ids=issue_ids,
+            priority_codes=np.array(priority_codes, dtype=np.int8),
+            category_counts=np.minimum(np.array(category_counts, dtype=np.int64), np.iinfo(np.uint16).max).astype(np.uint16),
+            signal_counts=np.minimum(np.array(signal_counts, dtype=np.int64), np.iinfo(np.uint32).max).astype(np.uint32),
+            anomaly_scores=np.array(anomaly_scores, dtype=self.dtype)
+        )
+    
+    def _unique_feature_matrix(self, issues: List[Dict[str, Any]]) -> Tuple[List[str], np.ndarray]:
+        """ID별 특징 행렬 (중복 ID는 처음 등장한 순서, 마지막 이슈의 특징 사용)"""
+        features = self.extract_feature_matrix(issues)
+        positions = {issue_id: position for position, issue_id in enumerate(features.issue_ids)}
+        return list(positions), features.to_matrix()[list(positions.values())]
+    
+    def _normalized_rows(self, matrix: np.ndarray) -> np.ndarray:
+        """코사인 유사도 계산용 단위 행 벡터 (영벡터는 그대로 두어 유사도 0)"""
+        norms = np.sqrt(np.sum(matrix * matrix, axis=1, dtype=np.float64))
+        return (matrix / np.where(norms == 0, 1.0, norms)[:, None]).astype(matrix.dtype)
     
     def calculate_similarity(self, features1: np.ndarray, features2: np.ndarray) -> float:
         """
@@ -106,54 +199,40 @@ class IssueClusterer:
                 details={"reason": "No issues to cluster"}
             )
         
-        # 특징 벡터 추출
-        features_map = {}
-        for issue in issues:
-            issue_id = issue.get("id")
-            if issue_id:
-                features_map[issue_id] = self.extract_features(issue)
+        # 특징 행렬 추출
+        issue_ids, matrix = self._unique_feature_matrix(issues)
+        unit = self._normalized_rows(matrix)
         
-        # 클러스터 생성
+        # 클러스터 생성 (시작 이슈와 미할당 이슈들의 유사도를 한 번에 계산)
         clusters: List[Cluster] = []
-        assigned = set()
+        unassigned = np.ones(len(issue_ids), dtype=bool)
         
-        for issue_id, features in features_map.items():
-            if issue_id in assigned:
+        for seed in range(len(issue_ids)):
+            if not unassigned[seed]:
                 continue
+            unassigned[seed] = False
             
-            # 새 클러스터 시작
-            cluster_issues = [issue_id]
-            assigned.add(issue_id)
+            candidates = np.flatnonzero(unassigned)
+            similarities = np.clip(unit[candidates] @ unit[seed], 0.0, 1.0)
+            members = np.concatenate([[seed], candidates[similarities >= self.similarity_threshold]])
+            unassigned[members] = False
             
-            # 유사한 이슈 찾기
-            for other_id, other_features in features_map.items():
-                if other_id in assigned:
-                    continue
-                
-                similarity = self.calculate_similarity(features, other_features)
-                if similarity >= self.similarity_threshold:
-                    cluster_issues.append(other_id)
-                    assigned.add(other_id)
+            centroid = np.mean(matrix[members], axis=0, dtype=np.float64).tolist()
             
-            # 클러스터 생성
-            cluster_features = [features_map[iid] for iid in cluster_issues]
-            centroid = np.mean(cluster_features, axis=0).tolist()
-            
-            # 평균 유사도 계산
-            similarities = []
-            for i, iid1 in enumerate(cluster_issues):
-                for iid2 in cluster_issues[i+1:]:
-                    sim = self.calculate_similarity(
-                        features_map[iid1],
-                        features_map[iid2]
-                    )
-                    similarities.append(sim)
-            
-            avg_similarity = np.mean(similarities) if similarities else 1.0
+            # 평균 쌍별 유사도 계산 (_build_clusters와 같은 선형 공식, 쌍별 행렬을 만들지 않음)
+            m = len(members)
+            if m > 1:
+                member_units = unit[members].astype(np.float64)
+                unit_sum = member_units.sum(axis=0)
+                avg_similarity = np.clip(
+                    (np.dot(unit_sum, unit_sum) - np.sum(member_units * member_units)) / (m * (m - 1)), 0.0, 1.0
+                )
+            else:
+                avg_similarity = 1.0
             
             cluster = Cluster(
                 id=f"cluster-{len(clusters)}",
-                issues=cluster_issues,
+                issues=[issue_ids[m] for m in members],
                 centroid={f"feature_{i}": val for i, val in enumerate(centroid)},
                 similarity_score=float(avg_similarity)
             )
@@ -169,21 +248,401 @@ class IssueClusterer:
             }
         )
     
-    def cluster(self, issues: List[Dict[str, Any]], method: str = "simple") -> ClusteringResult:
+    def cluster_minibatch_kmeans(
+        self,
+        issues: List[Dict[str, Any]],
+        n_clusters: Optional[int] = None,
+        batch_size: int = 1024,
+        max_iterations: int = 100,
+        time_budget: Optional[float] = None,
+        tol: float = 1e-4,
+        seed: int = 0
+    ) -> ClusteringResult:
+        """
+        k-means++ 초기화 후 미니 배치 k-means로 클러스터링합니다.
+        
+        이슈는 ID 순으로 정렬한 뒤 처리하므로 결과가 입력 순서에 의존하지 않습니다.
+        시간 예산은 호출 전체(특징 추출, 초기화, 중심 갱신, 최종 배정)에 적용됩니다. 중심 갱신은
+        측정한 배정 비용만큼 시간을 남기고 멈추며, 특징 추출과 배정은 항상 끝까지 수행하므로
+        예산을 넘긴 경우 details["budget_exceeded"]가 True입니다.
+        
+        Args:
+            issues: 이슈 리스트
+            n_clusters: 클러스터 수 (None이면 sqrt(n/2))
+            batch_size: 반복당 표본 수
+            max_iterations: 최대 반복 횟수
+            time_budget: 호출 전체에 쓸 최대 시간 (초, None이면 제한 없음)
+            tol: 중심 이동량이 이 값보다 작으면 수렴으로 판단
+            seed: 난수 시드
+        
+        Returns:
+            ClusteringResult: 클러스터링 결과
+        """
+        started = time.perf_counter()
+        deadline = started + time_budget if time_budget is not None else None
+        issue_ids, matrix = self._sorted_feature_matrix(issues)
+        if len(issue_ids) == 0:
+            return ClusteringResult(
+                clusters=[],
+                method="minibatch_kmeans",
+                details={"reason": "No issues to cluster"}
+            )
+        
+        k = self._default_cluster_count(len(issue_ids), n_clusters)
+        rng = np.random.default_rng(seed)
+        
+        centers, iterations, converged = self._minibatch_kmeans(
+            matrix, k, batch_size, max_iterations, deadline, tol, rng, reserve_points=len(matrix)
+        )
+        labels, distances = self._assign(matrix, centers)
+        clusters, _ = self._build_clusters(issue_ids, matrix, labels, len(centers))
+        elapsed = time.perf_counter() - started
+        
+        return ClusteringResult(
+            clusters=clusters,
+            method="minibatch_kmeans",
+            details={
+                "total_issues": len(issue_ids),
+                "total_clusters": len(clusters),
+                "n_clusters": k,
+                "iterations": iterations,
+                "converged": converged,
+                "inertia": float(distances.sum(dtype=np.float64)),
+                "elapsed_seconds": elapsed,
+                "time_budget": time_budget,
+                "budget_exceeded": time_budget is not None and elapsed > time_budget
+            }
+        )
+    
+    def cluster_hierarchical(
+        self,
+        issues: List[Dict[str, Any]],
+        n_clusters: Optional[int] = None,
+        coarse_clusters: Optional[int] = None,
+        batch_size: int = 1024,
+        max_iterations: int = 100,
+        time_budget: Optional[float] = None,
+        tol: float = 1e-4,
+        seed: int = 0
+    ) -> ClusteringResult:
+        """
+        2단계 계층 클러스터링: 미니 배치 k-means로 거친 버킷을 만든 뒤 버킷 안에서 다시 나눕니다.
+        
+        세부 클러스터 수는 버킷 크기에 비례하여 배분되고, 각 이슈는 전체 중심 대신
+        coarse_clusters + 버킷 내 중심과만 거리를 계산합니다. 시간 예산은 호출 전체에 적용되며,
+        특징 추출 후 남은 시간의 1/4은 거친 단계에, 나머지는 버킷 크기에 비례하여 세부 단계에
+        배분됩니다. 각 단계는 배정 시간을 남기고 중심 갱신을 멈추며, 예산을 넘긴 경우
+        details["budget_exceeded"]가 True입니다.
+        
+        Args:
+            issues: 이슈 리스트
+            n_clusters: 최종 클러스터 수 (None이면 sqrt(n/2))
+            coarse_clusters: 거친 버킷 수 (None이면 sqrt(n_clusters))
+            batch_size: 반복당 표본 수
+            max_iterations: 단계(버킷)별 최대 반복 횟수
+            time_budget: 호출 전체에 쓸 최대 시간 (초, None이면 제한 없음)
+            tol: 수렴 판단 중심 이동량
+            seed: 난수 시드
+        
+        Returns:
+            ClusteringResult: 클러스터링 결과 (details["hierarchy"]에 버킷별 클러스터 ID)
+        """
+        started = time.perf_counter()
+        deadline = started + time_budget if time_budget is not None else None
+        issue_ids, matrix = self._sorted_feature_matrix(issues)
+        if len(issue_ids) == 0:
+            return ClusteringResult(
+                clusters=[],
+                method="hierarchical",
+                details={"reason": "No issues to cluster"}
+            )
+        
+        n = len(issue_ids)
+        k = self._default_cluster_count(n, n_clusters)
+        coarse_k = min(coarse_clusters or max(1, int(round(np.sqrt(k)))), k)
+        rng = np.random.default_rng(seed)
+        
+        coarse_deadline = None
+        if deadline is not None:
+            now = time.perf_counter()
+            coarse_deadline = now + max(deadline - now, 0.0) / 4
+        coarse_centers, coarse_iterations, _ = self._minibatch_kmeans(
+            matrix, coarse_k, batch_size, max_iterations, coarse_deadline, tol, rng, reserve_points=n
+        )
+        buckets, _ = self._assign(matrix, coarse_centers)
+        
+        labels = np.empty(n, dtype=np.int64)
+        distances = np.empty(n, dtype=np.float64)
+        bucket_labels: Dict[int, range] = {}
+        fine_iterations = 0
+        next_label = 0
+        remaining = n
+        for bucket in np.unique(buckets):
+            members = np.flatnonzero(buckets == bucket)
+            sub = matrix[members]
+            
+            bucket_deadline = None
+            if deadline is not None:
+                now = time.perf_counter()
+                bucket_deadline = now + max(deadline - now, 0.0) * len(members) / remaining
+            remaining -= len(members)
+            
+            bucket_k = min(max(1, int(round(k * len(members) / n))), len(members))
+            centers, iterations, _ = self._minibatch_kmeans(
+                sub, bucket_k, batch_size, max_iterations, bucket_deadline, tol, rng,
+                reserve_points=len(members)
+            )
+            fine_iterations += iterations
+            sub_labels, sub_distances = self._assign(sub, centers)
+            labels[members] = sub_labels + next_label
+            distances[members] = sub_distances
+            bucket_labels[int(bucket)] = range(next_label, next_label + len(centers))
+            next_label += len(centers)
+        
+        clusters, label_ids = self._build_clusters(issue_ids, matrix, labels, next_label)
+        elapsed = time.perf_counter() - started
+        hierarchy = {
+            f"bucket-{position}": [label_ids[label] for label in label_range if label in label_ids]
+            for position, label_range in enumerate(bucket_labels.values())
+        }
+        
+        return ClusteringResult(
+            clusters=clusters,
+            method="hierarchical",
+            details={
+                "total_issues": n,
+                "total_clusters": len(clusters),
+                "n_clusters": k,
+                "coarse_clusters": len(bucket_labels),
+                "coarse_iterations": coarse_iterations,
+                "fine_iterations": fine_iterations,
+                "inertia": float(distances.sum()),
+                "hierarchy": hierarchy,
+                "elapsed_seconds": elapsed,
+                "time_budget": time_budget,
+                "budget_exceeded": time_budget is not None and elapsed > time_budget
+            }
+        )
+    
+    def _sorted_feature_matrix(self, issues: List[Dict[str, Any]]) -> Tuple[List[str], np.ndarray]:
+        """
+        ID 순으로 정렬한 특징 행렬 (입력 순서와 무관한 결과를 위해)
+        
+        _unique_feature_matrix와 같이 중복 ID는 마지막 이슈의 특징을 사용하며, 정렬과 중복 제거를
+        뒤집은 ID 배열의 np.unique 한 번으로 처리합니다.
+        """
+        features = self.extract_feature_matrix(issues)
+        if len(features) == 0:
+            return [], features.to_matrix()
+        reversed_ids = np.array(features.issue_ids)[::-1]
+        unique_ids, first_reversed = np.unique(reversed_ids, return_index=True)
+        positions = len(reversed_ids) - 1 - first_reversed
+        return unique_ids.tolist(), features.to_matrix()[positions]
+    
+    @staticmethod
+    def _default_cluster_count(n: int, n_clusters: Optional[int]) -> int:
+        if n_clusters is None:
+            n_clusters = int(round(np.sqrt(n / 2)))
+        return min(max(n_clusters, 1), n)
+    
+    @staticmethod
+    def _squared_distances(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+        """(점 x 중심) 제곱 유클리드 거리 (||x||² - 2x·c + ||c||²)"""
+        centers = centers.astype(points.dtype, copy=False)
+        distances = (
+            np.sum(points * points, axis=1, dtype=np.float64)[:, None]
+            - 2.0 * (points @ centers.T)
+            + np.sum(centers * centers, axis=1, dtype=np.float64)[None, :]
+        )
+        return np.maximum(distances, 0.0)
+    
+    def _assign(self, points: np.ndarray, centers: np.ndarray,
+                chunk_size: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        각 점을 가장 가까운 중심에 배정합니다.
+        
+        ||x||²는 argmin에 영향이 없으므로 (||c||² - 2x·c)로 배정한 뒤 선택된 거리에만 더합니다.
+        청크는 (청크 x 중심) 행렬이 캐시에 머물 정도로 작게 유지합니다 (기본 약 128K 원소).
+        
+        Returns:
+            (라벨 배열, 제곱 거리 배열)
+        """
+        if chunk_size is None:
+            chunk_size = max(256, (1 << 17) // max(len(centers), 1))
+        centers = centers.astype(points.dtype, copy=False)
+        scaled_centers = np.ascontiguousarray(-2.0 * centers.T)
+        center_norms = np.sum(centers * centers, axis=1, dtype=np.float64)
+        labels = np.empty(len(points), dtype=np.int64)
+        distances = np.empty(len(points), dtype=np.float64)
+        for start in range(0, len(points), chunk_size):
+            block = points[start:start + chunk_size]
+            scores = block @ scaled_centers + center_norms
+            block_labels = scores.argmin(axis=1)
+            labels[start:start + chunk_size] = block_labels
+            distances[start:start + chunk_size] = np.maximum(
+                scores[np.arange(len(block)), block_labels] + np.sum(block * block, axis=1, dtype=np.float64), 0.0
+            )
+        return labels, distances
+    
+    def _kmeans_plus_plus(self, points: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        k-means++ 초기 중심을 선택합니다.
+        
+        서로 다른 점이 k개보다 적으면 더 적은 수의 중심을 반환합니다.
+        """
+        centers = [points[rng.integers(len(points))].astype(np.float64)]
+        closest = self._squared_distances(points, centers[0][None, :])[:, 0]
+        for _ in range(1, k):
+            cumulative = np.cumsum(closest)
+            total = cumulative[-1]
+            if total <= 0:
+                break
+            index = min(int(np.searchsorted(cumulative, rng.random() * total, side="right")), len(points) - 1)
+            centers.append(points[index].astype(np.float64))
+            closest = np.minimum(closest, self._squared_distances(points, centers[-1][None, :])[:, 0])
+        return np.array(centers)
+    
+    def _minibatch_kmeans(
+        self,
+        points: np.ndarray,
+        k: int,
+        batch_size: int,
+        max_iterations: int,
+        deadline: Optional[float],
+        tol: float,
+        rng: np.random.Generator,
+        reserve_points: int = 0
+    ) -> Tuple[np.ndarray, int, bool]:
+        """
+        미니 배치 k-means 중심을 계산합니다 (중심별 누적 평균 갱신, Sculley 2010).
+        
+        deadline이 있으면 초기 중심으로 표본 블록을 배정하여 점당 배정 비용을 측정하고,
+        reserve_points개를 배정할 시간(클러스터 구성 비용을 포함해 1.5배)을 남기고 중심 갱신을 멈춥니다.
+        
+        Returns:
+            (중심 배열, 수행한 반복 수, 수렴 여부)
+        """
+        n = len(points)
+        # 초기화는 표본에서 수행하여 큰 입력에서도 O(k x 표본)으로 제한
+        seed_size = min(n, max(10 * k, 4 * batch_size))
+        seed_points = points[rng.choice(n, size=seed_size, replace=False)] if seed_size < n else points
+        centers = self._kmeans_plus_plus(seed_points, k, rng)
+        counts = np.zeros(len(centers), dtype=np.int64)
+        
+        reserve = 0.0
+        if deadline is not None and reserve_points:
+            # 첫 실행은 캐시가 차가워 느리므로 두 번 측정한 최솟값 사용
+            probe = seed_points[:2048]
+            probe_seconds = []
+            for _ in range(2):
+                probe_started = time.perf_counter()
+                self._assign(probe, centers)
+                probe_seconds.append(time.perf_counter() - probe_started)
+            reserve = 1.5 * min(probe_seconds) * reserve_points / len(probe)
+        
+        iterations = 0
+        converged = False
+        while iterations < max_iterations:
+            if deadline is not None and time.perf_counter() + reserve >= deadline:
+                break
+            batch = points[rng.integers(0, n, size=min(batch_size, n))]
+            labels = self._squared_distances(batch, centers).argmin(axis=1)
+            
+            batch_counts = np.bincount(labels, minlength=len(centers))
+            batch_sums = np.zeros_like(centers)
+            np.add.at(batch_sums, labels, batch)
+            
+            hit = batch_counts > 0
+            counts[hit] += batch_counts[hit]
+            updated = centers.copy()
+            updated[hit] += (batch_sums[hit] - batch_counts[hit, None] * centers[hit]) / counts[hit, None]
+            shift = float(np.max(np.abs(updated - centers)))
+            centers = updated
+            iterations += 1
+            if shift < tol:
+                converged = True
+                break
+        
+        return centers, iterations, converged
+    
+    def _build_clusters(self, issue_ids: List[str], matrix: np.ndarray, labels: np.ndarray,
+                        n_labels: int) -> Tuple[List[Cluster], Dict[int, str]]:
+        """
+        라벨별 Cluster를 만듭니다 (빈 라벨은 제외).
+        
+        평균 쌍별 코사인 유사도는 단위 벡터 합 S에 대해 (|S|² - Σ|u|²) / (m(m-1))로 계산하므로
+        클러스터 크기에 대해 선형입니다 (특징이 모두 0 이상이라 유사도는 잘리지 않음).
+        
+        Returns:
+            (클러스터 리스트, 라벨 → 클러스터 ID)
+        """
+        unit = self._normalized_rows(matrix).astype(np.float64)
+        counts = np.bincount(labels, minlength=n_labels)
+        sums = np.zeros((n_labels, matrix.shape[1]))
+        np.add.at(sums, labels, matrix.astype(np.float64))
+        unit_sums = np.zeros((n_labels, matrix.shape[1]))
+        np.add.at(unit_sums, labels, unit)
+        unit_norms = np.bincount(labels, weights=np.sum(unit * unit, axis=1), minlength=n_labels)
+        
+        # 라벨 순으로 정렬한 ID를 클러스터별 구간으로 잘라 리스트로 변환 (이슈별 파이썬 인덱싱 없음)
+        order = np.argsort(labels, kind="stable")
+        grouped_ids = np.asarray(issue_ids, dtype=object)[order]
+        ends = np.cumsum(counts)
+        
+        clusters: List[Cluster] = []
+        label_ids: Dict[int, str] = {}
+        for label in range(n_labels):
+            m = counts[label]
+            if m == 0:
+                continue
+            if m > 1:
+                similarity = (np.dot(unit_sums[label], unit_sums[label]) - unit_norms[label]) / (m * (m - 1))
+            else:
+                similarity = 1.0
+            centroid = sums[label] / m
+            cluster_id = f"cluster-{len(clusters)}"
+            label_ids[label] = cluster_id
+            clusters.append(Cluster(
+                id=cluster_id,
+                issues=grouped_ids[ends[label] - m:ends[label]].tolist(),
+                centroid={f"feature_{i}": float(val) for i, val in enumerate(centroid)},
+                similarity_score=float(np.clip(similarity, 0.0, 1.0))
+            ))
+        return clusters, label_ids
+    
+    def cluster(self, issues: List[Dict[str, Any]], method: str = "simple", **kwargs) -> ClusteringResult:
         """
         이슈들을 클러스터링합니다.
         
         Args:
             issues: 이슈 리스트
-            method: 클러스터링 방법
+            method: 클러스터링 방법 ("simple", "minibatch_kmeans", "hierarchical")
+            **kwargs: 방법별 파라미터 (n_clusters, batch_size, max_iterations, time_budget 등,
+                "simple"은 파라미터 없음)
         
         Returns:
             ClusteringResult: 클러스터링 결과
+        
+        Raises:
+            ValueError: 알 수 없는 방법이거나 방법이 지원하지 않는 파라미터를 전달한 경우
         """
-        if method == "simple":
-            return self.cluster_simple(issues)
-        else:
+        methods = {
+            "simple": self.cluster_simple,
+            "minibatch_kmeans": self.cluster_minibatch_kmeans,
+            "hierarchical": self.cluster_hierarchical,
+        }
+        cluster_method = methods.get(method)
+        if cluster_method is None:
             raise ValueError(f"Unknown clustering method: {method}")
+        
+        supported = [name for name in inspect.signature(cluster_method).parameters if name != "issues"]
+        unsupported = sorted(set(kwargs) - set(supported))
+        if unsupported:
+            raise ValueError(
+                f"Unsupported parameters for {method} clustering: {', '.join(unsupported)} "
+                f"(supported: {', '.join(supported) or 'none'})"
+            )
+        return cluster_method(issues, **kwargs)
 
 
 
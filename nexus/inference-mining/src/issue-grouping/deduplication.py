@@ -0,0 +1,233 @@
+"""
+Issue Deduplication
+
+MinHash LSH로 제목/설명과 증거 신호가 거의 같은 이슈를 찾아냅니다.
+후보 검색은 밴드 버킷 조회로 이루어지므로 저장된 이슈 수에 대해 준선형 시간입니다.
+"""
+
+import hashlib
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+@dataclass
+class DeduplicationResult:
+    """중복 검사 결과"""
+    is_duplicate: bool
+    duplicate_of: Optional[str]
+    similarity: float
+    signature: np.ndarray = field(repr=False)
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+class IssueDeduplicator:
+    """MinHash LSH 기반 이슈 중복 제거기"""
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        mode: str = "merge",
+        seed: int = 1,
+        max_signal_shingles: int = 64
+    ):
+        """
+        Args:
+            similarity_threshold: 중복으로 판단할 추정 Jaccard 유사도 (0-1)
+            num_perm: MinHash 해시 함수 수
+            bands: LSH 밴드 수 (num_perm의 약수)
+            shingle_size: 문자 shingle 길이
+            mode: 중복 처리 방식 ("merge": 기존 이슈에 병합, "reject": 새 이슈 폐기)
+            seed: 해시 계수 난수 시드
+            max_signal_shingles: shingle로 사용할 최대 증거 신호 수 (서명 계산 비용 상한)
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        if mode not in ("merge", "reject"):
+            raise ValueError(f"Unknown deduplication mode: {mode}")
+
+        self.similarity_threshold = similarity_threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.mode = mode
+        self.max_signal_shingles = max_signal_shingles
+
+        # multiply-shift 해시: h(x) = ((a * x + b) mod 2^64) >> 32, a는 홀수
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = {}
+        self._signatures: Dict[str, np.ndarray] = {}
+
+        self._checked = 0
+        self._duplicates = 0
+        self._lookup_seconds = 0.0
+        self._max_lookup_seconds = 0.0
+
+    def shingles(self, issue: Dict[str, Any]) -> Set[str]:
+        """
+        이슈에서 shingle 집합을 생성합니다.
+
+        제목과 설명은 소문자/공백 정규화 후 문자 n-gram으로, 증거 신호는 ID 단위로 사용합니다.
+        증거 신호는 관련도 순으로 정렬되어 있으므로 앞의 max_signal_shingles개만 사용하여
+        신호가 많은 이슈에서도 해싱 비용과 서명 행렬 크기를 제한합니다.
+
+        Args:
+            issue: 이슈 딕셔너리
+
+        Returns:
+            shingle 집합
+        """
+        text = f"{issue.get('title', '')} {issue.get('description', '')}"
+        text = re.sub(r"\s+", " ", text.lower()).strip()
+
+        result: Set[str] = set()
+        if len(text) <= self.shingle_size:
+            if text:
+                result.add(text)
+        else:
+            for i in range(len(text) - self.shingle_size + 1):
+                result.add(text[i:i + self.shingle_size])
+
+        for signal in issue.get("evidence", {}).get("signals", [])[:self.max_signal_shingles]:
+            signal_id = signal.get("signalId")
+            if signal_id:
+                result.add(f"signal:{signal_id}")
+
+        return result
+
+    def signature(self, shingles: Set[str]) -> np.ndarray:
+        """
+        shingle 집합의 MinHash 서명을 계산합니다.
+
+        Args:
+            shingles: shingle 집합
+
+        Returns:
+            길이 num_perm의 uint64 서명
+        """
+        if not shingles:
+            return np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+             for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) >> np.uint64(32)
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def find_duplicate(self, issue: Dict[str, Any],
+                       signature: Optional[np.ndarray] = None) -> DeduplicationResult:
+        """
+        색인된 이슈 중 가장 유사한 중복 후보를 찾습니다.
+
+        Args:
+            issue: 검사할 이슈
+            signature: 미리 계산한 MinHash 서명 (None이면 이슈로부터 계산)
+
+        Returns:
+            DeduplicationResult: 중복 검사 결과
+        """
+        started = time.perf_counter()
+        if signature is None:
+            signature = self.signature(self.shingles(issue))
+
+        candidates: Set[str] = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        candidates.discard(issue.get("id"))
+
+        best_id = None
+        best_similarity = 0.0
+        if candidates:
+            # 후보 서명을 쌓아 한 번에 비교 (후보마다 NumPy 호출을 하지 않음)
+            candidate_ids = list(candidates)
+            stacked = np.stack([self._signatures[candidate_id] for candidate_id in candidate_ids])
+            similarities = np.count_nonzero(stacked == signature, axis=1) / self.num_perm
+            best = int(np.argmax(similarities))
+            if similarities[best] > 0.0:
+                best_id, best_similarity = candidate_ids[best], float(similarities[best])
+
+        is_duplicate = best_id is not None and best_similarity >= self.similarity_threshold
+
+        elapsed = time.perf_counter() - started
+        self._checked += 1
+        self._lookup_seconds += elapsed
+        self._max_lookup_seconds = max(self._max_lookup_seconds, elapsed)
+        if is_duplicate:
+            self._duplicates += 1
+
+        return DeduplicationResult(
+            is_duplicate=is_duplicate,
+            duplicate_of=best_id if is_duplicate else None,
+            similarity=best_similarity,
+            signature=signature,
+            details={
+                "candidates": len(candidates),
+                "lookup_ms": elapsed * 1000,
+                "threshold": self.similarity_threshold
+            }
+        )
+
+    def add(self, issue_id: str, signature: np.ndarray):
+        """
+        이슈 서명을 LSH 색인에 추가합니다.
+
+        Args:
+            issue_id: 이슈 ID
+            signature: find_duplicate가 반환한 MinHash 서명
+        """
+        if issue_id in self._signatures:
+            self.remove(issue_id)
+        self._signatures[issue_id] = signature
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, set()).add(issue_id)
+
+    def get_signature(self, issue_id: str) -> Optional[np.ndarray]:
+        """색인된 이슈의 MinHash 서명을 반환합니다 (없으면 None)."""
+        return self._signatures.get(issue_id)
+
+    def remove(self, issue_id: str):
+        """이슈를 LSH 색인에서 제거합니다."""
+        signature = self._signatures.pop(issue_id, None)
+        if signature is None:
+            return
+        for key in self._band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(issue_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def clear(self):
+        """색인을 초기화합니다 (지표는 유지)."""
+        self._buckets = {}
+        self._signatures = {}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """중복 제거율과 조회 지연 지표를 반환합니다."""
+        return {
+            "checked": self._checked,
+            "duplicates": self._duplicates,
+            "dedup_rate": self._duplicates / self._checked if self._checked else 0.0,
+            "indexed_issues": len(self._signatures),
+            "avg_lookup_ms": self._lookup_seconds / self._checked * 1000 if self._checked else 0.0,
+            "max_lookup_ms": self._max_lookup_seconds * 1000,
+        }
@@ -2,9 +2,10 @@
 Issue Grouping Package
 """
 
-from .clustering import IssueClusterer, ClusteringResult, Cluster
+from .clustering import IssueClusterer, ClusteringResult, Cluster, IssueFeatures
+from .deduplication import IssueDeduplicator, DeduplicationResult
 
-__all__ = ['IssueClusterer', 'ClusteringResult', 'Cluster']
+__all__ = ['IssueClusterer', 'ClusteringResult', 'Cluster', 'IssueFeatures', 'IssueDeduplicator', 'DeduplicationResult']
 
 
 
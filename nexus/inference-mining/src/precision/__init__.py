@@ -0,0 +1,8 @@
+"""
+Precision Package
+"""
+
+from .precision_mode import PRECISIONS, storage_dtype
+from .drift_report import DRIFT_TOLERANCES, check_tolerances, precision_drift_report
+
+__all__ = ['PRECISIONS', 'storage_dtype', 'DRIFT_TOLERANCES', 'check_tolerances', 'precision_drift_report']
@@ -0,0 +1,285 @@
+"""
+Precision Drift Report
+
+같은 합성 데이터를 float64와 float32 모드로 분석하여 결과 차이(Z-score, 기울기, R², 상관계수,
+판정 뒤집힘, 클러스터 배정)를 비교하고, 메모리는 실제 배열의 nbytes, 지속 이력의 보유량과
+분석 중 최대 할당량(tracemalloc)으로 측정합니다. 차이는 DRIFT_TOLERANCES와 비교하여
+violations로 보고하며, 모듈을 직접 실행하면 허용치를 넘을 때 0이 아닌 코드로 종료합니다.
+타임스탬프는 실제 신호처럼 밀리초 단위 에포크 값을 사용합니다.
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+# float32 모드의 허용 오차 (비교 방향: max_*는 이하, min_*는 이상)
+DRIFT_TOLERANCES = {
+    "max_z_score_abs_error": 1e-3,
+    "max_slope_relative_error": 1e-3,
+    "max_r_squared_abs_error": 1e-4,
+    "max_correlation_abs_error": 1e-4,
+    "max_decision_flips": 0,
+    "max_direction_flips": 0,
+    "min_cluster_agreement": 0.999,
+}
+
+
+def _relative_error(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    scale = np.maximum(np.abs(reference), 1e-12)
+    return np.abs(candidate - reference) / scale
+
+
+def _synthetic_issues(n_issues: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    from ..issue_grouping.clustering import PRIORITY_LEVELS
+
+    priorities = rng.choice(PRIORITY_LEVELS, size=n_issues)
+    return [
+        {
+            "id": f"issue-{i}",
+            "priority": str(priorities[i]),
+            "categories": ["governance"] * int(rng.integers(0, 6)),
+            "evidence": {
+                "signals": [],
+                "signalSummary": {"totalSignals": int(rng.integers(0, 20))},
+                "statisticalEvidence": {"anomalyScore": float(rng.random())}
+            }
+        }
+        for i in range(n_issues)
+    ]
+
+
+def _cluster_labels(result, issue_ids: List[str]) -> np.ndarray:
+    labels = {}
+    for position, cluster in enumerate(result.clusters):
+        for issue_id in cluster.issues:
+            labels[issue_id] = position
+    return np.array([labels[issue_id] for issue_id in issue_ids])
+
+
+def _rand_index(left: np.ndarray, right: np.ndarray) -> float:
+    """두 배정이 같은 클러스터/다른 클러스터로 판단한 이슈 쌍의 비율 (클러스터 번호와 무관)"""
+    n = len(left)
+    if n < 2:
+        return 1.0
+    _, left_codes = np.unique(left, return_inverse=True)
+    _, right_codes = np.unique(right, return_inverse=True)
+    contingency = np.zeros((left_codes.max() + 1, right_codes.max() + 1), dtype=np.int64)
+    np.add.at(contingency, (left_codes, right_codes), 1)
+
+    def same_pairs(counts: np.ndarray) -> int:
+        return int(np.sum(counts * (counts - 1) // 2))
+
+    both = same_pairs(contingency)
+    left_only = same_pairs(contingency.sum(axis=1)) - both
+    right_only = same_pairs(contingency.sum(axis=0)) - both
+    total = n * (n - 1) // 2
+    return 1.0 - (left_only + right_only) / total
+
+
+def _retained_allocation(build) -> int:
+    """build()가 반환한 객체가 유지하는 바이트 수 (반환값을 잡은 상태에서 측정)"""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        retained = build()
+        size = tracemalloc.get_traced_memory()[0] - baseline
+        del retained
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def check_tolerances(report: Dict[str, Any], tolerances: Dict[str, float] = DRIFT_TOLERANCES) -> List[str]:
+    """
+    리포트의 오차를 허용치와 비교합니다.
+
+    Args:
+        report: precision_drift_report()의 결과
+        tolerances: 허용치 (DRIFT_TOLERANCES 형식)
+
+    Returns:
+        허용치를 넘은 항목 설명 리스트 (비어 있으면 통과)
+    """
+    measured = {
+        "max_z_score_abs_error": report["anomaly"]["max_z_score_abs_error"],
+        "max_slope_relative_error": report["trend"]["max_slope_relative_error"],
+        "max_r_squared_abs_error": report["trend"]["max_r_squared_abs_error"],
+        "max_correlation_abs_error": report["correlation"]["max_correlation_abs_error"],
+        "max_decision_flips": report["anomaly"]["decision_flips"],
+        "max_direction_flips": report["trend"]["direction_flips"],
+        "min_cluster_agreement": report["clustering"]["pair_agreement"],
+    }
+    violations = []
+    for name, limit in tolerances.items():
+        value = measured[name]
+        exceeded = value < limit if name.startswith("min_") else value > limit
+        if exceeded:
+            violations.append(f"{name}: {value} (limit {limit})")
+    return violations
+
+
+def _peak_allocation(analyze) -> int:
+    """analyze() 실행 중 추가로 할당된 최대 바이트 수 (NumPy 배열 포함)"""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        analyze()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def precision_drift_report(n_series: int = 200, length: int = 2000, n_issues: int = 2000,
+                           seed: int = 0) -> Dict[str, Any]:
+    """
+    float32 모드의 결과 차이와 메모리 사용량을 측정합니다.
+
+    Args:
+        n_series: 이상 탐지/트렌드 분석에 사용할 시계열 수
+        length: 시계열 길이
+        n_issues: 클러스터링할 이슈 수
+        seed: 난수 시드
+
+    Returns:
+        단계별 오차 통계와 측정된 메모리 사용량
+    """
+    from ..anomaly_detection.correlation import CorrelationEngine
+    from ..anomaly_detection.statistical_detector import StatisticalDetector
+    from ..issue_grouping.clustering import IssueClusterer
+    from ..streaming_ingestion.ndjson_stream import MetricHistory, project_columns
+    from ..trend_analysis.time_series import TimeSeriesAnalyzer
+
+    rng = np.random.default_rng(seed)
+    start_ms = int(time.time() * 1000)
+    timestamps = (start_ms + np.arange(length) * 60_000).tolist()
+
+    detectors = {p: StatisticalDetector(precision=p) for p in ("float64", "float32")}
+    analyzers = {p: TimeSeriesAnalyzer(precision=p) for p in ("float64", "float32")}
+
+    z_scores = {p: [] for p in detectors}
+    anomaly_flags = {p: [] for p in detectors}
+    slopes = {p: [] for p in analyzers}
+    r_squared = {p: [] for p in analyzers}
+    directions = {p: [] for p in analyzers}
+    series = []
+
+    for _ in range(n_series):
+        # 큰 기준값 + 작은 변동 + 약한 추세: float32 반올림 오차가 가장 잘 드러나는 형태
+        level = rng.uniform(1e2, 1e5)
+        noise = rng.normal(0.0, level * 1e-3, size=length)
+        drift = np.arange(length) * rng.normal(0.0, level * 1e-6)
+        values = level + drift + noise
+        if rng.random() < 0.1:
+            values[-1] += level * 5e-3
+        values = values.tolist()
+        series.append(values)
+
+        for precision in detectors:
+            anomaly = detectors[precision].detect(values)
+            z_scores[precision].append(anomaly.details.get("z_score", 0.0))
+            anomaly_flags[precision].append(bool(anomaly.is_anomaly))
+
+            trend = analyzers[precision].detect_trend(values, timestamps)
+            slopes[precision].append(trend.slope)
+            r_squared[precision].append(trend.details.get("r_squared", 0.0))
+            directions[precision].append(trend.direction)
+
+    z64, z32 = np.array(z_scores["float64"]), np.array(z_scores["float32"])
+    s64, s32 = np.array(slopes["float64"]), np.array(slopes["float32"])
+    r64, r32 = np.array(r_squared["float64"]), np.array(r_squared["float32"])
+
+    # 입력 리스트는 두 모드가 같으므로, 분석 중 만드는 작업 배열의 최대 할당량만 비교
+    peak_bytes = {
+        p: _peak_allocation(lambda: (detectors[p].detect(values), analyzers[p].detect_trend(values, timestamps)))
+        for p in detectors
+    }
+
+    # 상관 엔진: 같은 (틱 x 메트릭) 행렬의 윈도우를 두 모드로 저장하고 모든 쌍의 상관계수 비교
+    metric_keys = [f"metric-{i}" for i in range(n_series)]
+    engines = {p: CorrelationEngine(window_size=256, precision=p) for p in detectors}
+    matrix = np.array(series).T
+    correlation_errors = [0.0]
+    for precision in engines:
+        engines[precision].update_matrix(matrix, metric_keys)
+    correlations = {
+        p: engines[p].top_correlated_many(metric_keys, k=n_series) for p in engines
+    }
+    for key in correlations["float64"]:
+        reference = {item["metricKey"]: item["correlation"] for item in correlations["float64"][key]}
+        candidate = {item["metricKey"]: item["correlation"] for item in correlations["float32"].get(key, [])}
+        correlation_errors.extend(abs(reference[k] - candidate.get(k, 0.0)) for k in reference)
+
+    # 지속 이력: 메트릭별 신호 딕셔너리 리스트와 열 단위 MetricHistory의 보유량
+    signal_ids = [f"signal-{i}" for i in range(length)]
+    history_bytes = {
+        "signals": _retained_allocation(
+            lambda: [project_columns(key, signal_ids, timestamps, values) for key, values in zip(metric_keys, series)]
+        )
+    }
+    for precision in detectors:
+        def build_history(precision=precision):
+            histories = []
+            for values in series:
+                history = MetricHistory(length, precision)
+                history.extend(signal_ids, timestamps, values)
+                histories.append(history)
+            return histories
+        history_bytes[precision] = _retained_allocation(build_history)
+
+    issues = _synthetic_issues(n_issues, rng)
+    clusterers = {p: IssueClusterer(precision=p) for p in ("float64", "float32")}
+    features = {p: clusterers[p].extract_feature_matrix(issues) for p in clusterers}
+    issue_ids = features["float64"].issue_ids
+    labels = {p: _cluster_labels(clusterers[p].cluster(issues), issue_ids) for p in clusterers}
+    matrix64 = features["float64"].to_matrix()
+
+    report = {
+        "anomaly": {
+            "series": n_series,
+            "max_z_score_abs_error": float(np.max(np.abs(z32 - z64))),
+            "mean_z_score_abs_error": float(np.mean(np.abs(z32 - z64))),
+            "decision_flips": int(np.sum(np.array(anomaly_flags["float64"]) != np.array(anomaly_flags["float32"])))
+        },
+        "trend": {
+            "max_slope_relative_error": float(np.max(_relative_error(s64, s32))),
+            "max_r_squared_abs_error": float(np.max(np.abs(r32 - r64))),
+            "direction_flips": int(sum(a != b for a, b in zip(directions["float64"], directions["float32"])))
+        },
+        "clustering": {
+            "issues": len(issue_ids),
+            "clusters_float64": int(labels["float64"].max() + 1) if len(issue_ids) else 0,
+            "clusters_float32": int(labels["float32"].max() + 1) if len(issue_ids) else 0,
+            "assignment_agreement": float(np.mean(labels["float64"] == labels["float32"])) if len(issue_ids) else 1.0,
+            "pair_agreement": _rand_index(labels["float64"], labels["float32"])
+        },
+        "correlation": {
+            "metrics": n_series,
+            "max_correlation_abs_error": float(max(correlation_errors))
+        },
+        "memory_bytes": {
+            "analysis_peak_float64": peak_bytes["float64"],
+            "analysis_peak_float32": peak_bytes["float32"],
+            "feature_matrix_float64": int(matrix64.nbytes),
+            "feature_columns_float32": int(features["float32"].nbytes),
+            "feature_matrix_float32": int(features["float32"].to_matrix().nbytes),
+            "correlation_window_float64": engines["float64"].nbytes,
+            "correlation_window_float32": engines["float32"].nbytes,
+            # 메트릭별 length개 값의 이력 (ID 문자열은 세 경우 모두 공유하므로 제외)
+            "history_signal_dicts": history_bytes["signals"],
+            "history_columns_float64": history_bytes["float64"],
+            "history_columns_float32": history_bytes["float32"]
+        }
+    }
+    report["violations"] = check_tolerances(report)
+    return report
+
+
+if __name__ == "__main__":
+    import json
+    result = precision_drift_report()
+    print(json.dumps(result, indent=2))
+    sys.exit(1 if result["violations"] else 0)
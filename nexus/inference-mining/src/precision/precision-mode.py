@@ -0,0 +1,31 @@
+"""
+Precision Mode
+
+분석 단계가 내부 작업 배열에 사용할 부동소수점 타입을 선택합니다.
+"float32"는 분석 중 만드는 배열만 작게 만들며(입력 이력은 호출자가 보관), 합계/분산/회귀처럼
+오차가 누적되는 계산은 각 단계에서 float64로 누적합니다.
+"""
+
+import numpy as np
+
+
+PRECISIONS = {
+    "float64": np.float64,
+    "float32": np.float32,
+}
+
+
+def storage_dtype(precision: str) -> np.dtype:
+    """
+    정밀도 이름에 해당하는 저장 dtype을 반환합니다.
+
+    Args:
+        precision: "float64" 또는 "float32"
+
+    Returns:
+        NumPy dtype
+    """
+    try:
+        return np.dtype(PRECISIONS[precision])
+    except KeyError:
+        raise ValueError(f"Unknown precision: {precision}") from None
@@ -6,17 +6,22 @@ LLM을 사용하여 제안 초안을 생성합니다.
 
 from typing import List, Dict, Any, Optional
 import json
+import time
+
+from ..caching.result_cache import ResultCache, make_key
 
 
 class ProposalDraftGenerator:
     """제안 초안 생성기"""
     
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, cache: Optional[ResultCache] = None):
         """
         Args:
             llm_client: LLM 클라이언트 (Gemini API 등)
+            cache: 결과 캐시 (None이면 캐시 사용 안 함)
         """
         self.llm_client = llm_client
+        self.cache = cache
     
     def generate_draft(
         self,
@@ -35,7 +40,33 @@ class ProposalDraftGenerator:
         Returns:
             제안 초안 딕셔너리
         """
-        # LLM이 있으면 사용, 없으면 템플릿 기반 생성
+        if self.cache is not None:
+            started = time.perf_counter()
+            # 초안은 이슈 ID/시각이 아닌 내용에만 의존하므로 내용으로 키를 생성
+            evidence = issue.get('evidence', {})
+            key = make_key(
+                "draft",
+                content={field: issue.get(field) for field in
+                         ('title', 'description', 'priority', 'categories', 'suggested_actions')},
+                statistical_evidence=evidence.get('statisticalEvidence'),
+                signal_summary=evidence.get('signalSummary'),
+                evidence_signals=evidence_signals,
+                context=context,
+                llm=bool(self.llm_client)
+            )
+            return self.cache.get_or_compute(
+                key, lambda: self._generate(issue, evidence_signals, context),
+                key_seconds=time.perf_counter() - started
+            )
+        return self._generate(issue, evidence_signals, context)
+    
+    def _generate(
+        self,
+        issue: Dict[str, Any],
+        evidence_signals: List[Dict[str, Any]],
+        context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """LLM이 있으면 사용, 없으면 템플릿 기반 생성"""
         if self.llm_client:
             return self._generate_with_llm(issue, evidence_signals, context)
         else:
@@ -67,7 +98,7 @@ class ProposalDraftGenerator:
             "description": self._build_description(issue, evidence_signals),
             "background": {
                 "issue": issue.get('description', ''),
-                "evidence_count": len(evidence_signals),
+                "evidence_count": self._evidence_count(issue, evidence_signals),
                 "priority": issue.get('priority', 'medium'),
             },
             "proposed_actions": self._extract_actions(issue),
@@ -91,7 +122,7 @@ class ProposalDraftGenerator:
 
 ## 증거
 
-관련 신호 {len(evidence_signals)}개가 수집되었습니다.
+관련 신호 {self._evidence_count(issue, evidence_signals)}개가 수집되었습니다.
 
 ## 제안
 
@@ -99,6 +130,13 @@ class ProposalDraftGenerator:
 """
         return description.strip()
     
+    def _evidence_count(self, issue: Dict[str, Any], evidence_signals: List[Dict[str, Any]]) -> int:
+        """전체 증거 신호 수를 반환합니다 (이슈에 상위 신호만 포함된 경우 요약 사용)."""
+        summary = issue.get('evidence', {}).get('signalSummary')
+        if summary:
+            return summary.get('totalSignals', len(evidence_signals))
+        return len(evidence_signals)
+    
     def _extract_actions(self, issue: Dict[str, Any]) -> List[str]:
         """액션을 추출합니다."""
         # 이슈의 제안된 액션에서 추출
@@ -0,0 +1,23 @@
+"""
+Sampling Package
+"""
+
+from .metric_sampler import (
+    SamplingConfig,
+    MetricSampler,
+    reservoir_indices,
+    stratified_indices,
+    minmax_decimate_indices,
+    mean_standard_error,
+    slope_standard_error,
+)
+
+__all__ = [
+    'SamplingConfig',
+    'MetricSampler',
+    'reservoir_indices',
+    'stratified_indices',
+    'minmax_decimate_indices',
+    'mean_standard_error',
+    'slope_standard_error',
+]
@@ -0,0 +1,246 @@
+"""
+Metric Sampling
+
+신호가 폭주하는 메트릭에 대해 고정된 포인트 수만 분석하도록 표본을 추출합니다.
+저수지(reservoir) 샘플링, 시간 층화 샘플링, 최소/최대 보존 데시메이션을 제공하며
+표본 추정치의 오차를 함께 계산합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+
+SAMPLING_METHODS = ("reservoir", "stratified", "decimate")
+
+
+@dataclass
+class SamplingConfig:
+    """메트릭별 샘플링 설정"""
+    method: str = "reservoir"  # 'reservoir', 'stratified', 'decimate' (트렌드 분석 전용)
+    max_points: int = 1000     # 분석할 최대 포인트 수 (메트릭당 CPU 예산)
+    strata: int = 10           # 시간 층화 샘플링의 구간 수
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.method not in SAMPLING_METHODS:
+            raise ValueError(f"Unknown sampling method: {self.method}")
+        if self.max_points < 3:
+            raise ValueError("max_points must be at least 3")
+
+
+def reservoir_indices(population: int, k: int, rng: np.random.Generator,
+                      keep_last: bool = False) -> np.ndarray:
+    """
+    길이를 아는 모집단에서 균등 비복원 표본 인덱스를 추출합니다 (정렬된 순서).
+
+    Args:
+        population: 모집단 크기
+        k: 표본 크기
+        rng: 난수 생성기
+        keep_last: 마지막 인덱스를 항상 포함할지 여부
+
+    Returns:
+        정렬된 인덱스 배열
+    """
+    if population <= k:
+        return np.arange(population)
+    if keep_last:
+        indices = rng.choice(population - 1, size=k - 1, replace=False)
+        indices = np.append(indices, population - 1)
+    else:
+        indices = rng.choice(population, size=k, replace=False)
+    return np.sort(indices)
+
+
+def stratified_indices(timestamps: Sequence[float], k: int, strata: int, rng: np.random.Generator,
+                       keep_last: bool = False) -> np.ndarray:
+    """
+    시간 범위를 균등 구간으로 나누고 구간별 개수에 비례하여 표본을 추출합니다.
+
+    Args:
+        timestamps: 타임스탬프 (모집단 순서)
+        k: 표본 크기
+        strata: 구간 수
+        rng: 난수 생성기
+        keep_last: 마지막 인덱스를 항상 포함할지 여부
+
+    Returns:
+        정렬된 인덱스 배열
+    """
+    ts = np.asarray(timestamps, dtype=np.float64)
+    population = len(ts)
+    if population <= k:
+        return np.arange(population)
+
+    low, high = ts.min(), ts.max()
+    if high == low:
+        return reservoir_indices(population, k, rng, keep_last)
+
+    stratum = np.minimum(((ts - low) / (high - low) * strata).astype(np.int64), strata - 1)
+    counts = np.bincount(stratum, minlength=strata)
+    budget = k - 1 if keep_last else k
+    # 비례 배분 후 남는 표본은 소수점 이하가 큰 구간부터 배정
+    quota = counts * budget / population
+    allocation = np.floor(quota).astype(np.int64)
+    remainder = budget - allocation.sum()
+    if remainder > 0:
+        allocation[np.argsort(-(quota - allocation))[:remainder]] += 1
+    allocation = np.minimum(allocation, counts)
+
+    selected = []
+    for s in np.flatnonzero(allocation):
+        members = np.flatnonzero(stratum == s)
+        selected.append(rng.choice(members, size=allocation[s], replace=False))
+    indices = np.concatenate(selected) if selected else np.empty(0, dtype=np.int64)
+    if keep_last:
+        indices = np.append(indices[indices != population - 1], population - 1)
+    return np.sort(indices)
+
+
+def minmax_decimate_indices(values: Sequence[float], k: int) -> np.ndarray:
+    """
+    값을 k/2개 구간으로 나누고 각 구간의 최소/최대 지점을 남깁니다.
+
+    극값과 전체 형태가 보존되어 트렌드 적합에 적합하며, 첫/마지막 포인트는 항상 포함됩니다.
+
+    Args:
+        values: 값 (시간 순서)
+        k: 목표 포인트 수
+
+    Returns:
+        정렬된 인덱스 배열
+    """
+    y = np.asarray(values, dtype=np.float64)
+    population = len(y)
+    if population <= k:
+        return np.arange(population)
+
+    buckets = max((k - 2) // 2, 1)
+    usable = (population // buckets) * buckets
+    grid = y[:usable].reshape(buckets, -1)
+    offsets = np.arange(buckets) * grid.shape[1]
+    indices = np.concatenate([
+        [0],
+        offsets + grid.argmin(axis=1),
+        offsets + grid.argmax(axis=1),
+        [population - 1]
+    ])
+    return np.unique(indices)
+
+
+def mean_standard_error(sample: Sequence[float], population: int) -> float:
+    """
+    표본 평균의 표준 오차 (유한 모집단 보정 포함)
+
+    Args:
+        sample: 표본 값
+        population: 모집단 크기
+
+    Returns:
+        표준 오차
+    """
+    n = len(sample)
+    if n < 2 or population <= 1:
+        return 0.0
+    fpc = np.sqrt(max(population - n, 0) / (population - 1))
+    return float(np.std(sample, ddof=1) / np.sqrt(n) * fpc)
+
+
+def slope_standard_error(x: Sequence[float], y: Sequence[float], slope: float, intercept: float) -> float:
+    """
+    선형 회귀 기울기의 표준 오차
+
+    Args:
+        x: 독립 변수
+        y: 종속 변수
+        slope: 적합된 기울기
+        intercept: 적합된 절편
+
+    Returns:
+        표준 오차
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n < 3:
+        return 0.0
+    sxx = np.sum((x - x.mean()) ** 2)
+    if sxx == 0:
+        return 0.0
+    residual_var = np.sum((y - (slope * x + intercept)) ** 2) / (n - 2)
+    return float(np.sqrt(residual_var / sxx))
+
+
+class MetricSampler:
+    """메트릭별 샘플링 설정 관리 및 인덱스 선택"""
+
+    def __init__(self, default_config: Optional[SamplingConfig] = None):
+        """
+        Args:
+            default_config: 별도 설정이 없는 메트릭에 적용할 설정 (None이면 샘플링 안 함)
+        """
+        self.default_config = default_config
+        self._configs: Dict[str, Optional[SamplingConfig]] = {}
+        self._rngs: Dict[str, np.random.Generator] = {}
+
+    def configure(self, metric_key: str, config: Optional[SamplingConfig]):
+        """메트릭의 샘플링 설정을 지정합니다 (None이면 해당 메트릭은 샘플링하지 않음)."""
+        self._configs[metric_key] = config
+        self._rngs.pop(metric_key, None)
+
+    def get_config(self, metric_key: str) -> Optional[SamplingConfig]:
+        return self._configs.get(metric_key, self.default_config)
+
+    def _rng(self, metric_key: str, config: SamplingConfig) -> np.random.Generator:
+        rng = self._rngs.get(metric_key)
+        if rng is None:
+            rng = self._rngs[metric_key] = np.random.default_rng(config.seed)
+        return rng
+
+    def select_indices(self, metric_key: str, population: int,
+                       timestamps: Optional[Sequence[float]] = None,
+                       values: Optional[Sequence[float]] = None,
+                       keep_last: bool = False, method: Optional[str] = None) -> Optional[np.ndarray]:
+        """
+        설정된 방법으로 분석할 인덱스를 선택합니다.
+
+        Args:
+            metric_key: 메트릭 키
+            population: 전체 포인트 수
+            timestamps: 타임스탬프 (stratified에 필요)
+            values: 값 (decimate에 필요)
+            keep_last: 마지막 포인트를 항상 포함할지 여부
+            method: 설정 대신 사용할 샘플링 방법 (None이면 설정값, max_points는 설정값 사용)
+
+        Returns:
+            정렬된 인덱스 배열 (샘플링이 필요 없으면 None)
+        """
+        config = self.get_config(metric_key)
+        if config is None or population <= config.max_points:
+            return None
+
+        method = method or config.method
+        if method == "reservoir":
+            return reservoir_indices(population, config.max_points, self._rng(metric_key, config), keep_last)
+        elif method == "stratified":
+            if timestamps is None:
+                raise ValueError("stratified sampling requires timestamps")
+            return stratified_indices(timestamps, config.max_points, config.strata,
+                                      self._rng(metric_key, config), keep_last)
+        else:
+            if values is None:
+                raise ValueError("decimation requires values")
+            return minmax_decimate_indices(values, config.max_points)
+
+    def describe(self, metric_key: str, population: int, sampled: int,
+                 method: Optional[str] = None) -> Dict[str, Any]:
+        """결과 details에 첨부할 샘플링 정보의 기본 항목을 반환합니다 (method는 실제 사용한 방법)."""
+        config = self.get_config(metric_key)
+        return {
+            "method": method or (config.method if config else None),
+            "population": population,
+            "sampled": sampled,
+            "rate": sampled / population if population else 1.0
+        }
@@ -0,0 +1,7 @@
+"""
+Scheduling Package
+"""
+
+from .priority_scheduler import PriorityWorkScheduler, WorkItem, run_overload_benchmark
+
+__all__ = ['PriorityWorkScheduler', 'WorkItem', 'run_overload_benchmark']
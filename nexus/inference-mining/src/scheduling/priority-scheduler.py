@@ -0,0 +1,335 @@
+"""
+Priority Work Scheduler
+
+InferenceMining 앞단에서 작업을 우선순위(low/medium/high/critical)와 마감 시간 순으로
+처리합니다. 과부하 시 낮은 우선순위 작업을 폐기(shed)하거나 신호를 다운샘플링하며,
+큐 깊이, 우선순위별 대기 시간, 폐기 건수를 지표로 제공합니다.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..issue_grouping.clustering import PRIORITY_LEVELS
+
+
+@dataclass
+class WorkItem:
+    """예약된 작업"""
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    priority: str
+    deadline: Optional[float]  # time.monotonic() 기준, None이면 마감 없음
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class PriorityWorkScheduler:
+    """우선순위/마감 인식 작업 스케줄러"""
+
+    def __init__(
+        self,
+        mining=None,
+        workers: int = 4,
+        max_queue_depth: int = 1000,
+        downsample_threshold: float = 0.5,
+        downsample_max_signals: int = 100,
+        downsample_priorities: Tuple[str, ...] = ("low",),
+        wait_samples: int = 1024
+    ):
+        """
+        Args:
+            mining: 작업을 실행할 InferenceMining 인스턴스 (submit_* 헬퍼에서 사용)
+            workers: 워커 스레드 수 (InferenceMining은 스레드 안전하므로 워커들이 인스턴스를 공유)
+            max_queue_depth: 최대 대기 작업 수 (초과 시 가장 낮은 우선순위 작업 폐기)
+            downsample_threshold: 다운샘플링을 시작할 큐 점유율 (0-1)
+            downsample_max_signals: 다운샘플링 시 유지할 최대 신호 수
+            downsample_priorities: 다운샘플링 대상 우선순위
+            wait_samples: 우선순위별로 보관할 대기 시간 표본 수
+        """
+        self.mining = mining
+        self.max_queue_depth = max_queue_depth
+        self.downsample_threshold = downsample_threshold
+        self.downsample_max_signals = downsample_max_signals
+        self.downsample_priorities = set(downsample_priorities)
+
+        self._queues: Dict[str, List[Tuple[float, int, WorkItem]]] = {p: [] for p in PRIORITY_LEVELS}
+        self._depth = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+
+        self._submitted = {p: 0 for p in PRIORITY_LEVELS}
+        self._completed = {p: 0 for p in PRIORITY_LEVELS}
+        self._shed = {p: {"overflow": 0, "deadline": 0, "shutdown": 0} for p in PRIORITY_LEVELS}
+        self._downsampled = {p: 0 for p in PRIORITY_LEVELS}
+        self._wait_times: Dict[str, Deque[float]] = {p: deque(maxlen=wait_samples) for p in PRIORITY_LEVELS}
+        self._max_depth = 0
+
+        self._threads = [
+            threading.Thread(target=self._worker_loop, name=f"inference-scheduler-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args, priority: str = "medium",
+               deadline: Optional[float] = None, **kwargs) -> Future:
+        """
+        작업을 예약합니다.
+
+        폐기된 작업의 Future는 취소 상태가 됩니다.
+
+        Args:
+            fn: 실행할 함수
+            *args: 함수 인자
+            priority: 우선순위 ("low", "medium", "high", "critical")
+            deadline: 현재부터의 마감 시간 (초, None이면 마감 없음)
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            작업 결과 Future
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        item = WorkItem(
+            fn=fn, args=args, kwargs=kwargs, priority=priority,
+            deadline=time.monotonic() + deadline if deadline is not None else None
+        )
+
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("Scheduler has been shut down")
+            self._submitted[priority] += 1
+
+            if self._depth >= self.max_queue_depth:
+                victim_priority = self._lowest_queued_priority()
+                if victim_priority is None or PRIORITY_LEVELS.index(victim_priority) >= PRIORITY_LEVELS.index(priority):
+                    # 새 작업이 대기 중인 작업보다 중요하지 않으면 새 작업을 폐기
+                    self._shed_item(item, "overflow")
+                    return item.future
+                # 가장 낮은 우선순위 큐에서 마감이 가장 늦은 작업(동률이면 가장 늦게 들어온 작업)을 폐기
+                queue = self._queues[victim_priority]
+                victim_index = max(range(len(queue)), key=lambda i: queue[i][:2])
+                _, _, victim = queue[victim_index]
+                queue[victim_index] = queue[-1]
+                queue.pop()
+                heapq.heapify(queue)
+                self._depth -= 1
+                self._shed_item(victim, "overflow")
+
+            sort_key = item.deadline if item.deadline is not None else float("inf")
+            heapq.heappush(self._queues[priority], (sort_key, next(self._sequence), item))
+            self._depth += 1
+            self._max_depth = max(self._max_depth, self._depth)
+            self._condition.notify()
+
+        return item.future
+
+    def submit_extract_issue(self, signal_data: List[Dict[str, Any]], issue_title: str,
+                             issue_description: str, priority: str = "medium",
+                             deadline: Optional[float] = None) -> Future:
+        """
+        이슈 추출 작업을 예약합니다.
+
+        큐 점유율이 downsample_threshold 이상이면 다운샘플링 대상 우선순위의 신호를
+        downsample_max_signals개로 균등 추출합니다.
+
+        Args:
+            signal_data: 관련 신호 데이터
+            issue_title: 이슈 제목
+            issue_description: 이슈 설명
+            priority: 우선순위
+            deadline: 마감 시간 (초)
+
+        Returns:
+            이슈 딕셔너리 Future
+        """
+        if (priority in self.downsample_priorities
+                and self._depth >= self.max_queue_depth * self.downsample_threshold
+                and len(signal_data) > self.downsample_max_signals):
+            indices = np.linspace(0, len(signal_data) - 1, self.downsample_max_signals).astype(np.int64)
+            signal_data = [signal_data[i] for i in indices]
+            with self._condition:
+                self._downsampled[priority] += 1
+
+        # extract_issue의 priority 인자가 submit의 priority와 겹치므로 위치 인자로 전달
+        return self.submit(
+            self.mining.extract_issue, signal_data, issue_title, issue_description, priority,
+            priority=priority, deadline=deadline
+        )
+
+    def submit_proposal_draft(self, issue: Dict[str, Any], context: Optional[Dict[str, Any]] = None,
+                              deadline: Optional[float] = None) -> Future:
+        """
+        이슈 우선순위로 제안 초안 생성 작업을 예약합니다.
+
+        Args:
+            issue: 이슈 딕셔너리
+            context: 추가 컨텍스트
+            deadline: 마감 시간 (초)
+
+        Returns:
+            제안 초안 Future
+        """
+        return self.submit(
+            self.mining.generate_proposal_draft, issue, context,
+            priority=issue.get("priority", "medium"), deadline=deadline
+        )
+
+    def _lowest_queued_priority(self) -> Optional[str]:
+        for priority in PRIORITY_LEVELS:
+            if self._queues[priority]:
+                return priority
+        return None
+
+    def _pop(self) -> Optional[WorkItem]:
+        for priority in reversed(PRIORITY_LEVELS):
+            queue = self._queues[priority]
+            if queue:
+                self._depth -= 1
+                return heapq.heappop(queue)[2]
+        return None
+
+    def _shed_item(self, item: WorkItem, reason: str):
+        self._shed[item.priority][reason] += 1
+        item.future.cancel()
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                while not self._stopped and self._depth == 0:
+                    self._condition.wait()
+                if self._stopped and self._depth == 0:
+                    return
+                item = self._pop()
+                now = time.monotonic()
+                if item.deadline is not None and now > item.deadline:
+                    self._shed_item(item, "deadline")
+                    continue
+                self._wait_times[item.priority].append(now - item.enqueued_at)
+
+            if not item.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = item.fn(*item.args, **item.kwargs)
+            except BaseException as exc:
+                item.future.set_exception(exc)
+            else:
+                item.future.set_result(result)
+
+            with self._condition:
+                self._completed[item.priority] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """큐 깊이, 우선순위별 대기 시간 및 폐기/다운샘플링 건수를 반환합니다."""
+        with self._condition:
+            wait_time_ms = {}
+            for priority, samples in self._wait_times.items():
+                if samples:
+                    waits = np.asarray(samples) * 1000
+                    wait_time_ms[priority] = {
+                        "count": len(waits),
+                        "mean": float(waits.mean()),
+                        "p95": float(np.percentile(waits, 95)),
+                        "max": float(waits.max())
+                    }
+                else:
+                    wait_time_ms[priority] = {"count": 0, "mean": 0.0, "p95": 0.0, "max": 0.0}
+
+            return {
+                "queue_depth": {p: len(q) for p, q in self._queues.items()},
+                "total_depth": self._depth,
+                "max_depth": self._max_depth,
+                "submitted": dict(self._submitted),
+                "completed": dict(self._completed),
+                "shed": {p: dict(counts) for p, counts in self._shed.items()},
+                "downsampled": dict(self._downsampled),
+                "wait_time_ms": wait_time_ms
+            }
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        스케줄러를 종료합니다.
+
+        Args:
+            wait: 워커 스레드 종료를 기다릴지 여부
+            cancel_pending: 대기 중인 작업을 취소할지 여부 (False면 모두 처리 후 종료,
+                True면 취소된 작업은 폐기 지표의 "shutdown" 사유로 집계)
+        """
+        with self._condition:
+            self._stopped = True
+            if cancel_pending:
+                for queue in self._queues.values():
+                    for _, _, item in queue:
+                        self._shed_item(item, "shutdown")
+                    queue.clear()
+                self._depth = 0
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> "PriorityWorkScheduler":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def run_overload_benchmark(total_items: int = 5000, critical_ratio: float = 0.02, workers: int = 4,
+                           max_queue_depth: int = 200, signals_per_item: int = 500) -> Dict[str, Any]:
+    """
+    낮은 우선순위 작업이 폭주하는 합성 과부하 상황에서 스케줄러 지표를 측정합니다.
+
+    Args:
+        total_items: 제출할 총 작업 수
+        critical_ratio: critical 작업 비율
+        workers: 워커 스레드 수
+        max_queue_depth: 최대 큐 깊이
+        signals_per_item: 작업당 신호 수
+
+    Returns:
+        스케줄러 지표 (경과 시간 포함)
+    """
+    from ..inference_mining import InferenceMining
+
+    rng = np.random.default_rng(0)
+    signals = [
+        {"id": f"signal-{i}", "data": {"participation": float(v)}, "metadata": {"timestamp": i}}
+        for i, v in enumerate(rng.normal(50.0, 5.0, size=signals_per_item))
+    ]
+
+    started = time.perf_counter()
+    critical_futures = []
+    with PriorityWorkScheduler(InferenceMining(), workers=workers, max_queue_depth=max_queue_depth) as scheduler:
+        for i in range(total_items):
+            if rng.random() < critical_ratio:
+                critical_futures.append(scheduler.submit_extract_issue(
+                    signals, f"critical-{i}", "synthetic critical issue", priority="critical", deadline=5.0
+                ))
+            else:
+                priority = "low" if rng.random() < 0.8 else "medium"
+                scheduler.submit_extract_issue(signals, f"{priority}-{i}", "synthetic flood", priority=priority)
+        peak = scheduler.get_metrics()
+    metrics = scheduler.get_metrics()
+    metrics["queue_depth_at_peak"] = peak["queue_depth"]
+
+    metrics["elapsed_seconds"] = time.perf_counter() - started
+    metrics["critical_completed"] = sum(1 for f in critical_futures if not f.cancelled() and f.exception() is None)
+    metrics["critical_submitted"] = len(critical_futures)
+    return metrics
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(run_overload_benchmark(), indent=2))
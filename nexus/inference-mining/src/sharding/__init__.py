@@ -0,0 +1,8 @@
+"""
+Sharding Package
+"""
+
+from .consistent_hash import ConsistentHashRing
+from .sharded_mining import ShardedInferenceMining, benchmark_scaling
+
+__all__ = ['ConsistentHashRing', 'ShardedInferenceMining', 'benchmark_scaling']
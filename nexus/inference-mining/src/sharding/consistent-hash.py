@@ -0,0 +1,75 @@
+"""
+Consistent Hash Ring
+
+메트릭 키를 워커에 일관 해싱으로 배정합니다.
+워커가 추가/제거될 때 전체 키 중 약 1/N만 다른 워커로 이동합니다.
+"""
+
+import bisect
+import hashlib
+from typing import Dict, List, Optional
+
+
+def _hash(key: str) -> int:
+    """키를 64비트 정수로 해싱합니다 (프로세스 간 안정적)."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """가상 노드 기반 일관 해시 링"""
+
+    def __init__(self, nodes: Optional[List[str]] = None, virtual_nodes: int = 128):
+        """
+        Args:
+            nodes: 초기 노드 ID 리스트
+            virtual_nodes: 노드당 링 위 가상 노드 수 (클수록 분배가 균등)
+        """
+        self.virtual_nodes = virtual_nodes
+        self._positions: List[int] = []
+        self._owners: Dict[int, str] = {}
+        self._nodes: List[str] = []
+
+        for node in nodes or []:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+
+    def add_node(self, node: str):
+        """노드를 링에 추가합니다."""
+        if node in self._nodes:
+            raise ValueError(f"Node already in ring: {node}")
+        self._nodes.append(node)
+        for replica in range(self.virtual_nodes):
+            position = _hash(f"{node}#{replica}")
+            bisect.insort(self._positions, position)
+            self._owners[position] = node
+
+    def remove_node(self, node: str):
+        """노드를 링에서 제거합니다."""
+        if node not in self._nodes:
+            raise ValueError(f"Node not in ring: {node}")
+        self._nodes.remove(node)
+        for replica in range(self.virtual_nodes):
+            position = _hash(f"{node}#{replica}")
+            index = bisect.bisect_left(self._positions, position)
+            del self._positions[index]
+            del self._owners[position]
+
+    def get_node(self, key: str) -> str:
+        """
+        키를 담당하는 노드를 반환합니다.
+
+        Args:
+            key: 메트릭 키
+
+        Returns:
+            노드 ID
+        """
+        if not self._positions:
+            raise ValueError("Hash ring has no nodes")
+        index = bisect.bisect_right(self._positions, _hash(key))
+        if index == len(self._positions):
+            index = 0
+        return self._owners[self._positions[index]]
@@ -0,0 +1,354 @@
+"""
+Sharded Inference Mining
+
+메트릭 키를 일관 해싱으로 N개의 워커 프로세스에 분배합니다.
+각 워커는 자신이 담당하는 메트릭의 이력과 탐지/트렌드 상태, 추출된 이슈를 소유하고,
+코디네이터는 배치를 분산(scatter)한 뒤 결과를 수집(gather)합니다.
+"""
+
+import multiprocessing
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..inference_mining import InferenceMining
+from ..streaming_ingestion.ndjson_stream import MetricHistory, iter_numeric_values, project_columns
+from .consistent_hash import ConsistentHashRing
+
+
+def _worker_main(conn, history_size: int, trend_strength_threshold: float, max_issues: int,
+                 precision: str = "float64"):
+    """
+    워커 프로세스 루프
+
+    명령은 (command, payload) 튜플로 전달되며, 모든 명령에 대해 응답 하나를 보냅니다.
+    "process" 페이로드는 직렬화 비용을 줄이기 위해 메트릭별 (ID, 타임스탬프, 값) 리스트로
+    전달되고, 탐지/트렌드는 열 배열로 계산하며 신호 딕셔너리는 이슈를 추출할 때만 복원합니다.
+    이력은 메트릭별 MetricHistory(열 단위, precision dtype 값)로 보관합니다.
+    "export"/"import"는 메트릭별 {"columns": (ID, 타임스탬프, 값) 배열, "issues": [(이슈, 서명), ...]}를 주고받아
+    담당이 바뀐 메트릭의 이슈와 중복 제거 상태도 함께 이전합니다.
+    """
+    mining = InferenceMining(precision=precision)
+    history: Dict[str, MetricHistory] = {}
+    issue_metrics: Dict[str, str] = {}  # 이슈 ID → 이슈를 만든 메트릭 (이전 대상 선택용)
+
+    while True:
+        command, payload = conn.recv()
+
+        # 명령 처리 중 예외는 응답으로 돌려보내 워커가 죽지 않고 파이프 동기화도 유지
+        try:
+            if command == "process":
+                results = []
+                for metric_key, (signal_ids, timestamps, values) in payload.items():
+                    metric_history = history.get(metric_key)
+                    if metric_history is None:
+                        metric_history = MetricHistory(history_size, precision)
+                    # 이력은 처리가 성공한 뒤에 갱신하여 잘못된 신호가 이후 배치를 오염시키지 않도록 함
+                    _, window_timestamps, window_values = metric_history.window(
+                        signal_ids, timestamps, values, limit=history_size
+                    )
+
+                    # 이번 배치의 모든 새 값을 평가 (점 수만큼 보정된 임계값), 신호 딕셔너리는 이슈 추출 시에만 생성
+                    anomaly = mining.detect_anomaly_values(
+                        window_values, metric_key, score_last=len(values), timestamps=window_timestamps
+                    )
+                    trend = mining.analyze_trend_values(window_values, window_timestamps, metric_key)
+
+                    issue = None
+                    if anomaly and anomaly.is_anomaly:
+                        issue = mining.extract_issue(
+                            project_columns(metric_key, signal_ids, timestamps, values), f"{metric_key} 이상 감지",
+                            f"메트릭 {metric_key}에서 통계적 이상치가 감지되었습니다.", priority="high"
+                        )
+                    elif trend and trend.direction != "stable" and trend.strength >= trend_strength_threshold:
+                        issue = mining.extract_issue(
+                            project_columns(metric_key, signal_ids, timestamps, values), f"{metric_key} 트렌드 감지",
+                            f"메트릭 {metric_key}이(가) 지속적인 {trend.direction} 추세를 보이고 있습니다."
+                        )
+
+                    metric_history.extend(signal_ids, timestamps, values)
+                    history[metric_key] = metric_history
+                    if issue is not None:
+                        issue_metrics.setdefault(issue["id"], metric_key)
+                    results.append({
+                        "metricKey": metric_key,
+                        "anomaly": anomaly,
+                        "trend": trend,
+                        "issue": issue
+                    })
+                # 오래된 이슈를 제거하여 메모리와 중복 제거 색인 크기를 제한
+                for issue_id in mining.evict_issues(max_issues):
+                    issue_metrics.pop(issue_id, None)
+                conn.send(results)
+            elif command == "export":
+                keys = set(payload)
+                moved_issues: Dict[str, List[str]] = {}
+                for issue_id, metric_key in list(issue_metrics.items()):
+                    if metric_key in keys:
+                        moved_issues.setdefault(metric_key, []).append(issue_id)
+                        del issue_metrics[issue_id]
+                state = {}
+                for metric_key in keys:
+                    entries = mining.export_issues(moved_issues.get(metric_key, ()))
+                    if metric_key in history or entries:
+                        metric_history = history.pop(metric_key, None)
+                        state[metric_key] = {
+                            "columns": metric_history.columns() if metric_history is not None else None,
+                            "issues": entries
+                        }
+                conn.send(state)
+            elif command == "import":
+                for metric_key, state in payload.items():
+                    if state["columns"] is not None:
+                        metric_history = history.setdefault(metric_key, MetricHistory(history_size, precision))
+                        metric_history.extend(*state["columns"])
+                    mining.import_issues(state["issues"])
+                    for issue, _ in state["issues"]:
+                        issue_metrics.setdefault(issue["id"], metric_key)
+                mining.evict_issues(max_issues)
+                conn.send(len(payload))
+            elif command == "keys":
+                conn.send(list(history))
+            elif command == "issues":
+                conn.send(mining.get_detected_issues())
+            elif command == "stop":
+                conn.send(None)
+                conn.close()
+                return
+            else:
+                conn.send(ValueError(f"Unknown worker command: {command}"))
+        except Exception as exc:
+            conn.send(exc)
+
+
+class ShardedInferenceMining:
+    """일관 해싱 기반 멀티 프로세스 Inference Mining 코디네이터"""
+
+    def __init__(
+        self,
+        num_workers: int = 4,
+        history_size: int = 1000,
+        trend_strength_threshold: float = 0.8,
+        virtual_nodes: int = 128,
+        start_method: Optional[str] = None,
+        max_issues: int = 10000,
+        precision: str = "float64"
+    ):
+        """
+        Args:
+            num_workers: 초기 워커 프로세스 수
+            history_size: 워커가 메트릭별로 유지할 최대 신호 수
+            trend_strength_threshold: 이슈로 추출할 최소 트렌드 강도 (R²)
+            virtual_nodes: 워커당 해시 링 가상 노드 수
+            start_method: multiprocessing 시작 방식 ("fork", "spawn" 등, None이면 플랫폼 기본값)
+            max_issues: 워커별로 보관할 최대 이슈 수 (초과 시 오래된 이슈부터 제거)
+            precision: 워커 이력과 분석 배열의 저장 정밀도 ("float64" 또는 "float32")
+        """
+        self.history_size = history_size
+        self.max_issues = max_issues
+        self.precision = precision
+        self.trend_strength_threshold = trend_strength_threshold
+        self.ring = ConsistentHashRing(virtual_nodes=virtual_nodes)
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: Dict[str, Any] = {}
+        self._next_worker = 0
+
+        for _ in range(num_workers):
+            self._spawn_worker()
+
+    def _spawn_worker(self) -> str:
+        worker_id = f"worker-{self._next_worker}"
+        self._next_worker += 1
+
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.history_size, self.trend_strength_threshold, self.max_issues, self.precision),
+            name=f"inference-mining-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        self._workers[worker_id] = (process, parent_conn)
+        self.ring.add_node(worker_id)
+        return worker_id
+
+    def _call(self, worker_id: str, command: str, payload: Any = None) -> Any:
+        conn = self._workers[worker_id][1]
+        conn.send((command, payload))
+        response = conn.recv()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def _scatter(self, payloads: Dict[str, Any], command: str) -> Dict[str, Any]:
+        """모든 워커에 먼저 보낸 뒤 응답을 모아 워커들이 병렬로 처리하도록 합니다."""
+        for worker_id, payload in payloads.items():
+            self._workers[worker_id][1].send((command, payload))
+        responses = {}
+        for worker_id in payloads:
+            responses[worker_id] = self._workers[worker_id][1].recv()
+        # 모든 응답을 받은 뒤에 예외를 올려야 다른 워커의 파이프에 응답이 남지 않음
+        for response in responses.values():
+            if isinstance(response, Exception):
+                raise response
+        return responses
+
+    @property
+    def workers(self) -> List[str]:
+        return list(self._workers)
+
+    def route(self, metric_key: str) -> str:
+        """메트릭 키를 담당하는 워커 ID를 반환합니다."""
+        return self.ring.get_node(metric_key)
+
+    def process_batch(self, signal_data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        신호 배치를 메트릭별로 담당 워커에 분산 처리합니다.
+
+        Args:
+            signal_data: 신호 데이터
+
+        Returns:
+            메트릭별 결과 리스트 ({"metricKey", "anomaly", "trend", "issue"})
+        """
+        routes: Dict[str, str] = {}
+        payloads: Dict[str, Dict[str, Any]] = {}
+        for signal in signal_data:
+            for metric_key, signal_id, timestamp, value in iter_numeric_values(signal):
+                worker_id = routes.get(metric_key)
+                if worker_id is None:
+                    worker_id = routes[metric_key] = self.route(metric_key)
+                columns = payloads.setdefault(worker_id, {}).get(metric_key)
+                if columns is None:
+                    columns = payloads[worker_id][metric_key] = ([], [], [])
+                columns[0].append(signal_id)
+                columns[1].append(timestamp)
+                columns[2].append(value)
+
+        results = []
+        for worker_results in self._scatter(payloads, "process").values():
+            results.extend(worker_results)
+        return results
+
+    def add_worker(self) -> str:
+        """
+        워커를 추가하고, 새 워커가 담당하게 된 메트릭 상태(이력, 이슈, 중복 제거 서명)를 이전합니다.
+
+        Returns:
+            추가된 워커 ID
+        """
+        existing = list(self._workers)
+        worker_id = self._spawn_worker()
+
+        for old_worker in existing:
+            moved = [key for key in self._call(old_worker, "keys") if self.route(key) == worker_id]
+            if moved:
+                self._call(worker_id, "import", self._call(old_worker, "export", moved))
+        return worker_id
+
+    def remove_worker(self, worker_id: Optional[str] = None):
+        """
+        워커를 제거하고, 담당하던 메트릭 상태(이력, 이슈, 중복 제거 서명)를 남은 워커들에 재분배합니다.
+
+        Args:
+            worker_id: 제거할 워커 ID (None이면 가장 최근 워커)
+        """
+        if worker_id is None:
+            worker_id = list(self._workers)[-1]
+        if len(self._workers) <= 1:
+            raise ValueError("Cannot remove the last worker")
+
+        state = self._call(worker_id, "export", self._call(worker_id, "keys"))
+        self._stop_worker(worker_id)
+
+        payloads: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for metric_key, metric_state in state.items():
+            payloads.setdefault(self.route(metric_key), {})[metric_key] = metric_state
+        self._scatter(payloads, "import")
+
+    def _stop_worker(self, worker_id: str):
+        self.ring.remove_node(worker_id)
+        process, conn = self._workers.pop(worker_id)
+        try:
+            conn.send(("stop", None))
+            conn.recv()
+        except (EOFError, OSError):
+            pass
+        conn.close()
+        process.join(timeout=5)
+
+    def get_shard_sizes(self) -> Dict[str, int]:
+        """워커별 담당 메트릭 수를 반환합니다."""
+        return {worker_id: len(keys) for worker_id, keys in
+                self._scatter({worker_id: None for worker_id in self._workers}, "keys").items()}
+
+    def get_detected_issues(self) -> List[Dict[str, Any]]:
+        """모든 워커에서 감지된 이슈를 수집합니다."""
+        issues = []
+        for worker_issues in self._scatter({worker_id: None for worker_id in self._workers}, "issues").values():
+            issues.extend(worker_issues)
+        return issues
+
+    def shutdown(self):
+        """모든 워커 프로세스를 종료합니다."""
+        for worker_id in list(self._workers):
+            self._stop_worker(worker_id)
+
+    def __enter__(self) -> "ShardedInferenceMining":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def benchmark_scaling(max_workers: int = 4, n_metrics: int = 256, signals_per_metric: int = 2000,
+                      batch_size: int = 256, history_size: int = 1000) -> List[Dict[str, Any]]:
+    """
+    워커 수를 1부터 max_workers까지 늘려 가며 처리량을 측정합니다.
+
+    Args:
+        max_workers: 최대 워커 수
+        n_metrics: 메트릭 수
+        signals_per_metric: 메트릭당 신호 수
+        batch_size: 배치당 신호 수 (각 신호는 모든 메트릭 값을 가짐)
+        history_size: 워커의 메트릭별 이력 크기
+
+    Returns:
+        워커 수별 처리량 리스트
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    metric_keys = [f"metric_{i}" for i in range(n_metrics)]
+    values = rng.normal(100.0, 5.0, size=(signals_per_metric, n_metrics))
+    signals = [
+        {
+            "id": f"signal-{i}",
+            "data": dict(zip(metric_keys, row.tolist())),
+            "metadata": {"timestamp": i}
+        }
+        for i, row in enumerate(values)
+    ]
+
+    report = []
+    for num_workers in range(1, max_workers + 1):
+        with ShardedInferenceMining(num_workers=num_workers, history_size=history_size) as sharded:
+            started = time.perf_counter()
+            for offset in range(0, len(signals), batch_size):
+                sharded.process_batch(signals[offset:offset + batch_size])
+            elapsed = time.perf_counter() - started
+
+        total_values = signals_per_metric * n_metrics
+        report.append({
+            "workers": num_workers,
+            "elapsed_seconds": elapsed,
+            "values_per_second": total_values / elapsed if elapsed > 0 else 0.0,
+            "speedup": report[0]["elapsed_seconds"] / elapsed if report else 1.0,
+        })
+    return report
+
+
+if __name__ == "__main__":
+    for row in benchmark_scaling():
+        print(row)
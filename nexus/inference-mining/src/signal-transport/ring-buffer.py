@@ -0,0 +1,469 @@
+"""
+Shared-Memory Signal Ring Buffer
+
+Reality Oracle와 Inference Mining 사이에서 고정 레이아웃 바이너리 신호 레코드를
+메모리 맵 파일로 전달하는 단일 생산자/단일 소비자(SPSC) 링 버퍼입니다.
+소비자는 레코드를 복사 없이 NumPy 뷰로 읽습니다.
+
+파일 레이아웃 (리틀 엔디언):
+
+    [0, 256)         헤더
+                       0  magic "BRSR" | 4 version u32 | 8 capacity u64
+                      16  record_size u32 | 20 max_metrics u32 | 24 name_size u32
+                      64  write_seq u64  (생산자 전용 캐시 라인)
+                     128  read_seq u64   (소비자 전용 캐시 라인)
+                     192  metric_count u32
+    [256, +M*N)      메트릭 이름 사전 (max_metrics x name_size, UTF-8, NUL 패딩)
+    [..., +C*24)     레코드 (capacity x SIGNAL_RECORD_DTYPE)
+
+write_seq/read_seq는 단조 증가하는 누적 레코드 수이며, 슬롯 위치는 seq % capacity입니다.
+생산자는 레코드를 모두 기록한 뒤 write_seq를 갱신하고, 소비자는 처리를 마친 뒤
+read_seq를 갱신합니다. 두 값 모두 8바이트 정렬된 단일 저장으로 게시됩니다.
+"""
+
+import mmap
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+MAGIC = b"BRSR"
+VERSION = 1
+HEADER_SIZE = 256
+WRITE_SEQ_OFFSET = 64
+READ_SEQ_OFFSET = 128
+METRIC_COUNT_OFFSET = 192
+DEFAULT_NAME_SIZE = 64
+
+SIGNAL_RECORD_DTYPE = np.dtype([
+    ("timestamp", "<i8"),   # Unix timestamp (ms)
+    ("metric_id", "<u4"),   # 메트릭 이름 사전 인덱스
+    ("flags", "<u4"),       # 예약
+    ("value", "<f8"),
+])
+
+
+class SignalRingBuffer:
+    """메모리 맵 신호 링 버퍼"""
+
+    def __init__(self, path: str, capacity: Optional[int] = None, max_metrics: int = 1024,
+                 name_size: int = DEFAULT_NAME_SIZE, create: bool = False, overwrite: bool = False):
+        """
+        Args:
+            path: 링 버퍼 파일 경로 (/dev/shm 아래 경로 권장)
+            capacity: 레코드 슬롯 수 (create=True일 때 필수)
+            max_metrics: 메트릭 이름 사전 크기
+            name_size: 메트릭 이름 최대 바이트 수
+            create: 새 파일을 생성할지 여부
+            overwrite: create=True일 때 기존 파일을 교체할지 여부. 기존 파일을 잘라내지 않고
+                unlink한 뒤 새로 만들므로, 이전 파일을 매핑 중인 소비자는 SIGBUS 없이 이전 링을 계속 봅니다.
+
+        Raises:
+            FileExistsError: create=True, overwrite=False이고 파일이 이미 있는 경우
+        """
+        self.path = path
+
+        if create:
+            if not capacity or capacity <= 0:
+                raise ValueError("capacity must be positive when creating a ring buffer")
+            total_size = HEADER_SIZE + max_metrics * name_size + capacity * SIGNAL_RECORD_DTYPE.itemsize
+            if overwrite:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            # 배타적 생성: 다른 프로세스가 매핑 중인 파일을 잘라내지 않음
+            with open(path, "xb") as f:
+                f.truncate(total_size)
+
+        self._file = open(path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+
+        header = np.ndarray((8,), dtype="<u4", buffer=self._mmap, offset=0)
+        if create:
+            self._mmap[0:4] = MAGIC
+            header[1] = VERSION
+            np.ndarray((1,), dtype="<u8", buffer=self._mmap, offset=8)[0] = capacity
+            header[4] = SIGNAL_RECORD_DTYPE.itemsize
+            header[5] = max_metrics
+            header[6] = name_size
+        elif bytes(self._mmap[0:4]) != MAGIC:
+            raise ValueError(f"Not a signal ring buffer: {path}")
+        elif header[1] != VERSION or header[4] != SIGNAL_RECORD_DTYPE.itemsize:
+            raise ValueError(f"Unsupported ring buffer layout (version {header[1]}, record size {header[4]})")
+
+        self.capacity = int(np.ndarray((1,), dtype="<u8", buffer=self._mmap, offset=8)[0])
+        self.max_metrics = int(header[5])
+        self.name_size = int(header[6])
+
+        self._write_seq = np.ndarray((1,), dtype="<u8", buffer=self._mmap, offset=WRITE_SEQ_OFFSET)
+        self._read_seq = np.ndarray((1,), dtype="<u8", buffer=self._mmap, offset=READ_SEQ_OFFSET)
+        self._metric_count = np.ndarray((1,), dtype="<u4", buffer=self._mmap, offset=METRIC_COUNT_OFFSET)
+        self._names = np.ndarray(
+            (self.max_metrics, self.name_size), dtype=np.uint8,
+            buffer=self._mmap, offset=HEADER_SIZE
+        )
+        self.records = np.ndarray(
+            (self.capacity,), dtype=SIGNAL_RECORD_DTYPE,
+            buffer=self._mmap, offset=HEADER_SIZE + self.max_metrics * self.name_size
+        )
+
+        self._name_cache: List[str] = []
+        self._id_cache: Dict[str, int] = {}
+
+    @classmethod
+    def create(cls, path: str, capacity: int, max_metrics: int = 1024,
+               name_size: int = DEFAULT_NAME_SIZE, overwrite: bool = False) -> "SignalRingBuffer":
+        """새 링 버퍼 파일을 생성합니다 (overwrite=False이면 기존 파일이 있을 때 FileExistsError)."""
+        return cls(path, capacity=capacity, max_metrics=max_metrics, name_size=name_size,
+                   create=True, overwrite=overwrite)
+
+    @classmethod
+    def open(cls, path: str) -> "SignalRingBuffer":
+        """기존 링 버퍼 파일을 엽니다."""
+        return cls(path)
+
+    @property
+    def write_seq(self) -> int:
+        return int(self._write_seq[0])
+
+    @property
+    def read_seq(self) -> int:
+        return int(self._read_seq[0])
+
+    def __len__(self) -> int:
+        """소비되지 않은 레코드 수"""
+        return self.write_seq - self.read_seq
+
+    def register_metric(self, name: str) -> int:
+        """
+        메트릭 이름을 사전에 등록합니다 (생산자 전용).
+
+        Args:
+            name: 메트릭 이름
+
+        Returns:
+            메트릭 ID
+        """
+        self._refresh_names()
+        if name in self._id_cache:
+            return self._id_cache[name]
+
+        encoded = name.encode("utf-8")
+        if len(encoded) > self.name_size:
+            raise ValueError(f"Metric name exceeds {self.name_size} bytes: {name}")
+
+        metric_id = int(self._metric_count[0])
+        if metric_id >= self.max_metrics:
+            raise ValueError(f"Metric dictionary is full ({self.max_metrics} entries)")
+
+        slot = self._names[metric_id]
+        slot[:] = 0
+        slot[:len(encoded)] = np.frombuffer(encoded, dtype=np.uint8)
+        # 이름을 기록한 뒤에 개수를 게시
+        self._metric_count[0] = metric_id + 1
+
+        self._name_cache.append(name)
+        self._id_cache[name] = metric_id
+        return metric_id
+
+    def metric_name(self, metric_id: int) -> str:
+        """메트릭 ID에 해당하는 이름을 반환합니다."""
+        if metric_id >= len(self._name_cache):
+            self._refresh_names()
+        return self._name_cache[metric_id]
+
+    def metric_names(self) -> List[str]:
+        """등록된 메트릭 이름 리스트를 반환합니다."""
+        self._refresh_names()
+        return list(self._name_cache)
+
+    def _refresh_names(self):
+        """다른 프로세스가 등록한 메트릭 이름을 캐시에 반영합니다."""
+        count = int(self._metric_count[0])
+        for metric_id in range(len(self._name_cache), count):
+            name = self._names[metric_id].tobytes().rstrip(b"\x00").decode("utf-8")
+            self._name_cache.append(name)
+            self._id_cache[name] = metric_id
+
+    def close(self):
+        """메모리 맵과 파일을 닫습니다."""
+        # mmap을 참조하는 뷰를 먼저 해제해야 닫을 수 있음
+        self.records = None
+        self._write_seq = self._read_seq = self._metric_count = self._names = None
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "SignalRingBuffer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RingBufferFull(Exception):
+    """
+    제한 시간 안에 여유 공간이 생기지 않아 레코드를 모두 기록하지 못했습니다.
+
+    pending에 남은 (timestamps, metric_ids, values) 배열이 담겨 있으므로
+    RingBufferProducer.write(*exc.pending)로 이어서 기록할 수 있습니다.
+    """
+
+    def __init__(self, written: int, pending: Tuple[np.ndarray, np.ndarray, np.ndarray]):
+        super().__init__(f"Ring buffer full: {written} records written, {len(pending[2])} pending")
+        self.written = written
+        self.pending = pending
+
+
+class RingBufferProducer:
+    """링 버퍼 참조 생산자 (테스트 및 Python 측 수집기용)"""
+
+    def __init__(self, ring: SignalRingBuffer):
+        """
+        Args:
+            ring: 기록할 링 버퍼
+        """
+        self.ring = ring
+
+    def write(self, timestamps: np.ndarray, metric_ids: np.ndarray, values: np.ndarray) -> int:
+        """
+        레코드 배치를 기록합니다. 여유 공간이 부족하면 가능한 만큼만 기록합니다.
+
+        Args:
+            timestamps: 타임스탬프 배열 (ms)
+            metric_ids: 메트릭 ID 배열
+            values: 값 배열
+
+        Returns:
+            기록한 레코드 수
+        """
+        ring = self.ring
+        write_seq = ring.write_seq
+        free = ring.capacity - (write_seq - ring.read_seq)
+        count = min(len(values), free)
+        if count <= 0:
+            return 0
+
+        start = write_seq % ring.capacity
+        first = min(count, ring.capacity - start)
+        for dst, src in ((slice(start, start + first), slice(0, first)),
+                         (slice(0, count - first), slice(first, count))):
+            if dst.stop - dst.start == 0:
+                continue
+            target = ring.records[dst]
+            target["timestamp"] = timestamps[src]
+            target["metric_id"] = metric_ids[src]
+            target["flags"] = 0
+            target["value"] = values[src]
+
+        ring._write_seq[0] = write_seq + count
+        return count
+
+    def write_signals(self, signals: Iterable[Dict[str, Any]], timeout: Optional[float] = 0.0,
+                      poll_interval: float = 0.001) -> int:
+        """
+        신호 딕셔너리를 레코드로 변환하여 모두 기록합니다.
+
+        각 신호의 수치형 data 항목이 레코드 하나가 됩니다 (bool은 iter_numeric_values와 같이 제외).
+        링이 가득 차면 소비자가 공간을 비울 때까지 timeout 동안 기다립니다.
+
+        Args:
+            signals: 신호 딕셔너리 이터러블
+            timeout: 여유 공간을 기다릴 최대 시간 (초, 0이면 기다리지 않음, None이면 무한정)
+            poll_interval: 여유 공간 확인 간격 (초)
+
+        Returns:
+            기록한 레코드 수
+
+        Raises:
+            RingBufferFull: 제한 시간 안에 모두 기록하지 못한 경우 (미기록 레코드 포함)
+        """
+        timestamps: List[int] = []
+        metric_ids: List[int] = []
+        values: List[float] = []
+
+        for signal in signals:
+            timestamp = int((signal.get("metadata") or {}).get("timestamp", 0))
+            for metric_key, raw_value in (signal.get("data") or {}).items():
+                if isinstance(raw_value, bool) or not isinstance(raw_value, (int, float, str)):
+                    continue
+                try:
+                    value = float(raw_value)
+                except ValueError:
+                    continue
+                timestamps.append(timestamp)
+                metric_ids.append(self.ring.register_metric(metric_key))
+                values.append(value)
+
+        columns = (
+            np.asarray(timestamps, dtype=np.int64),
+            np.asarray(metric_ids, dtype=np.uint32),
+            np.asarray(values, dtype=np.float64)
+        )
+        total = len(values)
+        written = 0
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            written += self.write(*(column[written:] for column in columns))
+            if written == total:
+                return written
+            if deadline is not None and time.monotonic() >= deadline:
+                raise RingBufferFull(written, tuple(column[written:] for column in columns))
+            time.sleep(poll_interval)
+
+
+class RingBufferConsumer:
+    """링 버퍼 소비자"""
+
+    def __init__(self, ring: SignalRingBuffer):
+        """
+        Args:
+            ring: 읽을 링 버퍼
+        """
+        self.ring = ring
+
+    def peek(self, max_records: Optional[int] = None) -> List[np.ndarray]:
+        """
+        소비되지 않은 레코드를 복사 없이 뷰로 반환합니다.
+
+        링 끝을 넘어가는 경우 최대 두 개의 뷰가 반환됩니다. 뷰는 commit() 이후
+        생산자가 덮어쓸 수 있으므로 commit 전에 처리해야 합니다.
+
+        Args:
+            max_records: 최대 레코드 수 (None이면 전부)
+
+        Returns:
+            레코드 뷰 리스트
+        """
+        ring = self.ring
+        read_seq = ring.read_seq
+        count = ring.write_seq - read_seq
+        if max_records is not None:
+            count = min(count, max_records)
+        if count <= 0:
+            return []
+
+        start = read_seq % ring.capacity
+        first = min(count, ring.capacity - start)
+        views = [ring.records[start:start + first]]
+        if count > first:
+            views.append(ring.records[:count - first])
+        return views
+
+    def commit(self, count: int):
+        """처리한 레코드 수만큼 read_seq를 전진시켜 슬롯을 반환합니다."""
+        ring = self.ring
+        available = ring.write_seq - ring.read_seq
+        if count > available:
+            raise ValueError(f"Cannot commit {count} records, only {available} available")
+        ring._read_seq[0] = ring.read_seq + count
+
+    def read(self, max_records: Optional[int] = None) -> np.ndarray:
+        """
+        레코드를 읽고 즉시 커밋합니다.
+
+        반환값은 링과 독립된 배열이므로 커밋 이후에도 안전하게 사용할 수 있습니다.
+
+        Args:
+            max_records: 최대 레코드 수
+
+        Returns:
+            레코드 배열
+        """
+        views = self.peek(max_records)
+        if not views:
+            return np.empty(0, dtype=SIGNAL_RECORD_DTYPE)
+        batch = np.concatenate(views) if len(views) > 1 else views[0].copy()
+        self.commit(len(batch))
+        return batch
+
+    def group_by_metric(self, records: np.ndarray) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        레코드 배치를 메트릭별 (타임스탬프, 값) 배열로 분할합니다.
+
+        각 메트릭 내부의 도착 순서는 유지되며, 결과 배열은 StatisticalDetector.detect와
+        TimeSeriesAnalyzer.detect_trend에 그대로 전달할 수 있습니다.
+
+        Args:
+            records: 레코드 배열
+
+        Returns:
+            메트릭 이름 → (타임스탬프 배열, 값 배열)
+        """
+        if len(records) == 0:
+            return {}
+
+        metric_ids = records["metric_id"]
+        order = np.argsort(metric_ids, kind="stable")
+        sorted_ids = metric_ids[order]
+        boundaries = np.flatnonzero(np.diff(sorted_ids)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(sorted_ids)]))
+
+        timestamps = records["timestamp"][order]
+        values = records["value"][order]
+
+        grouped = {}
+        for start, end in zip(starts, ends):
+            name = self.ring.metric_name(int(sorted_ids[start]))
+            grouped[name] = (timestamps[start:end], values[start:end])
+        return grouped
+
+
+def benchmark(records: int = 10_000_000, batch_size: int = 65536, capacity: int = 1 << 20,
+              path: Optional[str] = None) -> Dict[str, float]:
+    """
+    단일 호스트에서 생산자/소비자 왕복 처리량을 측정합니다.
+
+    Args:
+        records: 전송할 총 레코드 수
+        batch_size: 배치 크기
+        capacity: 링 버퍼 슬롯 수
+        path: 링 버퍼 파일 경로 (None이면 /dev/shm 또는 임시 디렉터리)
+
+    Returns:
+        처리량 통계
+    """
+    if path is None:
+        base = "/dev/shm" if os.path.isdir("/dev/shm") else os.environ.get("TMPDIR", "/tmp")
+        path = os.path.join(base, f"bridge-signal-ring-{os.getpid()}")
+
+    rng = np.random.default_rng(0)
+    timestamps = np.arange(batch_size, dtype=np.int64)
+    metric_ids = rng.integers(0, 16, size=batch_size).astype(np.uint32)
+    values = rng.normal(size=batch_size)
+
+    ring = SignalRingBuffer.create(path, capacity=capacity)
+    try:
+        for metric_id in range(16):
+            ring.register_metric(f"metric_{metric_id}")
+        producer = RingBufferProducer(ring)
+        consumer = RingBufferConsumer(ring)
+
+        sent = received = 0
+        checksum = 0.0
+        started = time.perf_counter()
+        while received < records:
+            if sent < records:
+                sent += producer.write(timestamps, metric_ids, values[:min(batch_size, records - sent)])
+            for view in consumer.peek(batch_size):
+                checksum += float(view["value"].sum())
+                consumer.commit(len(view))
+                received += len(view)
+        elapsed = time.perf_counter() - started
+    finally:
+        ring.close()
+        os.unlink(path)
+
+    return {
+        "records": received,
+        "elapsed_seconds": elapsed,
+        "records_per_second": received / elapsed if elapsed > 0 else 0.0,
+        "checksum": checksum,
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark())
@@ -0,0 +1,13 @@
+"""
+Signal Transport Package
+"""
+
+from .ring_buffer import (
+    SIGNAL_RECORD_DTYPE,
+    SignalRingBuffer,
+    RingBufferProducer,
+    RingBufferConsumer,
+    RingBufferFull,
+)
+
+__all__ = ['SIGNAL_RECORD_DTYPE', 'SignalRingBuffer', 'RingBufferProducer', 'RingBufferConsumer', 'RingBufferFull']
@@ -0,0 +1,479 @@
+"""
+NDJSON Signal Stream
+
+NDJSON(gzip 포함) 신호 덤프를 제너레이터 파이프라인으로 읽어 메트릭별 청크로 처리합니다.
+전체 입력을 메모리에 올리지 않으며, 버퍼 크기는 청크 크기와 메트릭 수로 제한됩니다.
+청크는 값마다 신호 딕셔너리를 만들지 않고 (ID, 타임스탬프, 값) 열 배열로 라우팅되며,
+신호 딕셔너리는 이슈를 추출할 청크에서만 만듭니다.
+"""
+
+import gzip
+import io
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, IO, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..precision.precision_mode import storage_dtype
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclass
+class StreamStats:
+    """스트림 처리 통계"""
+    lines_read: int = 0
+    signals_parsed: int = 0
+    invalid_lines: int = 0
+    values_routed: int = 0
+    chunks_processed: int = 0
+    issues_extracted: int = 0
+    duplicates_merged: int = 0
+    drafts_generated: int = 0
+    records_written: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed_seconds
+        return {
+            "lines_read": self.lines_read,
+            "signals_parsed": self.signals_parsed,
+            "invalid_lines": self.invalid_lines,
+            "values_routed": self.values_routed,
+            "chunks_processed": self.chunks_processed,
+            "issues_extracted": self.issues_extracted,
+            "duplicates_merged": self.duplicates_merged,
+            "drafts_generated": self.drafts_generated,
+            "records_written": self.records_written,
+            "elapsed_seconds": round(elapsed, 3),
+            "signals_per_second": round(self.signals_parsed / elapsed, 1) if elapsed > 0 else 0.0,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 상주 메모리(MB)를 반환합니다."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    if sys.platform == "darwin":
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+
+def open_signal_source(path: str) -> IO[str]:
+    """
+    신호 덤프를 텍스트 스트림으로 엽니다.
+
+    gzip 여부는 확장자가 아니라 매직 바이트로 판단합니다. "-"는 표준 입력입니다.
+
+    Args:
+        path: 파일 경로 또는 "-"
+
+    Returns:
+        줄 단위로 읽을 수 있는 텍스트 스트림
+    """
+    if path == "-":
+        raw = sys.stdin.buffer
+    else:
+        raw = open(path, "rb")
+
+    buffered = raw if isinstance(raw, io.BufferedReader) else io.BufferedReader(raw)
+    if buffered.peek(2)[:2] == GZIP_MAGIC:
+        buffered = gzip.GzipFile(fileobj=buffered, mode="rb")
+    return io.TextIOWrapper(buffered, encoding="utf-8")
+
+
+def iter_signals(lines: Iterable[str], stats: Optional[StreamStats] = None) -> Iterator[Dict[str, Any]]:
+    """
+    NDJSON 줄을 신호 딕셔너리로 파싱합니다.
+
+    빈 줄은 무시하고, JSON 객체가 아닌 줄은 invalid_lines로 집계한 뒤 건너뜁니다.
+
+    Args:
+        lines: 텍스트 줄 이터러블
+        stats: 갱신할 통계 (선택)
+
+    Yields:
+        신호 딕셔너리
+    """
+    for line in lines:
+        if stats is not None:
+            stats.lines_read += 1
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            signal = json.loads(line)
+        except ValueError:
+            if stats is not None:
+                stats.invalid_lines += 1
+            continue
+        if not isinstance(signal, dict):
+            if stats is not None:
+                stats.invalid_lines += 1
+            continue
+        if stats is not None:
+            stats.signals_parsed += 1
+        yield signal
+
+
+def iter_numeric_values(signal: Dict[str, Any]) -> Iterator[Tuple[str, str, Any, float]]:
+    """
+    신호의 수치형 data 항목을 순회합니다.
+
+    Args:
+        signal: 신호 딕셔너리
+
+    Yields:
+        (메트릭 키, 신호 ID, 타임스탬프, 값)
+    """
+    data = signal.get("data")
+    if not isinstance(data, dict):
+        return
+    signal_id = signal.get("id", "")
+    timestamp = (signal.get("metadata") or {}).get("timestamp", 0)
+
+    for metric_key, raw_value in data.items():
+        value = _numeric_value(raw_value)
+        if value is not None:
+            yield metric_key, signal_id, timestamp, value
+
+
+def _numeric_value(raw_value: Any) -> Optional[float]:
+    """수치형(또는 수치 문자열) data 값을 float로 변환합니다 (bool과 변환 불가 값은 None)."""
+    if type(raw_value) is float:
+        return raw_value
+    if isinstance(raw_value, bool) or not isinstance(raw_value, (int, float, str)):
+        return None
+    try:
+        return float(raw_value)
+    except ValueError:
+        return None
+
+
+def project_signal(metric_key: str, signal_id: str, timestamp: Any, value: float) -> Dict[str, Any]:
+    """메트릭 값 하나를 InferenceMining이 읽을 수 있는 경량 신호로 만듭니다."""
+    return {
+        "id": signal_id,
+        "data": {metric_key: value},
+        "metadata": {"timestamp": timestamp}
+    }
+
+
+def iter_metric_values(signal: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    신호의 수치형 data 항목을 메트릭 하나만 담은 경량 신호로 투영합니다.
+
+    Args:
+        signal: 신호 딕셔너리
+
+    Yields:
+        (메트릭 키, {"id", "data": {메트릭 키: 값}, "metadata": {"timestamp"}})
+    """
+    for metric_key, signal_id, timestamp, value in iter_numeric_values(signal):
+        yield metric_key, project_signal(metric_key, signal_id, timestamp, value)
+
+
+def project_columns(metric_key: str, signal_ids: Sequence[str], timestamps: Sequence[Any],
+                    values: Sequence[float]) -> List[Dict[str, Any]]:
+    """열 단위 값을 project_signal 형식의 경량 신호 리스트로 만듭니다."""
+    return [
+        project_signal(metric_key, signal_id, timestamp, value)
+        for signal_id, timestamp, value in zip(signal_ids, np.asarray(timestamps).tolist(), np.asarray(values).tolist())
+    ]
+
+
+class MetricChunk(NamedTuple):
+    """메트릭 하나의 청크 (열 단위)"""
+    signal_ids: List[str]
+    timestamps: np.ndarray  # 입력 타임스탬프 (정수 에포크는 int64 그대로)
+    values: np.ndarray      # float64
+
+    def to_signals(self, metric_key: str) -> List[Dict[str, Any]]:
+        """project_signal 형식의 경량 신호 리스트 (이슈 추출 시에만 사용)"""
+        return project_columns(metric_key, self.signal_ids, self.timestamps, self.values)
+
+
+def iter_metric_chunks(
+    signals: Iterable[Dict[str, Any]],
+    chunk_size: int = 1000,
+    max_buffered: int = 200000,
+    stats: Optional[StreamStats] = None
+) -> Iterator[Tuple[str, MetricChunk]]:
+    """
+    신호의 수치 값을 메트릭별로 라우팅하여 청크 단위로 내보냅니다.
+
+    값은 메트릭별 (ID, 타임스탬프, 값) 열 버퍼에 추가되므로 원본 신호 전체나 값별 신호
+    딕셔너리를 보관하지 않습니다. 전체 버퍼가 max_buffered를 넘으면 가장 큰 버퍼부터
+    내보내 메모리 상한을 유지합니다.
+
+    Args:
+        signals: 신호 이터러블
+        chunk_size: 메트릭별 청크 크기
+        max_buffered: 모든 메트릭 버퍼에 보관할 최대 값 수
+        stats: 갱신할 통계 (선택)
+
+    Yields:
+        (메트릭 키, MetricChunk)
+    """
+    # 메트릭 키 → [(ID, 타임스탬프, 값)] (값마다 튜플 하나만 추가하고 내보낼 때 열로 전치)
+    buffers: Dict[str, List[Tuple[str, Any, float]]] = {}
+    buffered = 0
+
+    def emit(metric_key: str) -> MetricChunk:
+        signal_ids, timestamps, values = zip(*buffers.pop(metric_key))
+        return MetricChunk(list(signal_ids), np.asarray(timestamps), np.asarray(values, dtype=np.float64))
+
+    for signal in signals:
+        data = signal.get("data")
+        if not isinstance(data, dict):
+            continue
+        signal_id = signal.get("id", "")
+        timestamp = (signal.get("metadata") or {}).get("timestamp", 0)
+        routed = 0
+
+        for metric_key, raw_value in data.items():
+            value = raw_value if type(raw_value) is float else _numeric_value(raw_value)
+            if value is None:
+                continue
+            buffer = buffers.get(metric_key)
+            if buffer is None:
+                buffer = buffers[metric_key] = []
+            buffer.append((signal_id, timestamp, value))
+            routed += 1
+            buffered += 1
+
+            if len(buffer) >= chunk_size:
+                buffered -= len(buffer)
+                yield metric_key, emit(metric_key)
+
+        if stats is not None:
+            stats.values_routed += routed
+
+        while buffered > max_buffered:
+            largest_key = max(buffers, key=lambda key: len(buffers[key]))
+            buffered -= len(buffers[largest_key])
+            yield largest_key, emit(largest_key)
+
+    for metric_key in list(buffers):
+        yield metric_key, emit(metric_key)
+
+
+class MetricHistory:
+    """
+    메트릭 하나의 최근 값 이력 (열 단위 저장)
+
+    신호 ID, 타임스탬프(float64, 밀리초 에포크도 정확히 표현), 값(정밀도 모드 dtype)을
+    각각 배열로 보관하므로 값마다 신호 딕셔너리를 유지하는 것보다 작고, float32 모드에서는
+    값 열이 절반이 됩니다. 최대 capacity개의 최근 값만 유지합니다.
+    """
+
+    def __init__(self, capacity: int, precision: str = "float64"):
+        """
+        Args:
+            capacity: 보관할 최대 값 수
+            precision: 값 열 저장 정밀도 ("float64" 또는 "float32")
+        """
+        self.capacity = capacity
+        self.dtype = storage_dtype(precision)
+        self.signal_ids = np.empty(0, dtype=object)
+        self.timestamps = np.empty(0, dtype=np.float64)
+        self.values = np.empty(0, dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        """열 배열의 바이트 수 (ID 열은 참조 크기만 포함)"""
+        return self.signal_ids.nbytes + self.timestamps.nbytes + self.values.nbytes
+
+    def window(self, signal_ids: Sequence[str], timestamps: Sequence[Any], values: Sequence[float],
+               limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        이력 뒤에 새 값을 이어 붙인 열을 반환합니다 (이력은 바꾸지 않음).
+
+        Args:
+            signal_ids: 새 신호 ID
+            timestamps: 새 타임스탬프
+            values: 새 값
+            limit: 반환할 최대 값 수 (None이면 전체)
+
+        Returns:
+            (신호 ID, 타임스탬프, 값) 배열
+        """
+        columns = (
+            np.concatenate([self.signal_ids, np.asarray(signal_ids, dtype=object)]),
+            np.concatenate([self.timestamps, np.asarray(timestamps, dtype=np.float64)]),
+            np.concatenate([self.values, np.asarray(values, dtype=self.dtype)]),
+        )
+        if limit is not None:
+            columns = tuple(column[-limit:] if limit else column[:0] for column in columns)
+        return columns
+
+    def extend(self, signal_ids: Sequence[str], timestamps: Sequence[Any], values: Sequence[float]):
+        """새 값을 추가하고 최근 capacity개만 남깁니다."""
+        self.signal_ids, self.timestamps, self.values = self.window(
+            signal_ids, timestamps, values, limit=self.capacity
+        )
+
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(신호 ID, 타임스탬프, 값) 배열"""
+        return self.signal_ids, self.timestamps, self.values
+
+
+class StreamingInferencePipeline:
+    """메트릭 청크 단위 증분 추론 파이프라인"""
+
+    def __init__(
+        self,
+        mining,
+        chunk_size: int = 1000,
+        max_buffered: int = 200000,
+        context_size: int = 100,
+        trend_strength_threshold: float = 0.8,
+        generate_drafts: bool = True,
+        max_issues: int = 10000
+    ):
+        """
+        Args:
+            mining: 탐지/트렌드/추출에 사용할 InferenceMining 인스턴스
+            chunk_size: 메트릭별 청크 크기
+            max_buffered: 라우팅 버퍼에 보관할 최대 값 수
+            context_size: 청크 경계를 넘어 이어 붙일 메트릭별 이전 값 수 (mining의 정밀도로 열 단위 저장)
+            trend_strength_threshold: 이슈로 추출할 최소 트렌드 강도 (R²)
+            generate_drafts: 이슈마다 제안 초안을 생성할지 여부
+            max_issues: 중복 병합을 위해 mining 인스턴스에 보관할 최근 이슈 수
+        """
+        self.mining = mining
+        self.chunk_size = chunk_size
+        self.max_buffered = max_buffered
+        self.context_size = context_size
+        self.trend_strength_threshold = trend_strength_threshold
+        self.generate_drafts = generate_drafts
+        self.max_issues = max_issues
+        self.stats = StreamStats()
+        self._emitted: Dict[str, None] = {}
+        self._context: Dict[str, MetricHistory] = {}
+
+    def process_chunk(self, metric_key: str, chunk: MetricChunk) -> Iterator[Dict[str, Any]]:
+        """
+        메트릭 청크 하나에 대해 이상 탐지와 트렌드 분석을 수행하고 출력 레코드를 생성합니다.
+
+        청크의 모든 새 값을 이전 컨텍스트와 함께 평가하므로 청크 중간의 급변도 탐지됩니다.
+        탐지와 트렌드는 열 배열로 계산하고, 신호 딕셔너리는 이슈를 추출할 때만 만듭니다.
+        이미 내보낸 이슈에 병합된 경우에는 "duplicate" 레코드만 생성합니다.
+
+        Args:
+            metric_key: 메트릭 키
+            chunk: 메트릭 청크 (ID, 타임스탬프, 값 열)
+
+        Yields:
+            "issue", "draft" 또는 "duplicate" 타입의 출력 레코드
+        """
+        context = self._context.get(metric_key)
+        if context is None:
+            context = self._context[metric_key] = MetricHistory(self.context_size, self.mining.precision)
+        _, timestamps, values = context.window(*chunk)
+        context.extend(*chunk)
+        self.stats.chunks_processed += 1
+
+        anomaly = self.mining.detect_anomaly_values(values, metric_key, score_last=len(chunk.values), timestamps=timestamps)
+        trend = self.mining.analyze_trend_values(values, timestamps, metric_key)
+
+        is_anomaly = bool(anomaly and anomaly.is_anomaly)
+        is_trending = bool(
+            trend and trend.direction != "stable" and trend.strength >= self.trend_strength_threshold
+        )
+        if not (is_anomaly or is_trending):
+            return
+
+        if is_anomaly:
+            title = f"{metric_key} 이상 감지"
+            description = f"메트릭 {metric_key}에서 통계적 이상치가 감지되었습니다."
+        else:
+            title = f"{metric_key} 트렌드 감지"
+            description = f"메트릭 {metric_key}이(가) 지속적인 {trend.direction} 추세를 보이고 있습니다."
+
+        issue = self.mining.extract_issue(
+            chunk.to_signals(metric_key), title, description, priority="high" if is_anomaly else "medium"
+        )
+        if issue["id"] in self._emitted:
+            self.stats.duplicates_merged += 1
+            yield {
+                "type": "duplicate",
+                "metricKey": metric_key,
+                "issueId": issue["id"],
+                "occurrenceCount": issue.get("occurrenceCount", 1)
+            }
+            return
+        self._emitted[issue["id"]] = None
+        self.stats.issues_extracted += 1
+        yield {"type": "issue", "metricKey": metric_key, "issue": issue}
+
+        if self.generate_drafts:
+            draft = self.mining.generate_proposal_draft(issue)
+            self.stats.drafts_generated += 1
+            yield {"type": "draft", "metricKey": metric_key, "issueId": issue["id"], "draft": draft}
+
+    def run(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        NDJSON 줄 스트림 전체를 처리합니다.
+
+        mining 인스턴스에는 최근 max_issues개의 이슈만 남기고 오래된 이슈는 중복 제거 색인과 함께
+        제거하므로, 최근 이슈에 대한 중복 병합을 유지하면서 메모리 사용량이 일정하게 유지됩니다.
+
+        Args:
+            lines: NDJSON 텍스트 줄 이터러블
+
+        Yields:
+            출력 레코드
+        """
+        signals = iter_signals(lines, self.stats)
+        for metric_key, chunk in iter_metric_chunks(signals, self.chunk_size, self.max_buffered, self.stats):
+            yield from self.process_chunk(metric_key, chunk)
+            self._evict()
+
+    def _evict(self):
+        self.mining.evict_issues(self.max_issues)
+        # 내보낸 이슈 ID도 같은 한도로 유지 (삽입 순서 = 오래된 순)
+        while len(self._emitted) > self.max_issues:
+            del self._emitted[next(iter(self._emitted))]
+
+
+def _json_default(value: Any) -> Any:
+    """NumPy 스칼라를 JSON 직렬화 가능한 값으로 변환합니다."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def write_ndjson(records: Iterable[Dict[str, Any]], output: IO[str], stats: Optional[StreamStats] = None) -> None:
+    """
+    레코드를 NDJSON으로 기록합니다.
+
+    Args:
+        records: 출력 레코드 이터러블
+        output: 텍스트 출력 스트림
+        stats: 갱신할 통계 (선택)
+    """
+    for record in records:
+        output.write(json.dumps(record, ensure_ascii=False, default=_json_default))
+        output.write("\n")
+        if stats is not None:
+            stats.records_written += 1
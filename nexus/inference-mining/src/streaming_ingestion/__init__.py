@@ -0,0 +1,33 @@
+"""
+Streaming Ingestion Package
+"""
+
+from .ndjson_stream import (
+    MetricChunk,
+    MetricHistory,
+    StreamStats,
+    StreamingInferencePipeline,
+    iter_metric_chunks,
+    iter_metric_values,
+    iter_numeric_values,
+    project_signal,
+    project_columns,
+    iter_signals,
+    open_signal_source,
+    write_ndjson,
+)
+
+__all__ = [
+    'MetricChunk',
+    'MetricHistory',
+    'StreamStats',
+    'StreamingInferencePipeline',
+    'iter_metric_chunks',
+    'iter_metric_values',
+    'iter_numeric_values',
+    'project_signal',
+    'project_columns',
+    'iter_signals',
+    'open_signal_source',
+    'write_ndjson',
+]
@@ -0,0 +1,252 @@
+"""
+Streaming Forecasting
+
+EWMA, Holt 선형, 가법 Holt-Winters 예측 모델을 포인트 단위 O(1)로 갱신합니다.
+모든 모델은 여러 시계열을 배열로 보관하므로 한 틱에 수천 개 메트릭을
+NumPy 호출 한 번으로 갱신할 수 있습니다.
+"""
+
+import numpy as np
+from typing import Dict, Any
+from dataclasses import dataclass
+
+
+@dataclass
+class ForecastResult:
+    """예측 결과 (시계열별 배열)"""
+    forecast: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    is_anomaly: np.ndarray
+    method: str
+    details: Dict[str, Any]
+
+
+class BaseForecaster:
+    """스트리밍 예측 모델 공통 로직 (예측 구간 및 이상 판정)"""
+
+    method = "base"
+
+    def __init__(self, n_series: int, interval_z: float = 3.0, variance_alpha: float = 0.1,
+                 warmup: int = 5):
+        """
+        Args:
+            n_series: 동시에 갱신할 시계열 수
+            interval_z: 예측 구간 폭 (잔차 표준편차의 배수)
+            variance_alpha: 잔차 분산 EWMA 평활 계수
+            warmup: 이상 판정을 시작하기 전 필요한 잔차 수
+        """
+        self.n_series = n_series
+        self.interval_z = interval_z
+        self.variance_alpha = variance_alpha
+        self.warmup = warmup
+
+        self.count = np.zeros(n_series, dtype=np.int64)  # 시계열별 관측 수 (결측 제외)
+        self.ticks = 0                                     # 모든 시계열이 공유하는 틱 수 (결측 포함)
+        self.residual_count = np.zeros(n_series, dtype=np.int64)
+        self.residual_var = np.zeros(n_series)
+
+    def _ready(self) -> np.ndarray:
+        """예측이 가능한(초기화가 끝난) 시계열 마스크"""
+        raise NotImplementedError
+
+    def _predict(self, horizon: int) -> np.ndarray:
+        raise NotImplementedError
+
+    def _update_state(self, values: np.ndarray, observed: np.ndarray):
+        raise NotImplementedError
+
+    def update(self, values) -> ForecastResult:
+        """
+        시계열별 새 관측값 하나씩으로 모델을 갱신합니다.
+
+        반환되는 예측과 구간은 이번 관측 이전 상태에서 계산한 1-step 예측이며,
+        관측값이 구간을 벗어나면 이상으로 표시됩니다.
+
+        Args:
+            values: 길이 n_series의 관측값 배열 (NaN은 결측으로 상태를 유지)
+
+        Returns:
+            ForecastResult: 이번 틱의 예측 결과
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != (self.n_series,):
+            raise ValueError(f"Expected {self.n_series} values, got shape {values.shape}")
+
+        observed = ~np.isnan(values)
+        ready = self._ready()
+        prediction = np.where(ready, self._predict(1), np.nan)
+        std = np.sqrt(self.residual_var)
+        lower = prediction - self.interval_z * std
+        upper = prediction + self.interval_z * std
+
+        residual = values - prediction
+        scored = observed & ready
+        is_anomaly = scored & (self.residual_count >= self.warmup) & (np.abs(residual) > self.interval_z * std)
+
+        # 잔차 분산: 초기에는 누적 평균, 이후 EWMA
+        self.residual_count = self.residual_count + scored
+        weight = np.maximum(1.0 / np.maximum(self.residual_count, 1), self.variance_alpha)
+        squared = np.where(scored, residual, 0.0) ** 2
+        self.residual_var = np.where(scored, self.residual_var + weight * (squared - self.residual_var),
+                                     self.residual_var)
+
+        self._update_state(values, observed)
+        self.count = self.count + observed
+        self.ticks += 1
+
+        return ForecastResult(
+            forecast=prediction,
+            lower=lower,
+            upper=upper,
+            is_anomaly=is_anomaly,
+            method=self.method,
+            details={"residual": residual, "residual_std": std}
+        )
+
+    def forecast(self, horizon: int = 1) -> ForecastResult:
+        """
+        현재 상태에서 horizon 스텝 이후를 예측합니다.
+
+        Args:
+            horizon: 예측 스텝 수
+
+        Returns:
+            ForecastResult: 예측 결과 (is_anomaly는 모두 False)
+        """
+        ready = self._ready()
+        prediction = np.where(ready, self._predict(horizon), np.nan)
+        # 랜덤워크 가정으로 구간을 sqrt(h)배 확장
+        width = self.interval_z * np.sqrt(self.residual_var * horizon)
+        return ForecastResult(
+            forecast=prediction,
+            lower=prediction - width,
+            upper=prediction + width,
+            is_anomaly=np.zeros(self.n_series, dtype=bool),
+            method=self.method,
+            details={"horizon": horizon}
+        )
+
+
+class EWMAForecaster(BaseForecaster):
+    """지수 가중 이동 평균 (단순 지수 평활)"""
+
+    method = "ewma"
+
+    def __init__(self, n_series: int, alpha: float = 0.3, **kwargs):
+        """
+        Args:
+            n_series: 시계열 수
+            alpha: 수준 평활 계수 (0-1)
+        """
+        super().__init__(n_series, **kwargs)
+        self.alpha = alpha
+        self.level = np.zeros(n_series)
+
+    def _ready(self) -> np.ndarray:
+        return self.count >= 1
+
+    def _predict(self, horizon: int) -> np.ndarray:
+        return self.level
+
+    def _update_state(self, values: np.ndarray, observed: np.ndarray):
+        first = observed & (self.count == 0)
+        smoothed = self.alpha * values + (1 - self.alpha) * self.level
+        self.level = np.where(first, values, np.where(observed, smoothed, self.level))
+
+
+class HoltForecaster(BaseForecaster):
+    """Holt 선형 추세 모델 (이중 지수 평활)"""
+
+    method = "holt"
+
+    def __init__(self, n_series: int, alpha: float = 0.3, beta: float = 0.1, **kwargs):
+        """
+        Args:
+            n_series: 시계열 수
+            alpha: 수준 평활 계수 (0-1)
+            beta: 추세 평활 계수 (0-1)
+        """
+        super().__init__(n_series, **kwargs)
+        self.alpha = alpha
+        self.beta = beta
+        self.level = np.zeros(n_series)
+        self.trend = np.zeros(n_series)
+
+    def _ready(self) -> np.ndarray:
+        return self.count >= 2
+
+    def _predict(self, horizon: int) -> np.ndarray:
+        return self.level + horizon * self.trend
+
+    def _update_state(self, values: np.ndarray, observed: np.ndarray):
+        first = observed & (self.count == 0)
+        second = observed & (self.count == 1)
+        regular = observed & (self.count >= 2)
+
+        level = self.alpha * values + (1 - self.alpha) * (self.level + self.trend)
+        trend = self.beta * (level - self.level) + (1 - self.beta) * self.trend
+
+        self.trend = np.where(second, values - self.level, np.where(regular, trend, self.trend))
+        self.level = np.where(first | second, values, np.where(regular, level, self.level))
+
+
+class HoltWintersForecaster(BaseForecaster):
+    """가법 Holt-Winters 모델 (수준 + 추세 + 계절성)"""
+
+    method = "holt_winters"
+
+    def __init__(self, n_series: int, season_length: int = 7, alpha: float = 0.3,
+                 beta: float = 0.05, gamma: float = 0.1, **kwargs):
+        """
+        Args:
+            n_series: 시계열 수
+            season_length: 계절 주기 길이 (예: 일 단위 데이터의 주간 주기 = 7)
+            alpha: 수준 평활 계수 (0-1)
+            beta: 추세 평활 계수 (0-1)
+            gamma: 계절성 평활 계수 (0-1)
+        """
+        kwargs.setdefault("warmup", season_length)
+        super().__init__(n_series, **kwargs)
+        self.season_length = season_length
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.level = np.zeros(n_series)
+        self.trend = np.zeros(n_series)
+        self.seasonal = np.zeros((n_series, season_length))
+        # 계절 위치는 관측 수가 아니라 공유 틱 수로 정하므로 결측이 있어도 위상이 밀리지 않음
+        self.seeded = np.zeros((n_series, season_length), dtype=bool)
+        self.initialized = np.zeros(n_series, dtype=bool)
+
+    def _ready(self) -> np.ndarray:
+        return self.initialized
+
+    def _predict(self, horizon: int) -> np.ndarray:
+        season_index = (self.ticks + horizon - 1) % self.season_length
+        return self.level + horizon * self.trend + self.seasonal[:, season_index]
+
+    def _update_state(self, values: np.ndarray, observed: np.ndarray):
+        season_index = self.ticks % self.season_length
+        warming = observed & ~self.initialized
+        regular = observed & self.initialized
+
+        # 초기화 전: 원시값을 계절 슬롯에 저장하고, 모든 슬롯이 채워지면 평균을 수준으로 분리
+        self.seasonal[warming, season_index] = values[warming]
+        self.seeded[warming, season_index] = True
+        completed = warming & self.seeded.all(axis=1)
+        if completed.any():
+            level = self.seasonal[completed].mean(axis=1)
+            self.level[completed] = level
+            self.trend[completed] = 0.0
+            self.seasonal[completed] -= level[:, None]
+            self.initialized = self.initialized | completed
+
+        season = self.seasonal[:, season_index]
+        level = self.alpha * (values - season) + (1 - self.alpha) * (self.level + self.trend)
+        trend = self.beta * (level - self.level) + (1 - self.beta) * self.trend
+        seasonal = self.gamma * (values - level) + (1 - self.gamma) * season
+
+        self.seasonal[regular, season_index] = seasonal[regular]
+        self.trend = np.where(regular, trend, self.trend)
+        self.level = np.where(regular, level, self.level)
@@ -4,11 +4,23 @@ Time Series Analysis
 시계열 데이터를 분석하여 트렌드를 감지합니다.
 """
 
+import threading
+import time
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from ..caching.result_cache import ResultCache, make_key
+from ..precision.precision_mode import storage_dtype
+from .forecasting import (
+    BaseForecaster,
+    EWMAForecaster,
+    ForecastResult,
+    HoltForecaster,
+    HoltWintersForecaster,
+)
+
 
 @dataclass
 class TrendResult:
@@ -23,12 +35,20 @@ class TrendResult:
 class TimeSeriesAnalyzer:
     """시계열 분석기"""
     
-    def __init__(self, min_data_points: int = 3):
+    def __init__(self, min_data_points: int = 3, cache: Optional[ResultCache] = None,
+                 precision: str = "float64"):
         """
         Args:
             min_data_points: 최소 데이터 포인트 수
+            cache: 결과 캐시 (None이면 캐시 사용 안 함)
+            precision: 값/타임스탬프 배열 저장 정밀도 ("float64" 또는 "float32", 회귀 합계는 float64로 누적)
         """
         self.min_data_points = min_data_points
+        self.cache = cache
+        self.precision = precision
+        self.dtype = storage_dtype(precision)
+        self._forecasters: Dict[Tuple[str, str], BaseForecaster] = {}  # (메트릭 키, 방법) → 모델
+        self._forecasters_lock = threading.Lock()
     
     def detect_trend(self, values: List[float], timestamps: Optional[List[float]] = None) -> TrendResult:
         """
@@ -41,6 +61,16 @@ class TimeSeriesAnalyzer:
         Returns:
             TrendResult: 트렌드 분석 결과
         """
+        if self.cache is not None:
+            started = time.perf_counter()
+            key = make_key("trend", values, timestamps, min_data_points=self.min_data_points,
+                           precision=self.precision)
+            return self.cache.get_or_compute(key, lambda: self._detect_trend(values, timestamps),
+                                             key_seconds=time.perf_counter() - started)
+        return self._detect_trend(values, timestamps)
+    
+    def _detect_trend(self, values: List[float], timestamps: Optional[List[float]] = None) -> TrendResult:
+        """선형 회귀 트렌드 계산 (캐시 미적용)"""
         if len(values) < self.min_data_points:
             return TrendResult(
                 direction="stable",
@@ -50,16 +80,24 @@ class TimeSeriesAnalyzer:
                 details={"reason": "Insufficient data points"}
             )
         
-        values_array = np.array(values)
+        values_array = np.asarray(values, dtype=self.dtype)
         
-        # 타임스탬프 생성
+        # 타임스탬프 생성 (밀리초 타임스탬프는 float32로 표현할 수 없으므로 중심화한 뒤 변환)
         if timestamps is None:
-            x = np.arange(len(values))
+            x_raw = np.arange(len(values), dtype=np.float64)
         else:
-            x = np.array(timestamps)
+            x_raw = np.asarray(timestamps, dtype=np.float64)
+        x_mean = x_raw.mean()
+        x = (x_raw - x_mean).astype(self.dtype)
         
-        # 선형 회귀
-        slope, intercept = np.polyfit(x, values_array, 1)
+        # 선형 회귀 (최소제곱 닫힌 형식, 합계는 float64로 누적)
+        y_mean = np.mean(values_array, dtype=np.float64)
+        y_centered = values_array - values_array.dtype.type(y_mean)
+        sxx = np.sum(x * x, dtype=np.float64)
+        sxy = np.sum(x * y_centered, dtype=np.float64)
+        slope = sxy / sxx if sxx > 0 else 0.0
+        # 절편은 원래 타임스탬프 기준으로 환산
+        intercept = y_mean - slope * x_mean
         
         # 트렌드 방향 결정
         if slope > 0.01:
@@ -70,9 +108,9 @@ class TimeSeriesAnalyzer:
             direction = "stable"
         
         # 트렌드 강도 계산 (R² 값 사용)
-        y_pred = slope * x + intercept
-        ss_res = np.sum((values_array - y_pred) ** 2)
-        ss_tot = np.sum((values_array - np.mean(values_array)) ** 2)
+        residuals = y_centered - x * values_array.dtype.type(slope)
+        ss_res = np.sum(residuals * residuals, dtype=np.float64)
+        ss_tot = np.sum(y_centered * y_centered, dtype=np.float64)
         
         if ss_tot == 0:
             r_squared = 0.0
@@ -92,8 +130,8 @@ class TimeSeriesAnalyzer:
                 "slope": float(slope),
                 "intercept": float(intercept),
                 "data_points": len(values),
-                "mean": float(np.mean(values_array)),
-                "std": float(np.std(values_array))
+                "mean": float(y_mean),
+                "std": float(np.std(values_array, dtype=np.float64))
             }
         )
     
@@ -111,12 +149,12 @@ class TimeSeriesAnalyzer:
         if len(values) < window_size * 2:
             return None
         
-        values_array = np.array(values)
+        values_array = np.asarray(values, dtype=self.dtype)
         
         # 각 윈도우의 평균 계산
         window_means = []
         for i in range(len(values) - window_size + 1):
-            window_means.append(np.mean(values_array[i:i+window_size]))
+            window_means.append(np.mean(values_array[i:i+window_size], dtype=np.float64))
         
         # 연속된 윈도우 간 차이 계산
         differences = []
@@ -159,25 +197,107 @@ class TimeSeriesAnalyzer:
         if len(values) < 2:
             return 0.0
         
-        values_array = np.array(values)
+        values_array = np.asarray(values, dtype=self.dtype)
         
         # 변동성 = 표준편차 / 평균 (변동계수)
-        mean = np.mean(values_array)
+        mean = np.mean(values_array, dtype=np.float64)
         if mean == 0:
             return 0.0
         
-        cv = np.std(values_array) / mean
+        cv = np.std(values_array, dtype=np.float64) / mean
         
         # 0-1 범위로 정규화 (임의의 최대값 2.0 사용)
         volatility = min(cv / 2.0, 1.0)
         
         return float(volatility)
-
-
-
-
-
-
-
-
-
+    
+    def create_forecaster(self, method: str = "holt_winters", n_series: int = 1, **params) -> BaseForecaster:
+        """
+        스트리밍 예측 모델을 생성합니다.
+        
+        Args:
+            method: 예측 방법 ("ewma", "holt", "holt_winters")
+            n_series: 동시에 갱신할 시계열 수
+            **params: 모델별 파라미터 (alpha, beta, gamma, season_length, interval_z 등)
+        
+        Returns:
+            예측 모델
+        """
+        if method == "ewma":
+            return EWMAForecaster(n_series, **params)
+        elif method == "holt":
+            return HoltForecaster(n_series, **params)
+        elif method == "holt_winters":
+            return HoltWintersForecaster(n_series, **params)
+        else:
+            raise ValueError(f"Unknown forecasting method: {method}")
+    
+    def forecast(self, values: List[float], method: str = "holt_winters", horizon: int = 1,
+                 metric_key: Optional[str] = None, **params) -> ForecastResult:
+        """
+        시계열 값을 모델에 흘려 넣은 뒤 다음 값을 예측합니다.
+        
+        metric_key를 주면 메트릭별 모델 상태를 보관하므로 values에는 직전 호출 이후의 새 관측값만
+        전달합니다 (호출당 O(새 관측 수)). metric_key가 없으면 매번 새 모델에 values 전체를 학습시킵니다.
+        여러 메트릭을 한 틱에 갱신할 때는 create_forecaster(n_series=...)로 만든 모델의 update를 직접 사용하세요.
+        
+        Args:
+            values: 값들의 리스트 (metric_key가 있으면 새 관측값만)
+            method: 예측 방법 ("ewma", "holt", "holt_winters")
+            horizon: 예측 스텝 수
+            metric_key: 모델 상태를 보관할 메트릭 키 (None이면 상태 없음)
+            **params: 모델별 파라미터 (메트릭의 첫 호출에서만 사용)
+        
+        Returns:
+            ForecastResult: 예측 결과 (details에 이번 values 중 구간을 벗어난 인덱스 포함)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if metric_key is None:
+            return self._run_forecaster(self.create_forecaster(method, n_series=1, **params),
+                                        values, method, horizon)
+        
+        with self._forecasters_lock:
+            forecaster = self._forecasters.get((metric_key, method))
+            if forecaster is None:
+                forecaster = self.create_forecaster(method, n_series=1, **params)
+                self._forecasters[(metric_key, method)] = forecaster
+            return self._run_forecaster(forecaster, values, method, horizon)
+    
+    def reset_forecasts(self, metric_key: Optional[str] = None):
+        """
+        보관 중인 메트릭별 예측 모델을 버립니다.
+        
+        Args:
+            metric_key: 버릴 메트릭 키 (None이면 전부)
+        """
+        with self._forecasters_lock:
+            if metric_key is None:
+                self._forecasters.clear()
+            else:
+                for key in [key for key in self._forecasters if key[0] == metric_key]:
+                    del self._forecasters[key]
+    
+    def _run_forecaster(self, forecaster: BaseForecaster, values: np.ndarray, method: str,
+                        horizon: int) -> ForecastResult:
+        """values를 모델에 갱신한 뒤 horizon 스텝 예측을 반환합니다."""
+        anomaly_indices = []
+        for i, value in enumerate(values):
+            step = forecaster.update(value[None])
+            if step.is_anomaly[0]:
+                anomaly_indices.append(i)
+        
+        result = forecaster.forecast(horizon)
+        return ForecastResult(
+            forecast=result.forecast,
+            lower=result.lower,
+            upper=result.upper,
+            is_anomaly=result.is_anomaly,
+            method=method,
+            details={
+                "horizon": horizon,
+                "data_points": len(values),
+                "observed_points": int(forecaster.count[0]),
+                "anomaly_indices": anomaly_indices,
+                "residual_std": float(np.sqrt(forecaster.residual_var[0]))
+            }
+        )
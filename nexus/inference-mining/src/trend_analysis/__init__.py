@@ -3,8 +3,21 @@ Trend Analysis Package
 """
 
 from .time_series import TimeSeriesAnalyzer, TrendResult
-
-__all__ = ['TimeSeriesAnalyzer', 'TrendResult']
+from .forecasting import (
+    ForecastResult,
+    EWMAForecaster,
+    HoltForecaster,
+    HoltWintersForecaster,
+)
+
+__all__ = [
+    'TimeSeriesAnalyzer',
+    'TrendResult',
+    'ForecastResult',
+    'EWMAForecaster',
+    'HoltForecaster',
+    'HoltWintersForecaster',
+]
 
 
 
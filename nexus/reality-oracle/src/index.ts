@@ -13,4 +13,5 @@ export * from './collectors/telemetry';
 export * from './normalizers/signal-normalizer';
 export * from './attestation/signature-service';
 export * from './attestation/hash-chain';
+export * from './transport/signal-ring-writer';
 
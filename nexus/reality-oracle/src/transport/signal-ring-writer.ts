@@ -0,0 +1,237 @@
+/**
+ * Signal Ring Writer
+ *
+ * Inference Mining의 공유 메모리 링 버퍼(inference-mining/src/signal-transport/ring-buffer.py)에
+ * 신호를 고정 레이아웃 바이너리 레코드로 기록하는 생산자입니다.
+ *
+ * Node.js에는 mmap이 없으므로 파일 디스크립터에 위치 지정 쓰기를 합니다. 같은 파일을
+ * MAP_SHARED로 매핑한 소비자는 페이지 캐시를 공유하므로 기록 즉시 레코드를 봅니다.
+ * 레코드를 모두 기록한 뒤 write_seq를 8바이트 정렬된 단일 쓰기로 게시합니다.
+ */
+
+import * as fs from 'fs';
+import type { Signal } from '../../../shared/types';
+
+const MAGIC = 'BRSR';
+const VERSION = 1;
+const HEADER_SIZE = 256;
+const WRITE_SEQ_OFFSET = 64;
+const READ_SEQ_OFFSET = 128;
+const METRIC_COUNT_OFFSET = 192;
+const DEFAULT_NAME_SIZE = 64;
+
+/** 레코드 크기: timestamp i8 | metric_id u4 | flags u4 | value f8 */
+export const SIGNAL_RECORD_SIZE = 24;
+
+/**
+ * 링 버퍼 생성 옵션
+ */
+export interface SignalRingOptions {
+  /** 레코드 슬롯 수 */
+  capacity: number;
+  /** 메트릭 이름 사전 크기 */
+  maxMetrics?: number;
+  /** 메트릭 이름 최대 바이트 수 */
+  nameSize?: number;
+  /** 기존 파일을 교체할지 여부 (잘라내지 않고 unlink 후 새로 생성) */
+  overwrite?: boolean;
+}
+
+/**
+ * 링 버퍼 생산자
+ */
+export class SignalRingWriter {
+  readonly capacity: number;
+  readonly maxMetrics: number;
+  readonly nameSize: number;
+
+  private fd: number;
+  private recordsOffset: number;
+  private writeSeq: bigint;
+  private metricIds: Map<string, number> = new Map();
+
+  private constructor(fd: number) {
+    this.fd = fd;
+
+    const header = Buffer.alloc(HEADER_SIZE);
+    fs.readSync(fd, header, 0, HEADER_SIZE, 0);
+    if (header.toString('latin1', 0, 4) !== MAGIC) {
+      fs.closeSync(fd);
+      throw new Error('Not a signal ring buffer');
+    }
+    if (header.readUInt32LE(4) !== VERSION || header.readUInt32LE(16) !== SIGNAL_RECORD_SIZE) {
+      fs.closeSync(fd);
+      throw new Error(`Unsupported ring buffer layout (version ${header.readUInt32LE(4)})`);
+    }
+
+    this.capacity = Number(header.readBigUInt64LE(8));
+    this.maxMetrics = header.readUInt32LE(20);
+    this.nameSize = header.readUInt32LE(24);
+    this.recordsOffset = HEADER_SIZE + this.maxMetrics * this.nameSize;
+    this.writeSeq = header.readBigUInt64LE(WRITE_SEQ_OFFSET);
+
+    // 이미 등록된 메트릭 이름 로드
+    const count = header.readUInt32LE(METRIC_COUNT_OFFSET);
+    const names = Buffer.alloc(count * this.nameSize);
+    fs.readSync(fd, names, 0, names.length, HEADER_SIZE);
+    for (let id = 0; id < count; id++) {
+      const slot = names.subarray(id * this.nameSize, (id + 1) * this.nameSize);
+      const end = slot.indexOf(0);
+      this.metricIds.set(slot.toString('utf8', 0, end === -1 ? slot.length : end), id);
+    }
+  }
+
+  /**
+   * 새 링 버퍼 파일을 생성합니다.
+   *
+   * overwrite가 false이면 파일이 이미 있을 때 EEXIST로 실패합니다.
+   */
+  static create(path: string, options: SignalRingOptions): SignalRingWriter {
+    const maxMetrics = options.maxMetrics ?? 1024;
+    const nameSize = options.nameSize ?? DEFAULT_NAME_SIZE;
+    if (!(options.capacity > 0)) {
+      throw new Error('capacity must be positive when creating a ring buffer');
+    }
+
+    if (options.overwrite) {
+      // 매핑 중인 소비자가 SIGBUS를 받지 않도록 잘라내지 않고 unlink
+      fs.rmSync(path, { force: true });
+    }
+    const fd = fs.openSync(path, 'wx+');
+    fs.ftruncateSync(fd, HEADER_SIZE + maxMetrics * nameSize + options.capacity * SIGNAL_RECORD_SIZE);
+
+    const header = Buffer.alloc(32);
+    header.write(MAGIC, 0, 'latin1');
+    header.writeUInt32LE(VERSION, 4);
+    header.writeBigUInt64LE(BigInt(options.capacity), 8);
+    header.writeUInt32LE(SIGNAL_RECORD_SIZE, 16);
+    header.writeUInt32LE(maxMetrics, 20);
+    header.writeUInt32LE(nameSize, 24);
+    fs.writeSync(fd, header, 0, header.length, 0);
+
+    return new SignalRingWriter(fd);
+  }
+
+  /**
+   * 기존 링 버퍼 파일을 엽니다.
+   */
+  static open(path: string): SignalRingWriter {
+    return new SignalRingWriter(fs.openSync(path, 'r+'));
+  }
+
+  /**
+   * 소비되지 않은 레코드 수를 반환합니다.
+   */
+  pending(): number {
+    return Number(this.writeSeq - this.readSeq());
+  }
+
+  /**
+   * 메트릭 이름을 사전에 등록하고 ID를 반환합니다.
+   */
+  registerMetric(name: string): number {
+    const existing = this.metricIds.get(name);
+    if (existing !== undefined) {
+      return existing;
+    }
+
+    const encoded = Buffer.from(name, 'utf8');
+    if (encoded.length > this.nameSize) {
+      throw new Error(`Metric name exceeds ${this.nameSize} bytes: ${name}`);
+    }
+    const id = this.metricIds.size;
+    if (id >= this.maxMetrics) {
+      throw new Error(`Metric dictionary is full (${this.maxMetrics} entries)`);
+    }
+
+    const slot = Buffer.alloc(this.nameSize);
+    encoded.copy(slot);
+    fs.writeSync(this.fd, slot, 0, slot.length, HEADER_SIZE + id * this.nameSize);
+    // 이름을 기록한 뒤에 개수를 게시
+    const count = Buffer.alloc(4);
+    count.writeUInt32LE(id + 1);
+    fs.writeSync(this.fd, count, 0, 4, METRIC_COUNT_OFFSET);
+
+    this.metricIds.set(name, id);
+    return id;
+  }
+
+  /**
+   * 레코드 배치를 기록합니다. 여유 공간이 부족하면 가능한 만큼만 기록합니다.
+   *
+   * @returns 기록한 레코드 수
+   */
+  write(timestamps: ArrayLike<number>, metricIds: ArrayLike<number>, values: ArrayLike<number>): number {
+    const free = this.capacity - Number(this.writeSeq - this.readSeq());
+    const count = Math.min(values.length, free);
+    if (count <= 0) {
+      return 0;
+    }
+
+    const start = Number(this.writeSeq % BigInt(this.capacity));
+    const first = Math.min(count, this.capacity - start);
+    const records = Buffer.alloc(count * SIGNAL_RECORD_SIZE);
+    for (let i = 0; i < count; i++) {
+      const offset = i * SIGNAL_RECORD_SIZE;
+      records.writeBigInt64LE(BigInt(Math.trunc(timestamps[i])), offset);
+      records.writeUInt32LE(metricIds[i], offset + 8);
+      records.writeUInt32LE(0, offset + 12);
+      records.writeDoubleLE(values[i], offset + 16);
+    }
+
+    fs.writeSync(this.fd, records, 0, first * SIGNAL_RECORD_SIZE, this.recordsOffset + start * SIGNAL_RECORD_SIZE);
+    if (count > first) {
+      fs.writeSync(this.fd, records, first * SIGNAL_RECORD_SIZE, (count - first) * SIGNAL_RECORD_SIZE, this.recordsOffset);
+    }
+
+    // 레코드를 모두 기록한 뒤에 write_seq 게시
+    this.writeSeq += BigInt(count);
+    const seq = Buffer.alloc(8);
+    seq.writeBigUInt64LE(this.writeSeq);
+    fs.writeSync(this.fd, seq, 0, 8, WRITE_SEQ_OFFSET);
+    return count;
+  }
+
+  /**
+   * 신호의 수치형 data 항목을 레코드로 변환하여 기록합니다.
+   *
+   * Python 생산자와 같이 boolean은 제외하고 숫자 문자열은 변환합니다.
+   *
+   * @returns 기록한 레코드 수 (링이 가득 차면 신호 개수보다 적을 수 있음)
+   */
+  writeSignals(signals: Signal[]): number {
+    const timestamps: number[] = [];
+    const metricIds: number[] = [];
+    const values: number[] = [];
+
+    for (const signal of signals) {
+      for (const [metricKey, raw] of Object.entries(signal.data)) {
+        if (typeof raw !== 'number' && typeof raw !== 'string') {
+          continue;
+        }
+        const value = typeof raw === 'number' ? raw : Number(raw);
+        if (typeof raw === 'string' && (raw.trim() === '' || Number.isNaN(value))) {
+          continue;
+        }
+        timestamps.push(signal.metadata.timestamp);
+        metricIds.push(this.registerMetric(metricKey));
+        values.push(value);
+      }
+    }
+
+    return this.write(timestamps, metricIds, values);
+  }
+
+  /**
+   * 파일 디스크립터를 닫습니다.
+   */
+  close(): void {
+    fs.closeSync(this.fd);
+  }
+
+  private readSeq(): bigint {
+    const seq = Buffer.alloc(8);
+    fs.readSync(this.fd, seq, 0, 8, READ_SEQ_OFFSET);
+    return seq.readBigUInt64LE(0);
+  }
+}